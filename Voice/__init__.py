@@ -1,6 +1,16 @@
 """Voice package - exports voice interaction components"""
-from .manager import VoiceManager
-from .speech_recognition import SpeechRecognizer
-from .text_to_speech import TextToSpeech
+from typing import TYPE_CHECKING
 
-__all__ = ['VoiceManager', 'SpeechRecognizer', 'TextToSpeech']
+from utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .manager import VoiceManager
+    from .speech_recognition import SpeechRecognizer
+    from .text_to_speech import TextToSpeech
+
+# Export name -> defining module, loaded on first use (utils/lazy.py)
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    'VoiceManager': '.manager',
+    'SpeechRecognizer': '.speech_recognition',
+    'TextToSpeech': '.text_to_speech',
+})
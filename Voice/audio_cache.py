@@ -0,0 +1,171 @@
+"""
+Audio Cache
+Content-addressed cache of synthesized speech
+"""
+import contextlib
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from pydub import AudioSegment
+
+from config.settings import VoiceConfig
+from utils.logger import Logger
+from utils.metrics import Metrics
+
+
+class AudioCache:
+    """
+    Two-level cache for TTS output keyed on text, language and speed
+    
+    Memory holds decoded audio (LRU, no decode cost on hit); disk holds the
+    encoded MP3 so phrases survive restarts without a network call. The
+    disk store keeps at most `audio_cache_max_files` phrases: a hit
+    refreshes the file's mtime and the least recently used are evicted.
+    Disk errors only cost the cache, never the phrase being spoken.
+    """
+    
+    def __init__(self, config: VoiceConfig):
+        """
+        Initialize audio cache
+        
+        Args:
+            config: Voice configuration settings
+        """
+        self.config = config
+        self._memory: "OrderedDict[str, AudioSegment]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk_lock = threading.Lock()
+        self._disk_files = 0
+        
+        if config.audio_cache_dir:
+            os.makedirs(config.audio_cache_dir, exist_ok=True)
+            self._disk_files = sum(
+                1 for name in os.listdir(config.audio_cache_dir) if name.endswith(".mp3")
+            )
+    
+    def key(self, text: str) -> str:
+        """
+        Content address for a phrase
+        
+        Args:
+            text: Phrase text
+            
+        Returns:
+            Hex digest of text, language and speed
+        """
+        material = f"{self.config.tts_language}|{self.config.tts_slow}|{text.strip()}"
+        return hashlib.sha256(material.encode()).hexdigest()
+    
+    def get(self, text: str) -> Optional[AudioSegment]:
+        """
+        Look up decoded audio for a phrase
+        
+        Args:
+            text: Phrase text
+            
+        Returns:
+            Decoded audio, or None on miss
+        """
+        key = self.key(text)
+        
+        with self._lock:
+            audio = self._memory.get(key)
+            if audio is not None:
+                self._memory.move_to_end(key)
+                Metrics.increment("tts_cache_hits_memory")
+                return audio
+        
+        path = self._path(key)
+        if path and os.path.exists(path):
+            try:
+                audio = AudioSegment.from_mp3(path)
+            except Exception as e:
+                Logger.warning(f"Discarding unreadable cached audio: {e}")
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+            else:
+                with contextlib.suppress(OSError):
+                    os.utime(path)  # Recently used: evicted last
+                self._remember(key, audio)
+                Metrics.increment("tts_cache_hits_disk")
+                return audio
+        
+        Metrics.increment("tts_cache_misses")
+        return None
+    
+    def put(self, text: str, mp3_bytes: bytes, audio: AudioSegment):
+        """
+        Store a synthesized phrase
+        
+        Args:
+            text: Phrase text
+            mp3_bytes: Encoded audio as returned by the TTS service
+            audio: Decoded audio
+        """
+        key = self.key(text)
+        self._remember(key, audio)
+        
+        path = self._path(key)
+        if path and not os.path.exists(path):
+            try:
+                self._write(path, mp3_bytes)
+                self._evict_disk()
+            except OSError as e:
+                Logger.warning(f"Could not store cached audio: {e}")
+    
+    def contains(self, text: str) -> bool:
+        """Check if a phrase is cached in memory"""
+        with self._lock:
+            return self.key(text) in self._memory
+    
+    def _remember(self, key: str, audio: AudioSegment):
+        """Insert into the memory LRU"""
+        with self._lock:
+            self._memory[key] = audio
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.config.audio_cache_size:
+                self._memory.popitem(last=False)
+    
+    def _write(self, path: str, mp3_bytes: bytes):
+        """
+        Write-then-rename so a crash never leaves a truncated file; the
+        unique temp file lets two threads store the same phrase at once
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.config.audio_cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(mp3_bytes)
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+    
+    def _evict_disk(self):
+        """Remove the least recently used files beyond audio_cache_max_files"""
+        limit = self.config.audio_cache_max_files
+        with self._disk_lock:
+            self._disk_files += 1
+            if self._disk_files <= limit:
+                return
+            
+            entries = []
+            for entry in os.scandir(self.config.audio_cache_dir):
+                if entry.name.endswith(".mp3"):
+                    with contextlib.suppress(OSError):
+                        entries.append((entry.stat().st_mtime, entry.path))
+            entries.sort()
+            for _, path in entries[:max(len(entries) - limit, 0)]:
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+            self._disk_files = min(len(entries), limit)
+    
+    def _path(self, key: str) -> Optional[str]:
+        """Disk location for a key (None when disk caching is off)"""
+        if not self.config.audio_cache_dir:
+            return None
+        return os.path.join(self.config.audio_cache_dir, f"{key}.mp3")
@@ -3,7 +3,7 @@ Voice Manager
 Combines speech recognition and text-to-speech
 """
 from threading import Event
-from typing import Callable
+from typing import Callable, Iterable, Optional
 
 from config.settings import VoiceConfig
 from .speech_recognition import SpeechRecognizer
@@ -13,21 +13,40 @@ from .text_to_speech import TextToSpeech
 class VoiceManager:
     """Manages all voice interactions (speech recognition + TTS)"""
     
-    def __init__(self, config: VoiceConfig):
+    def __init__(self, config: VoiceConfig, defer_calibration: bool = False):
         """
         Initialize voice manager
         
         Args:
             config: Voice configuration settings
+            defer_calibration: Leave microphone calibration to calibrate()
+                instead of blocking here
         """
         self.config = config
-        self.speech_recognizer = SpeechRecognizer(config)
         self.tts = TextToSpeech(config)
+        self.speech_recognizer = SpeechRecognizer(
+            config,
+            is_playback_active=self.tts.is_currently_speaking,
+            defer_calibration=defer_calibration
+        )
+    
+    def calibrate(self, after_playback: bool = False):
+        """
+        Calibrate the microphone for ambient noise (blocking; no-op if done)
+        
+        Args:
+            after_playback: First wait for queued speech to finish, so the
+                agent's own voice is not measured as room noise
+        """
+        if after_playback:
+            self.tts.wait_until_finished()
+        self.speech_recognizer.calibrate()
     
     def listen_streaming(
         self, 
         callback: Callable[[str], None], 
-        stop_event: Event
+        stop_event: Event,
+        partial_callback: Optional[Callable[[str], None]] = None
     ):
         """
         Start continuous speech recognition
@@ -35,22 +54,55 @@ class VoiceManager:
         Args:
             callback: Function to call with recognized text
             stop_event: Event to signal when to stop
+            partial_callback: Function to call with partial transcripts
         """
-        self.speech_recognizer.listen_streaming(callback, stop_event)
+        self.speech_recognizer.listen_streaming(callback, stop_event, partial_callback)
     
     def speak(self, text: str):
         """
         Speak text using TTS
+        Queued behind any speech already in progress
         
         Args:
             text: Text to speak
         """
         self.tts.speak(text)
     
+    def replay(self) -> bool:
+        """
+        Play the previous reply again from memory (no synthesis)
+        
+        Returns:
+            False if there was nothing to replay
+        """
+        return self.tts.replay()
+    
+    def warm_up(self, phrases: Iterable[str]):
+        """
+        Pre-render fixed phrases into the TTS audio cache
+        
+        Args:
+            phrases: Phrases to render in the background
+        """
+        self.tts.warm_up(phrases)
+    
+    def begin_turn(self):
+        """Mark the start of a turn for time-to-first-audio tracking"""
+        self.tts.begin_turn()
+    
     def interrupt(self):
         """Interrupt current speech (barge-in)"""
         self.tts.interrupt()
     
+    def wait_until_finished(self, timeout: Optional[float] = None):
+        """
+        Block until all queued speech has played
+        
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        self.tts.wait_until_finished(timeout)
+    
     def is_speaking(self) -> bool:
         """
         Check if currently speaking
@@ -59,3 +111,7 @@ class VoiceManager:
             True if speech is being played
         """
         return self.tts.is_currently_speaking()
+    
+    def close(self):
+        """Release the audio output stream"""
+        self.tts.close()
@@ -0,0 +1,304 @@
+"""
+Audio Playback Engine
+Single persistent output stream fed from a ring buffer of PCM blocks
+"""
+import threading
+import time
+import wave
+from collections import deque
+from typing import Callable, Deque, Optional
+
+from pydub import AudioSegment
+
+from config.settings import VoiceConfig
+from utils.logger import Logger
+from utils.metrics import Metrics
+
+
+class AudioSink:
+    """Output device interface: receives raw 16-bit mono PCM blocks"""
+    
+    def open(self, sample_rate: int):
+        """Open the output (called once)"""
+    
+    def write(self, frames: bytes):
+        """Write one block; may block until the device accepts it"""
+    
+    def output_latency(self) -> float:
+        """Seconds between write() returning and the audio being heard"""
+        return 0.0
+    
+    def close(self):
+        """Close the output"""
+
+
+class PyAudioSink(AudioSink):
+    """Speaker output through one long-lived PyAudio stream"""
+    
+    def __init__(self, block_frames: int):
+        """
+        Args:
+            block_frames: Frames per device buffer
+        """
+        self.block_frames = block_frames
+        self._pyaudio = None
+        self._stream = None
+    
+    def open(self, sample_rate: int):
+        import pyaudio
+        
+        self._pyaudio = pyaudio.PyAudio()
+        self._stream = self._pyaudio.open(
+            format=pyaudio.paInt16,
+            channels=1,
+            rate=sample_rate,
+            output=True,
+            frames_per_buffer=self.block_frames
+        )
+    
+    def write(self, frames: bytes):
+        self._stream.write(frames)
+    
+    def output_latency(self) -> float:
+        return self._stream.get_output_latency() if self._stream else 0.0
+    
+    def close(self):
+        if self._stream is not None:
+            self._stream.stop_stream()
+            self._stream.close()
+        if self._pyaudio is not None:
+            self._pyaudio.terminate()
+
+
+class NullSink(AudioSink):
+    """Headless sink that discards audio, optionally at real-time pace"""
+    
+    def __init__(self, realtime: bool = True):
+        """
+        Args:
+            realtime: Sleep for each block's duration like a real device
+        """
+        self.realtime = realtime
+        self.sample_rate = 0
+        self.frames_written = 0
+    
+    def open(self, sample_rate: int):
+        self.sample_rate = sample_rate
+    
+    def write(self, frames: bytes):
+        self.frames_written += len(frames) // 2
+        if self.realtime:
+            time.sleep(len(frames) / 2 / self.sample_rate)
+
+
+class FileSink(NullSink):
+    """Headless sink that records everything played to a WAV file"""
+    
+    def __init__(self, path: str, realtime: bool = False):
+        """
+        Args:
+            path: Output WAV path
+            realtime: Sleep for each block's duration like a real device
+        """
+        super().__init__(realtime)
+        self.path = path
+        self._wav: Optional[wave.Wave_write] = None
+    
+    def open(self, sample_rate: int):
+        super().open(sample_rate)
+        self._wav = wave.open(self.path, "wb")
+        self._wav.setnchannels(1)
+        self._wav.setsampwidth(2)
+        self._wav.setframerate(sample_rate)
+    
+    def write(self, frames: bytes):
+        self._wav.writeframes(frames)
+        super().write(frames)
+    
+    def close(self):
+        if self._wav is not None:
+            self._wav.close()
+
+
+def create_sink(config: VoiceConfig) -> AudioSink:
+    """
+    Build the sink selected by VoiceConfig.playback_sink
+    
+    Args:
+        config: Voice configuration settings
+        
+    Returns:
+        Audio sink ("pyaudio", "null" or "file")
+    """
+    block_frames = config.playback_sample_rate * config.playback_block_ms // 1000
+    
+    if config.playback_sink == "pyaudio":
+        return PyAudioSink(block_frames)
+    if config.playback_sink == "null":
+        return NullSink()
+    if config.playback_sink == "file":
+        return FileSink(config.playback_file or "playback.wav")
+    raise ValueError(f"Unknown playback sink: {config.playback_sink}")
+
+
+class PlaybackEngine:
+    """
+    Keeps one output stream open and plays PCM blocks from a ring buffer
+    
+    Audio is enqueued with a generation tag; flush(generation) drops every
+    buffered block from older generations so barge-in silences playback
+    within one block instead of one pydub chunk.
+    """
+    
+    def __init__(self, config: VoiceConfig, sink: Optional[AudioSink] = None):
+        """
+        Initialize playback engine
+        
+        Args:
+            config: Voice configuration settings
+            sink: Output sink (defaults to VoiceConfig.playback_sink)
+        """
+        self.config = config
+        self.sink = sink or create_sink(config)
+        self.sample_rate = config.playback_sample_rate
+        self.block_bytes = self.sample_rate * config.playback_block_ms // 1000 * 2
+        self.capacity = max(1, int(config.playback_buffer_seconds * 1000 / config.playback_block_ms))
+        
+        # Ring buffer of (generation, kind, payload): kind is "audio" (PCM
+        # bytes), "start" or "done" (callbacks run when the writer reaches them)
+        self._buffer: Deque[tuple] = deque()
+        self._blocks_buffered = 0
+        self._generation = 0
+        self._condition = threading.Condition()
+        
+        self._writing = False
+        self._flush_requested_at: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        """Open the sink and start the writer thread (idempotent)"""
+        if self._thread is not None:
+            return
+        self.sink.open(self.sample_rate)
+        self._thread = threading.Thread(target=self._writer, daemon=True, name="PlaybackThread")
+        self._thread.start()
+    
+    def enqueue(
+        self,
+        audio: AudioSegment,
+        generation: int,
+        on_start: Optional[Callable[[], None]] = None,
+        on_done: Optional[Callable[[], None]] = None
+    ):
+        """
+        Append audio to the ring buffer, waiting while the buffer is full
+        
+        Args:
+            audio: Decoded audio to play
+            generation: Tag compared against flush(); stale audio is dropped
+            on_start: Called from the writer when the first block plays
+            on_done: Called when the audio finished or was flushed
+        """
+        self.start()
+        pcm = (
+            audio.set_frame_rate(self.sample_rate)
+            .set_channels(1)
+            .set_sample_width(2)
+            .raw_data
+        )
+        
+        with self._condition:
+            if on_start is not None and generation >= self._generation:
+                self._buffer.append((generation, "start", on_start))
+            
+            for offset in range(0, len(pcm), self.block_bytes):
+                while self._blocks_buffered >= self.capacity and generation >= self._generation:
+                    self._condition.wait()
+                if generation < self._generation:
+                    break
+                self._buffer.append((generation, "audio", pcm[offset:offset + self.block_bytes]))
+                self._blocks_buffered += 1
+                self._condition.notify_all()
+            
+            stale = generation < self._generation
+            if on_done is not None and not stale:
+                self._buffer.append((generation, "done", on_done))
+            self._condition.notify_all()
+        
+        if on_done is not None and stale:
+            self._run_callback(on_done)
+    
+    def flush(self, generation: int):
+        """
+        Drop all buffered audio older than generation (barge-in)
+        
+        Args:
+            generation: New current generation
+        """
+        requested_at = time.perf_counter()
+        callbacks = []
+        
+        with self._condition:
+            self._generation = generation
+            kept: Deque[tuple] = deque()
+            for item in self._buffer:
+                if item[0] >= generation:
+                    kept.append(item)
+                elif item[1] == "done":
+                    callbacks.append(item[2])
+            self._buffer = kept
+            self._blocks_buffered = sum(1 for item in kept if item[1] == "audio")
+            
+            if self._writing:
+                # Writer records latency once its in-flight block is done
+                self._flush_requested_at = requested_at
+            else:
+                Metrics.record("interrupt_to_silence", time.perf_counter() - requested_at)
+            self._condition.notify_all()
+        
+        # on_done of dropped audio still runs, outside the lock
+        for callback in callbacks:
+            self._run_callback(callback)
+    
+    def _writer(self):
+        """Feed the sink one block at a time from the ring buffer"""
+        while True:
+            with self._condition:
+                while not self._buffer:
+                    self._condition.wait()
+                _, kind, payload = self._buffer.popleft()
+                
+                if kind == "audio":
+                    self._blocks_buffered -= 1
+                    self._writing = True
+                self._condition.notify_all()
+            
+            if kind != "audio":
+                self._run_callback(payload)
+                continue
+            
+            try:
+                self.sink.write(payload)
+            except Exception as e:
+                Logger.error(f"Error in speech playback: {e}")
+            
+            with self._condition:
+                self._writing = False
+                if self._flush_requested_at is not None:
+                    Metrics.record(
+                        "interrupt_to_silence",
+                        time.perf_counter() - self._flush_requested_at + self.sink.output_latency()
+                    )
+                    self._flush_requested_at = None
+    
+    @staticmethod
+    def _run_callback(callback: Callable[[], None]):
+        """Run a marker callback without letting it kill the writer"""
+        try:
+            callback()
+        except Exception as e:
+            Logger.error(f"Error in playback callback: {e}")
+    
+    def close(self):
+        """Close the output sink"""
+        self.sink.close()
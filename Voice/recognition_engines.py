@@ -0,0 +1,266 @@
+"""
+Speech Recognition Engines
+Builds the transcription engine selected by VoiceConfig.recognition_engine
+"""
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+import speech_recognition as sr
+
+from config.settings import VoiceConfig
+
+
+class RecognitionStream:
+    """Incremental transcription of one utterance"""
+    
+    def accept(self, pcm: bytes) -> Optional[str]:
+        """
+        Feed more 16-bit mono PCM
+        
+        Args:
+            pcm: Next chunk of the utterance
+            
+        Returns:
+            Updated partial transcript, or None if unchanged
+        """
+        return None
+    
+    def finish(self) -> str:
+        """
+        End the utterance
+        
+        Returns:
+            Final transcript (may be empty)
+        """
+        return ""
+
+
+class _BufferedStream(RecognitionStream):
+    """Collects an utterance and transcribes it once, at end of speech"""
+    
+    def __init__(self, engine: "RecognitionEngine", sample_rate: int):
+        self.engine = engine
+        self.sample_rate = sample_rate
+        self._chunks: List[bytes] = []
+    
+    def accept(self, pcm: bytes) -> Optional[str]:
+        self._chunks.append(pcm)
+        return None
+    
+    def finish(self) -> str:
+        audio = sr.AudioData(b"".join(self._chunks), self.sample_rate, 2)
+        try:
+            return self.engine.transcribe(audio)
+        except sr.UnknownValueError:
+            return ""
+
+
+class RecognitionEngine(ABC):
+    """
+    Speech-to-text engine interface
+    
+    Engines must implement transcribe(). Streaming engines also override
+    open_stream() to report partial transcripts; the default stream
+    buffers the utterance and calls transcribe() once at end of speech.
+    """
+    
+    # True if open_stream() returns partial transcripts during speech
+    supports_streaming = False
+    
+    @abstractmethod
+    def transcribe(self, audio: sr.AudioData) -> str:
+        """
+        Transcribe a complete phrase
+        
+        Args:
+            audio: Captured phrase
+            
+        Returns:
+            Transcript
+            
+        Raises:
+            sr.UnknownValueError: If nothing intelligible was said
+            sr.RequestError: If the engine failed
+        """
+    
+    def open_stream(self, sample_rate: int) -> RecognitionStream:
+        """
+        Start incremental transcription of one utterance
+        
+        Args:
+            sample_rate: Sample rate of the PCM that will be fed
+            
+        Returns:
+            Recognition stream (by default, one without partials that
+            transcribes the whole utterance when it finishes)
+        """
+        return _BufferedStream(self, sample_rate)
+
+
+class GoogleEngine(RecognitionEngine):
+    """Google Web Speech API (network round-trip per phrase, no partials)"""
+    
+    def __init__(self, recognizer: sr.Recognizer):
+        """
+        Args:
+            recognizer: Shared speech_recognition recognizer
+        """
+        self.recognizer = recognizer
+    
+    def transcribe(self, audio: sr.AudioData) -> str:
+        return self.recognizer.recognize_google(audio)
+
+
+class _VoskStream(RecognitionStream):
+    """Streaming Kaldi recognizer for one utterance"""
+    
+    def __init__(self, recognizer):
+        self.recognizer = recognizer
+        self._committed = ""
+        self._last = ""
+    
+    def accept(self, pcm: bytes) -> Optional[str]:
+        if self.recognizer.AcceptWaveform(pcm):
+            # Vosk finalized a segment mid-utterance; keep it
+            text = json.loads(self.recognizer.Result()).get("text", "")
+            self._committed = f"{self._committed} {text}".strip()
+            current = self._committed
+        else:
+            partial = json.loads(self.recognizer.PartialResult()).get("partial", "")
+            current = f"{self._committed} {partial}".strip()
+        
+        if not current or current == self._last:
+            return None
+        self._last = current
+        return current
+    
+    def finish(self) -> str:
+        text = json.loads(self.recognizer.FinalResult()).get("text", "")
+        return f"{self._committed} {text}".strip()
+
+
+class VoskEngine(RecognitionEngine):
+    """Offline Vosk (Kaldi) recognizer running on CPU"""
+    
+    supports_streaming = True
+    
+    def __init__(self, model_path: str):
+        """
+        Args:
+            model_path: Directory of a Vosk model
+        """
+        try:
+            import vosk
+        except ImportError as e:
+            raise ImportError("Offline recognition requires the 'vosk' package") from e
+        
+        vosk.SetLogLevel(-1)
+        self._vosk = vosk
+        self.model = vosk.Model(model_path)
+    
+    def open_stream(self, sample_rate: int) -> RecognitionStream:
+        return _VoskStream(self._vosk.KaldiRecognizer(self.model, sample_rate))
+    
+    def transcribe(self, audio: sr.AudioData) -> str:
+        stream = self.open_stream(audio.sample_rate)
+        stream.accept(audio.get_raw_data(convert_width=2))
+        text = stream.finish()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+
+class _TranscriptStream(RecognitionStream):
+    """Reveals a known transcript at a fixed speaking rate"""
+    
+    def __init__(self, engine: "TranscriptEngine", sample_rate: int):
+        self.engine = engine
+        self.sample_rate = sample_rate
+        self.seconds = 0.0
+        self.words = engine.next_utterance().split()
+        self._revealed = 0
+    
+    def accept(self, pcm: bytes) -> Optional[str]:
+        self.seconds += len(pcm) / 2 / self.sample_rate
+        revealed = min(len(self.words), int(self.seconds * self.engine.words_per_second))
+        if revealed == self._revealed:
+            return None
+        self._revealed = revealed
+        return " ".join(self.words[:revealed])
+    
+    def finish(self) -> str:
+        return " ".join(self.words)
+
+
+class TranscriptEngine(RecognitionEngine):
+    """
+    Test engine that replays a reference transcript, one line per utterance
+    
+    Paired with a WAV input file it exercises capture, VAD, endpointing and
+    partials without a microphone, network or model.
+    """
+    
+    supports_streaming = True
+    
+    def __init__(self, transcript_path: str, words_per_second: float = 2.5):
+        """
+        Args:
+            transcript_path: Text file with one utterance per line
+            words_per_second: Rate at which partial words are revealed
+        """
+        with open(transcript_path, encoding="utf-8") as f:
+            self.lines: List[str] = [line.strip() for line in f if line.strip()]
+        self.words_per_second = words_per_second
+        self._index = 0
+    
+    def next_utterance(self) -> str:
+        """Next reference line ("" once the transcript is exhausted)"""
+        if self._index >= len(self.lines):
+            return ""
+        line = self.lines[self._index]
+        self._index += 1
+        return line
+    
+    def open_stream(self, sample_rate: int) -> RecognitionStream:
+        return _TranscriptStream(self, sample_rate)
+    
+    def transcribe(self, audio: sr.AudioData) -> str:
+        text = self.next_utterance()
+        if not text:
+            raise sr.UnknownValueError()
+        return text
+
+
+def create_recognition_engine(config: VoiceConfig, recognizer: sr.Recognizer) -> RecognitionEngine:
+    """
+    Create the speech-to-text engine for the configured backend
+    
+    Args:
+        config: Voice configuration settings
+        recognizer: Shared speech_recognition recognizer
+        
+    Returns:
+        Recognition engine
+        
+    Raises:
+        ValueError: If the engine name is unknown or misconfigured
+    """
+    if config.recognition_engine == "google":
+        return GoogleEngine(recognizer)
+    
+    if config.recognition_engine == "vosk":
+        if not config.recognition_model_path:
+            raise ValueError("recognition_model_path is required for the vosk engine")
+        return VoskEngine(config.recognition_model_path)
+    
+    if config.recognition_engine == "transcript":
+        path = config.recognition_transcript
+        if path is None and config.recognition_input_file:
+            path = os.path.splitext(config.recognition_input_file)[0] + ".txt"
+        if path is None:
+            raise ValueError("recognition_transcript is required for the transcript engine")
+        return TranscriptEngine(path)
+    
+    raise ValueError(f"Unknown recognition engine: {config.recognition_engine}")
@@ -2,43 +2,124 @@
 Speech Recognition Module
 Handles speech-to-text conversion
 """
+import time
+from collections import deque
 import speech_recognition as sr
 from typing import Callable, Optional
 from threading import Event
 
 from config.settings import VoiceConfig
+from utils.logger import Logger
+from utils.metrics import Metrics
+from utils.tracing import Tracer
+from .recognition_engines import RecognitionStream, create_recognition_engine
+from .vad import VoiceActivityDetector
 
 
 class SpeechRecognizer:
-    """Handles speech recognition with Google Speech API"""
+    """Handles speech recognition with a pluggable engine (Google by default)"""
     
-    def __init__(self, config: VoiceConfig):
+    # Noise floor quantile when calibrating while the agent is speaking:
+    # only the gaps between its words reflect the room. Experimental: not
+    # yet checked against real microphones (AgentConfig.calibrate_during_greeting)
+    PLAYBACK_CALIBRATION_QUANTILE = 0.1
+    
+    def __init__(
+        self,
+        config: VoiceConfig,
+        is_playback_active: Optional[Callable[[], bool]] = None,
+        defer_calibration: bool = False
+    ):
         """
         Initialize speech recognizer
         
         Args:
             config: Voice configuration settings
+            is_playback_active: Returns True while the agent is speaking;
+                the VAD then applies the stricter barge-in ratio
+            defer_calibration: Skip the blocking ambient-noise calibration
+                here; call calibrate() later (listening also runs it)
         """
         self.config = config
         self.recognizer = sr.Recognizer()
-        self.microphone = sr.Microphone()
+        self.engine = create_recognition_engine(config, self.recognizer)
+        self.is_playback_active = is_playback_active or (lambda: False)
+        
+        # Audio comes from the microphone, or from a WAV file for tests
+        if config.recognition_input_file:
+            self.microphone = sr.AudioFile(config.recognition_input_file)
+            with self.microphone as source:
+                sample_rate = source.SAMPLE_RATE
+        else:
+            self.microphone = sr.Microphone()
+            sample_rate = self.microphone.SAMPLE_RATE
+        
+        self.vad = VoiceActivityDetector(config, sample_rate)
+        self._calibrated = bool(config.recognition_input_file)
         
-        self._calibrate()
+        if not defer_calibration:
+            self.calibrate()
     
-    def _calibrate(self):
-        """Calibrate microphone for ambient noise"""
-        print("🎙️  Calibrating microphone for ambient noise...")
+    def calibrate(self):
+        """Seed the VAD noise floor and capture threshold from ambient noise (once)"""
+        if self._calibrated:
+            return
+        self._calibrated = True
+        
+        Logger.info("Calibrating microphone for ambient noise...")
+        during_playback = self.is_playback_active()
+        started = time.perf_counter()
         with self.microphone as source:
-            self.recognizer.adjust_for_ambient_noise(
-                source, 
-                duration=self.config.ambient_noise_duration
+            chunks = int(
+                self.config.ambient_noise_duration * source.SAMPLE_RATE / source.CHUNK
+            )
+            ambient = b"".join(
+                source.stream.read(source.CHUNK) for _ in range(max(1, chunks))
             )
-        print("✅ Calibration complete.")
+        
+        pcm = sr.AudioData(ambient, source.SAMPLE_RATE, source.SAMPLE_WIDTH).get_raw_data(
+            convert_width=2
+        )
+        during_playback = during_playback or self.is_playback_active()
+        self.vad.calibrate(
+            pcm,
+            self.PLAYBACK_CALIBRATION_QUANTILE if during_playback else 0.5
+        )
+        self.recognizer.energy_threshold = self.vad.energy_threshold
+        Tracer.record("mic_calibration", started, time.perf_counter())
+        Logger.success("Calibration complete.")
+    
+    def _is_speech(self, audio: sr.AudioData) -> bool:
+        """
+        Run the VAD over a captured phrase before it is sent for recognition
+        
+        Args:
+            audio: Captured phrase
+            
+        Returns:
+            True if the phrase should be recognized
+        """
+        if not self.config.vad_enabled:
+            return True
+        
+        if self.vad.contains_speech(audio.get_raw_data(convert_width=2), self._vad_ratio()):
+            Metrics.increment("vad_segments_passed")
+            return True
+        
+        Metrics.increment("vad_segments_dropped")
+        return False
+    
+    def _vad_ratio(self) -> float:
+        """Energy ratio for the VAD: stricter while the agent is speaking"""
+        if self.is_playback_active():
+            return self.config.vad_barge_in_ratio
+        return self.config.vad_energy_ratio
     
     def listen_streaming(
         self, 
         callback: Callable[[str], None], 
-        stop_event: Event
+        stop_event: Event,
+        partial_callback: Optional[Callable[[str], None]] = None
     ):
         """
         Continuously listen for speech and call callback with transcribed text
@@ -46,43 +127,160 @@ class SpeechRecognizer:
         Args:
             callback: Function to call with transcribed text
             stop_event: Event to signal when to stop listening
+            partial_callback: Function to call with partial transcripts while
+                the user is still speaking (streaming engines only)
         """
+        self.calibrate()
+        
         with self.microphone as source:
-            print("\n🎤 Listening... (speak naturally)")
+            Logger.info("Listening... (speak naturally)")
             
-            while not stop_event.is_set():
-                try:
-                    # Listen for audio with timeout
-                    audio = self.recognizer.listen(
-                        source,
-                        timeout=self.config.recognition_timeout,
-                        phrase_time_limit=self.config.phrase_time_limit
-                    )
-                    
-                    # Transcribe using Google Speech Recognition
-                    text = self.recognizer.recognize_google(audio)
-                    
-                    if text.strip():
-                        callback(text)
+            if self.engine.supports_streaming and self.config.partial_results:
+                self._listen_incremental(source, callback, partial_callback, stop_event)
+            else:
+                self._listen_phrases(source, callback, stop_event)
+    
+    def _listen_phrases(
+        self,
+        source: sr.AudioSource,
+        callback: Callable[[str], None],
+        stop_event: Event
+    ):
+        """Capture whole phrases and transcribe each after it ends"""
+        while not stop_event.is_set():
+            try:
+                # Listen for audio with timeout
+                audio = self.recognizer.listen(
+                    source,
+                    timeout=self.config.recognition_timeout,
+                    phrase_time_limit=self.config.phrase_time_limit
+                )
                 
-                except sr.WaitTimeoutError:
-                    # No speech detected, continue listening
-                    continue
+                # WAV input exhausted
+                if not audio.frame_data:
+                    break
                 
-                except sr.UnknownValueError:
-                    # Speech was unintelligible
-                    print("⚠️  Could not understand audio, please repeat")
+                # Drop coughs, background noise and TTS echo locally
+                if not self._is_speech(audio):
                     continue
                 
-                except sr.RequestError as e:
-                    # API error
-                    print(f"❌ Speech recognition error: {e}")
-                    continue
+                # Recognition precedes the turn this utterance starts
+                with Tracer.span("speech_recognition", next_turn=True):
+                    text = self.engine.transcribe(audio)
                 
-                except Exception as e:
-                    # Unexpected error
-                    print(f"❌ Unexpected error in speech recognition: {e}")
-                    continue
+                if text.strip():
+                    callback(text)
+            
+            except sr.WaitTimeoutError:
+                # No speech detected, continue listening
+                continue
+            
+            except sr.UnknownValueError:
+                # Speech was unintelligible
+                Logger.warning("Could not understand audio, please repeat")
+                continue
+            
+            except sr.RequestError as e:
+                # API error
+                Logger.error(f"Speech recognition error: {e}")
+                continue
+            
+            except Exception as e:
+                # Unexpected error
+                Logger.error(f"Unexpected error in speech recognition: {e}")
+                continue
+    
+    def _listen_incremental(
+        self,
+        source: sr.AudioSource,
+        callback: Callable[[str], None],
+        partial_callback: Optional[Callable[[str], None]],
+        stop_event: Event
+    ):
+        """
+        Feed VAD frames straight into a streaming engine
+        Partial transcripts are emitted while the user speaks; the utterance
+        ends after pause_threshold seconds of non-speech
+        """
+        frame_samples = self.vad.frame_samples
+        frame_seconds = frame_samples / source.SAMPLE_RATE
+        pacing = frame_seconds if self.config.recognition_input_file and self.config.recognition_realtime else 0.0
+        
+        # Audio just before speech onset, so the first syllable is not clipped
+        preroll = deque(maxlen=max(1, int(0.3 / frame_seconds)))
+        utterance: Optional[RecognitionStream] = None
+        speech_frames = silent_frames = total_frames = 0
+        
+        while not stop_event.is_set():
+            chunk = source.stream.read(frame_samples)
+            if not chunk:
+                break  # WAV input exhausted
+            if pacing:
+                time.sleep(pacing)
+            
+            pcm = sr.AudioData(chunk, source.SAMPLE_RATE, source.SAMPLE_WIDTH).get_raw_data(
+                convert_width=2
+            )
+            is_speech = self.vad.is_speech_frame(pcm, self._vad_ratio())
+            
+            try:
+                if utterance is None:
+                    preroll.append(pcm)
+                    if not is_speech:
+                        continue
+                    
+                    utterance = self.engine.open_stream(source.SAMPLE_RATE)
+                    speech_frames, silent_frames, total_frames = 1, 0, len(preroll)
+                    pending = list(preroll)
+                    preroll.clear()
+                else:
+                    total_frames += 1
+                    if is_speech:
+                        speech_frames += 1
+                        silent_frames = 0
+                    else:
+                        silent_frames += 1
+                    pending = [pcm]
+                
+                for block in pending:
+                    partial = utterance.accept(block)
+                    if partial and partial_callback is not None:
+                        Metrics.increment("partial_transcripts")
+                        partial_callback(partial)
+                
+                ended = (
+                    silent_frames * frame_seconds >= self.recognizer.pause_threshold
+                    or total_frames * frame_seconds >= self.config.phrase_time_limit
+                )
+                if ended:
+                    self._finish_utterance(utterance, speech_frames * frame_seconds, callback)
+                    utterance = None
+            
+            except Exception as e:
+                Logger.error(f"Unexpected error in speech recognition: {e}")
+                utterance = None
+        
+        if utterance is not None:
+            self._finish_utterance(utterance, speech_frames * frame_seconds, callback)
+    
+    def _finish_utterance(
+        self,
+        utterance: RecognitionStream,
+        speech_seconds: float,
+        callback: Callable[[str], None]
+    ):
+        """Finalize a streamed utterance and deliver it if it was speech"""
+        if speech_seconds * 1000 < self.config.vad_min_speech_ms:
+            Metrics.increment("vad_segments_dropped")
+            return
+        Metrics.increment("vad_segments_passed")
+        
+        # Recognition precedes the turn this utterance starts
+        with Tracer.span("speech_recognition", next_turn=True):
+            text = utterance.finish()
+        
+        if text.strip():
+            callback(text)
     
     def recognize_once(self, audio_data) -> Optional[str]:
         """
@@ -95,9 +293,9 @@ class SpeechRecognizer:
             Transcribed text or None if failed
         """
         try:
-            return self.recognizer.recognize_google(audio_data)
+            return self.engine.transcribe(audio_data)
         except sr.UnknownValueError:
             return None
         except sr.RequestError as e:
-            print(f"❌ Speech recognition error: {e}")
+            Logger.error(f"Speech recognition error: {e}")
             return None
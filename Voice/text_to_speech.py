@@ -3,95 +3,243 @@ Text-to-Speech Module
 Handles speech synthesis and playback
 """
 import io
+import queue
 import threading
-from typing import Optional
+import time
+from typing import Iterable, List, Optional, Union
 
-from gtts import gTTS
 from pydub import AudioSegment
-from pydub.playback import play
 
 from config.settings import VoiceConfig
+from utils.logger import Logger
+from utils.metrics import Metrics
+from utils.tracing import Tracer
+from .audio_cache import AudioCache
+from .playback import AudioSink, PlaybackEngine
 
 
 class TextToSpeech:
     """Handles text-to-speech conversion and playback with interrupt support"""
     
-    def __init__(self, config: VoiceConfig):
+    def __init__(self, config: VoiceConfig, sink: Optional[AudioSink] = None):
         """
         Initialize TTS engine
         
         Args:
             config: Voice configuration settings
+            sink: Audio output (defaults to VoiceConfig.playback_sink)
         """
         self.config = config
         self.is_speaking = False
         self.should_stop_speaking = False
-        self.audio_thread: Optional[threading.Thread] = None
+        self.synthesis_thread: Optional[threading.Thread] = None
+        self.audio_cache = AudioCache(config)
+        self.playback = PlaybackEngine(config, sink)
+        
+        # Text waiting for synthesis (or decoded audio being replayed);
+        # decoded audio goes to the playback ring buffer. Items are tagged
+        # with the generation they were queued in so that anything queued
+        # before an interrupt is dropped.
+        self._text_queue: queue.Queue = queue.Queue()
+        self._generation = 0
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._idle = threading.Event()
+        self._idle.set()
+        
+        # Time-to-first-audio tracking
+        self._turn_started: Optional[float] = None
+        
+        # Decoded audio of the reply in progress and of the one before it,
+        # kept so a "say that again" replays without synthesis
+        self._reply_audio: List[AudioSegment] = []
+        self._previous_reply_audio: List[AudioSegment] = []
     
     def speak(self, text: str):
         """
         Convert text to speech and play with interrupt support
-        Runs in separate thread for non-blocking playback
+        Queued behind any speech already in progress; synthesis and
+        playback run in background threads for non-blocking playback
         
         Args:
             text: Text to convert to speech
         """
-        def _play_audio():
-            try:
-                self.is_speaking = True
-                self.should_stop_speaking = False
-                
-                # Generate speech using Google TTS
-                tts = gTTS(
-                    text=text,
-                    lang=self.config.tts_language,
-                    slow=self.config.tts_slow
-                )
-                
-                # Write to in-memory file
-                fp = io.BytesIO()
-                tts.write_to_fp(fp)
-                fp.seek(0)
-                
-                # Load audio
-                audio = AudioSegment.from_mp3(fp)
-                
-                # Play in chunks to allow interruption
-                chunk_length = self.config.audio_chunk_length
-                for i in range(0, len(audio), chunk_length):
-                    if self.should_stop_speaking:
-                        print("\n🔇 [Audio interrupted]")
-                        break
-                    
-                    chunk = audio[i:i + chunk_length]
-                    play(chunk)
+        if not text.strip():
+            return
+        self._enqueue(text)
+    
+    def replay(self) -> bool:
+        """
+        Play the previous reply again from its decoded audio
+        Queued like speak(); nothing is synthesized
+        
+        Returns:
+            False if there is no previous reply audio to play
+        """
+        with self._lock:
+            segments = list(self._previous_reply_audio)
+        for audio in segments:
+            self._enqueue(audio)
+        if segments:
+            Metrics.increment("tts_replays")
+        return bool(segments)
+    
+    def _enqueue(self, item: Union[str, AudioSegment]):
+        """Queue text (or already decoded audio) behind any speech in progress"""
+        self._ensure_workers()
+        
+        with self._lock:
+            self._pending += 1
+            self.is_speaking = True
+            self._idle.clear()
+            generation = self._generation
+        
+        self._text_queue.put((generation, item))
+    
+    def begin_turn(self):
+        """
+        Mark the start of a conversational turn
+        The next played audio chunk records time_to_first_audio, and the
+        audio of the reply so far becomes the one replay() plays
+        """
+        self._turn_started = time.perf_counter()
+        with self._lock:
+            if self._reply_audio:
+                self._previous_reply_audio = self._reply_audio
+                self._reply_audio = []
+    
+    def _ensure_workers(self):
+        """Start the synthesis thread and the playback stream on first use"""
+        if self.synthesis_thread is None or not self.synthesis_thread.is_alive():
+            self.synthesis_thread = threading.Thread(
+                target=self._synthesis_worker,
+                daemon=True,
+                name="TTSSynthesisThread"
+            )
+            self.synthesis_thread.start()
+        
+        self.playback.start()
+    
+    def warm_up(self, phrases: Iterable[str]):
+        """
+        Pre-render fixed phrases into the audio cache in the background
+        so they later play with no network or decode cost
+        
+        Args:
+            phrases: Phrases to render
+        """
+        def _render_all():
+            for phrase in phrases:
+                try:
+                    self._synthesize(phrase)
+                except Exception as e:
+                    Logger.warning(f"Could not pre-render phrase: {e}")
+        
+        threading.Thread(target=_render_all, daemon=True, name="TTSWarmUpThread").start()
+    
+    def _synthesize(self, text: str) -> AudioSegment:
+        """
+        Generate and decode speech audio for text, using the audio cache
+        
+        Args:
+            text: Text to synthesize
+            
+        Returns:
+            Decoded audio segment
+        """
+        cached = self.audio_cache.get(text)
+        if cached is not None:
+            return cached
+        
+        # Imported here, on the synthesis thread, to keep it off startup
+        from gtts import gTTS
+        
+        # Generate speech using Google TTS
+        with Tracer.span("tts_synthesis"):
+            tts = gTTS(
+                text=text,
+                lang=self.config.tts_language,
+                slow=self.config.tts_slow
+            )
+            
+            # Write to in-memory file
+            fp = io.BytesIO()
+            tts.write_to_fp(fp)
+            fp.seek(0)
+        
+        # Load audio
+        with Tracer.span("mp3_decode"):
+            audio = AudioSegment.from_mp3(fp)
+        
+        self.audio_cache.put(text, fp.getvalue(), audio)
+        return audio
+    
+    def _synthesis_worker(self):
+        """Synthesize queued text while earlier audio is still playing"""
+        while True:
+            generation, item = self._text_queue.get()
             
+            if generation != self._generation:
+                self._finish_item()
+                continue
+            
+            try:
+                audio = item if isinstance(item, AudioSegment) else self._synthesize(item)
             except Exception as e:
-                print(f"❌ Error in speech playback: {e}")
+                Logger.error(f"Error in speech synthesis: {e}")
+                self._finish_item()
+                continue
+            
+            with self._lock:
+                self._reply_audio.append(audio)
             
-            finally:
+            # Blocks while the ring buffer is full; flushed audio still
+            # runs _finish_item so the pending count stays correct
+            self.playback.enqueue(
+                audio,
+                generation,
+                on_start=self._record_first_audio,
+                on_done=self._finish_item
+            )
+    
+    def _record_first_audio(self):
+        """Record latency from turn start to first audible block"""
+        started = self._turn_started
+        if started is not None:
+            self._turn_started = None
+            Tracer.record("time_to_first_audio", started, time.perf_counter())
+    
+    def _finish_item(self):
+        """Mark one queued utterance as done"""
+        with self._lock:
+            self._pending = max(0, self._pending - 1)
+            if self._pending == 0:
                 self.is_speaking = False
-        
-        # Run playback in separate thread
-        self.audio_thread = threading.Thread(target=_play_audio, daemon=True)
-        self.audio_thread.start()
+                self.should_stop_speaking = False
+                self._idle.set()
     
     def interrupt(self):
         """
         Stop current speech playback (barge-in)
-        Sets interrupt flag and waits for playback to stop
+        Drops all queued speech, flushes the playback buffer and waits
+        for pending synthesis to wind down
         """
         if self.is_speaking:
-            self.should_stop_speaking = True
-            if self.audio_thread:
-                self.audio_thread.join(timeout=self.config.interrupt_timeout)
+            with self._lock:
+                self.should_stop_speaking = True
+                self._generation += 1
+                generation = self._generation
+                Metrics.increment("tts_items_cancelled", self._pending)
+            self.playback.flush(generation)
+            Logger.info("Audio interrupted")
+            self._idle.wait(timeout=self.config.interrupt_timeout)
     
     def is_currently_speaking(self) -> bool:
         """
         Check if currently speaking
         
         Returns:
-            True if speech is being played
+            True if speech is being synthesized or played
         """
         return self.is_speaking
     
@@ -102,5 +250,8 @@ class TextToSpeech:
         Args:
             timeout: Maximum time to wait in seconds
         """
-        if self.audio_thread and self.audio_thread.is_alive():
-            self.audio_thread.join(timeout=timeout)
+        self._idle.wait(timeout=timeout)
+    
+    def close(self):
+        """Close the audio output stream"""
+        self.playback.close()
@@ -0,0 +1,156 @@
+"""
+Voice Activity Detection
+Frame-level energy + zero-crossing detector with an adaptive noise floor
+"""
+import math
+import operator
+import sys
+from array import array
+from typing import Iterable, Optional
+
+from config.settings import VoiceConfig
+
+
+class VoiceActivityDetector:
+    """
+    Classifies 16-bit mono PCM frames as speech or non-speech
+    
+    A frame is speech when its RMS energy exceeds the tracked noise floor by
+    a ratio and its zero-crossing rate is below the level of broadband noise
+    (hiss, fans, clicks). The noise floor follows non-speech frames: it
+    falls quickly when the room gets quieter and rises slowly when it gets
+    louder, so short bursts do not inflate it.
+    """
+    
+    # Floor never drops below this RMS, so digital silence cannot make
+    # every click look like speech
+    MIN_NOISE_FLOOR = 50.0
+    
+    def __init__(self, config: VoiceConfig, sample_rate: int):
+        """
+        Initialize detector
+        
+        Args:
+            config: Voice configuration settings
+            sample_rate: Sample rate of the PCM audio
+        """
+        self.config = config
+        self.sample_rate = sample_rate
+        self.frame_samples = max(1, sample_rate * config.vad_frame_ms // 1000)
+        self.noise_floor = self.MIN_NOISE_FLOOR
+        self._calibrated = False
+    
+    @property
+    def energy_threshold(self) -> float:
+        """RMS level a frame must exceed to count as speech"""
+        return self.noise_floor * self.config.vad_energy_ratio
+    
+    def calibrate(self, pcm: bytes, quantile: float = 0.5):
+        """
+        Seed the noise floor from ambient audio
+        
+        Args:
+            pcm: 16-bit mono PCM captured while nobody speaks
+            quantile: Frame energy taken as the floor; the median ignores a
+                stray click, a low quantile ignores the agent's own speech
+                when calibrating during playback
+        """
+        energies = sorted(self._rms(frame) for frame in self._frames(pcm))
+        if energies:
+            index = min(len(energies) - 1, int(len(energies) * quantile))
+            self.noise_floor = max(self.MIN_NOISE_FLOOR, energies[index])
+            self._calibrated = True
+    
+    def contains_speech(self, pcm: bytes, ratio: Optional[float] = None) -> bool:
+        """
+        Decide whether a captured segment holds speech, updating the noise
+        floor from its non-speech frames
+        
+        Args:
+            pcm: 16-bit mono PCM segment
+            ratio: Energy ratio override (e.g. stricter while the agent speaks)
+            
+        Returns:
+            True if the segment has a long enough run of speech frames
+        """
+        ratio = ratio or self.config.vad_energy_ratio
+        min_frames = max(1, self.config.vad_min_speech_ms // self.config.vad_frame_ms)
+        
+        run = best_run = gap = 0
+        noise = []
+        for frame in self._frames(pcm):
+            energy = self._rms(frame)
+            # Zero-crossing rate is only needed for loud frames
+            if energy > self.noise_floor * ratio and self._zcr(frame) <= self.config.vad_max_zcr:
+                run += 1
+                gap = 0
+                best_run = max(best_run, run)
+            else:
+                noise.append(energy)
+                # Tolerate a single-frame dip inside a word
+                gap += 1
+                if gap > 1:
+                    run = 0
+        
+        self._update_noise_floor(noise)
+        return best_run >= min_frames
+    
+    def is_speech_frame(self, pcm: bytes, ratio: Optional[float] = None) -> bool:
+        """
+        Classify one streamed frame, updating the noise floor if it is not speech
+        
+        Args:
+            pcm: 16-bit mono PCM of (at least) one analysis frame
+            ratio: Energy ratio override (e.g. stricter while the agent speaks)
+            
+        Returns:
+            True if any whole frame in pcm is speech
+        """
+        ratio = ratio or self.config.vad_energy_ratio
+        speech = False
+        noise = []
+        for frame in self._frames(pcm):
+            energy = self._rms(frame)
+            if energy > self.noise_floor * ratio and self._zcr(frame) <= self.config.vad_max_zcr:
+                speech = True
+            else:
+                noise.append(energy)
+        
+        self._update_noise_floor(noise)
+        return speech
+    
+    def _update_noise_floor(self, energies: Iterable[float]):
+        """Track the noise floor with an asymmetric moving average"""
+        rate = self.config.vad_noise_adapt_rate
+        for energy in energies:
+            if not self._calibrated:
+                self.noise_floor = max(self.MIN_NOISE_FLOOR, energy)
+                self._calibrated = True
+            elif energy < self.noise_floor:
+                # Quieter room: follow quickly
+                self.noise_floor += (energy - self.noise_floor) * min(1.0, rate * 4)
+            else:
+                self.noise_floor += (energy - self.noise_floor) * rate
+            self.noise_floor = max(self.MIN_NOISE_FLOOR, self.noise_floor)
+    
+    def _frames(self, pcm: bytes) -> Iterable[array]:
+        """Split 16-bit PCM into whole analysis frames"""
+        samples = array("h")
+        samples.frombytes(pcm[:len(pcm) - len(pcm) % 2])
+        if sys.byteorder == "big":
+            samples.byteswap()
+        
+        size = self.frame_samples
+        for start in range(0, len(samples) - size + 1, size):
+            yield samples[start:start + size]
+    
+    @staticmethod
+    def _rms(frame: array) -> float:
+        """Root-mean-square energy of a frame"""
+        return math.sqrt(sum(map(operator.mul, frame, frame)) / len(frame))
+    
+    @staticmethod
+    def _zcr(frame: array) -> float:
+        """Fraction of adjacent samples that change sign"""
+        crossings = sum(1 for a, b in zip(frame, frame[1:]) if (a < 0) != (b < 0))
+        return crossings / len(frame)
@@ -3,14 +3,16 @@ Pet Health Voice Agent
 Main agent orchestrator that coordinates all components
 """
 import asyncio
-import queue
+import json
 import threading
-from typing import Optional
+import time
+from typing import List, Optional
 
 from config import Config, PromptTemplates
 from voice import VoiceManager
-from chains import ReasoningChains
-from utils import ConversationHistory, Logger
+from chains import EmergencyMatcher, ReasoningChains, ResponseCache, SmallTalkClassifier
+from models import CaseState, HealthOverview
+from utils import ConversationHistory, Logger, Metrics, MetricsExporter, Tracer, UtteranceCoalescer
 
 
 class PetHealthVoiceAgent:
@@ -25,15 +27,47 @@ class PetHealthVoiceAgent:
         """
         self.config = config
         
-        # Initialize components
-        self.voice_manager = VoiceManager(config.voice)
-        self.reasoning_chains = ReasoningChains(config.llm)
+        # Initialize components (with fast_start, calibration and the LLM
+        # client are left to start(), which runs them alongside the greeting)
+        self.voice_manager = VoiceManager(
+            config.voice,
+            defer_calibration=config.agent.fast_start
+        )
+        self.reasoning_chains = ReasoningChains(
+            config.llm,
+            cache=ResponseCache(config.cache) if config.cache.enabled else None,
+            emergency_matcher=EmergencyMatcher() if config.agent.emergency_fast_path else None
+        )
+        if not config.agent.fast_start:
+            self.reasoning_chains.prepare()
+        
         self.conversation_history = ConversationHistory(
-            max_exchanges=config.agent.conversation_history_limit
+            max_exchanges=config.agent.conversation_history_limit,
+            max_tokens=config.agent.context_token_budget,
+            summarize=config.agent.summarize_history,
+            summary_max_tokens=config.agent.summary_token_budget
         )
+        self.case_state = CaseState()
+        self.metrics_exporter = MetricsExporter(config.tracing)
         
-        # Queue for passing speech between threads
-        self.pending_input_queue = queue.Queue()
+        # "okay", "thanks", "repeat that", "hold on", "bye": answered locally
+        self.small_talk = SmallTalkClassifier() if config.agent.small_talk_fast_path else None
+        self.last_reply = ""  # What the agent said last (the greeting, then each reply)
+        
+        # Turn in progress, cancelled when a newer utterance arrives
+        self.current_turn: Optional[asyncio.Task] = None
+        self._interrupted_spoken = False
+        self._turn_log_tasks: set = set()
+        
+        # Queue of (text, recognized_at) fed from the listening thread via
+        # call_soon_threadsafe; None is the shutdown sentinel
+        self.pending_input_queue: asyncio.Queue = asyncio.Queue()
+        self.coalescer = UtteranceCoalescer(
+            window=config.agent.coalesce_window,
+            incomplete_wait=config.agent.coalesce_incomplete_wait,
+            max_hold=config.agent.coalesce_max_hold
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Control flags
         self.is_running = False
@@ -54,47 +88,254 @@ class PetHealthVoiceAgent:
             Logger.info("Interrupting AI response...")
             self.voice_manager.interrupt()
         
-        # Queue the input for processing
-        self.pending_input_queue.put(text)
+        # Hand the input to the event loop for processing
+        self._loop.call_soon_threadsafe(
+            self.pending_input_queue.put_nowait,
+            (text, time.perf_counter())
+        )
+    
+    def _handle_partial_speech(self, text: str):
+        """
+        Callback for partial transcripts while the user is still speaking
+        Called by the listening thread (streaming recognition engines only)
+        
+        Args:
+            text: Transcript so far
+        """
+        # Barge in as soon as words are recognized, not at end of utterance
+        if self.voice_manager.is_speaking():
+            Logger.info("Interrupting AI response...")
+            self.voice_manager.interrupt()
     
     async def _process_input_loop(self):
         """
         Process user inputs from queue
-        Main processing loop that runs in the main thread
+        Main processing loop that runs on the event loop; waits without
+        polling until input arrives or stop() posts the shutdown sentinel.
+        Fragments arriving in quick succession are coalesced into one turn,
+        and each turn runs as its own task so a newer utterance can cancel it.
         """
-        while self.is_running:
-            try:
-                # Get user input from queue (with timeout to allow loop exit)
-                try:
-                    user_input = self.pending_input_queue.get(
-                        timeout=self.config.agent.queue_timeout
-                    )
-                except queue.Empty:
-                    # No input yet, continue loop
-                    continue
-                
-                # Add user message to history
-                self.conversation_history.add_user_message(user_input)
-                conversation_context = self.conversation_history.get_context()
-                
-                # Analyze and generate response using LangChain
-                structured, response = await self.reasoning_chains.analyze_and_respond(
-                    conversation_context,
-                    user_input
-                )
-                
-                # Log structured reasoning (for transparency)
-                Logger.structured_analysis(structured)
-                
-                # Add assistant response to history
-                self.conversation_history.add_assistant_message(response)
-                
-                # Speak the conversational response
-                Logger.agent_response(response)
-                self.voice_manager.speak(response)
+        while not self.stop_event.is_set():
+            item = await self.coalescer.next(self.pending_input_queue)
+            if item is None:
+                break
+            
+            user_input, recognized_at = item
+            Metrics.record("input_dispatch_latency", time.perf_counter() - recognized_at)
+            
+            if self.current_turn is not None and not self.current_turn.done():
+                if self.config.agent.cancel_on_barge_in:
+                    user_input = await self._cancel_current_turn(user_input)
+                else:
+                    await asyncio.wait([self.current_turn])
+            
+            self.current_turn = asyncio.create_task(self._process_turn(user_input))
+        
+        if self.current_turn is not None and not self.current_turn.done():
+            self.current_turn.cancel()
+            await asyncio.wait([self.current_turn])
+    
+    async def _process_turn(self, user_input: str):
+        """
+        Analyze one utterance and speak the reply
+        
+        Args:
+            user_input: User's utterance
+        """
+        trace = Tracer.begin_turn(user_input)
+        started = time.perf_counter()
+        spoken: List[str] = []
+        
+        try:
+            intent = self._classify_small_talk(user_input)
+            if intent is not None:
+                self.voice_manager.begin_turn()
+                self._respond_small_talk(intent)
+                return
+            
+            # Add user message to history
+            self.conversation_history.add_user_message(user_input)
+            conversation_context = self._build_context()
+            
+            self.voice_manager.begin_turn()
+            
+            if self.config.agent.stream_responses:
+                await self._respond_streaming(conversation_context, user_input, spoken)
+            else:
+                await self._respond(conversation_context, user_input, spoken)
+            
+            # Add assistant response to history
+            self.last_reply = " ".join(spoken)
+            self.conversation_history.add_assistant_message(self.last_reply)
+        
+        except asyncio.CancelledError:
+            # Barge-in: keep what the user actually heard
+            if spoken:
+                self.last_reply = " ".join(spoken)
+                self.conversation_history.add_assistant_message(self.last_reply)
+            self._interrupted_spoken = bool(spoken)
+            Metrics.record("cancelled_turn_time", time.perf_counter() - started)
+            raise
+        
+        except Exception as e:
+            Logger.error(f"Error processing input: {e}")
+        
+        finally:
+            Tracer.end_turn(trace)
+            self._log_turn_when_spoken(trace)
+    
+    def _classify_small_talk(self, user_input: str) -> Optional[str]:
+        """Small-talk intent of an utterance, or None if it needs the LLM"""
+        if self.small_talk is None:
+            return None
+        return self.small_talk.classify_turn(user_input, self.last_reply)
+    
+    def _respond_small_talk(self, intent: str):
+        """
+        Answer a small-talk turn without the LLM
+        
+        "repeat" replays the previous reply's audio from memory; the other
+        intents speak a pre-rendered canned reply. These turns carry no case
+        information, so they stay out of the conversation history.
+        
+        Args:
+            intent: Intent from SmallTalkClassifier
+        """
+        if intent == "repeat":
+            Logger.agent_response(self.last_reply)
+            if not self.voice_manager.replay():
+                self.voice_manager.speak(self.last_reply)
+            return
+        
+        reply = PromptTemplates.get_small_talk_responses()[intent]
+        Logger.agent_response(reply)
+        self.voice_manager.speak(reply)
+        self.last_reply = reply
+    
+    async def _cancel_current_turn(self, user_input: str) -> str:
+        """
+        Cancel the in-flight turn (LLM call and queued speech) for a newer utterance
+        
+        Args:
+            user_input: The new utterance
             
-            except Exception as e:
-                Logger.error(f"Error processing input: {e}")
+        Returns:
+            Input for the next turn: the new utterance, merged with the
+            cancelled one if that was never answered
+        """
+        self._interrupted_spoken = False
+        self.current_turn.cancel()
+        await asyncio.wait([self.current_turn])
+        Metrics.increment("turns_cancelled")
+        Logger.info("Cancelled the previous response")
+        
+        # Sentences the cancelled turn queued after the barge-in check
+        if self.voice_manager.is_speaking():
+            await asyncio.to_thread(self.voice_manager.interrupt)
+        
+        if not self.config.agent.merge_interrupted_utterances or self._interrupted_spoken:
+            return user_input
+        
+        previous = self.conversation_history.retract_last_user_message()
+        if previous is None:
+            return user_input
+        
+        Metrics.increment("utterances_merged")
+        return f"{previous} {user_input}"
+    
+    def _log_turn_when_spoken(self, trace):
+        """Log the turn's timings (and debug waterfall) once its audio has played"""
+        async def _log():
+            # Bounded, so a stuck audio device cannot pin the task forever
+            await asyncio.to_thread(self.voice_manager.wait_until_finished, 60.0)
+            Logger.turn_timings(trace)
+            if self.config.tracing.waterfall:
+                Logger.waterfall(trace)
+        
+        task = asyncio.create_task(_log())
+        self._turn_log_tasks.add(task)
+        task.add_done_callback(self._turn_log_tasks.discard)
+    
+    def _merge_case(self, analysis: HealthOverview):
+        """Merge a turn's final analysis, skipping fallback and unrefined keyword-match ones"""
+        if self.reasoning_chains.is_mergeable(analysis):
+            self.case_state.merge(analysis)
+    
+    def _build_context(self) -> str:
+        """Prompt context: case state plus recent exchanges (see ConversationHistory.get_case_context)"""
+        return self.conversation_history.get_case_context(
+            self.case_state.render() if self.config.agent.case_state_enabled else "",
+            self.config.agent.recent_exchanges
+        )
+    
+    async def _respond(self, conversation_context: str, user_input: str, spoken: List[str]) -> str:
+        """
+        Generate the full response, then speak it
+        
+        Args:
+            conversation_context: Formatted conversation history
+            user_input: Latest user message
+            spoken: Filled with the text handed to TTS (read on cancellation)
+            
+        Returns:
+            Conversational response text
+        """
+        # Analyze and generate response using LangChain
+        structured, response = await self.reasoning_chains.analyze_and_respond(
+            conversation_context,
+            user_input,
+            previous_risk=self.case_state.latest_risk
+        )
+        
+        # Log structured reasoning (for transparency)
+        Logger.structured_analysis(structured)
+        self._merge_case(structured)
+        
+        # Speak the conversational response
+        Logger.agent_response(response)
+        spoken.append(response)
+        self.voice_manager.speak(response)
+        
+        return response
+    
+    async def _respond_streaming(self, conversation_context: str, user_input: str, spoken: List[str]) -> str:
+        """
+        Speak the response sentence by sentence as it is generated
+        
+        Args:
+            conversation_context: Formatted conversation history
+            user_input: Latest user message
+            spoken: Filled with each sentence handed to TTS (read on cancellation)
+            
+        Returns:
+            Full conversational response text
+        """
+        structured, sentences = await self.reasoning_chains.analyze_and_stream(
+            conversation_context,
+            user_input,
+            min_sentence_length=self.config.voice.min_sentence_length,
+            previous_risk=self.case_state.latest_risk
+        )
+        
+        # Log structured reasoning (for transparency)
+        Logger.structured_analysis(structured)
+        
+        # Queue each sentence for synthesis while later ones are generated
+        async for sentence in sentences:
+            spoken.append(sentence)
+            self.voice_manager.speak(sentence)
+        
+        # Emergency fast path: the full analysis replaces the keyword one
+        if sentences.refined:
+            Logger.structured_analysis(sentences.analysis)
+        
+        # Only a completed turn counts: a cancelled one may be retracted
+        # and re-analyzed merged with the next utterance
+        self._merge_case(sentences.analysis)
+        
+        response = " ".join(spoken)
+        Logger.agent_response(response)
+        return response
     
     def _listen_loop(self):
         """
@@ -103,20 +344,41 @@ class PetHealthVoiceAgent:
         """
         self.voice_manager.listen_streaming(
             callback=self._handle_user_speech,
-            stop_event=self.stop_event
+            stop_event=self.stop_event,
+            partial_callback=self._handle_partial_speech
         )
     
     async def start(self):
         """Start the voice agent"""
+        started = time.perf_counter()
+        
         # Print banner
         Logger.banner()
+        self.metrics_exporter.start()
         
-        # Play initial greeting
+        # Play initial greeting (synthesis and playback run in background threads)
         greeting = PromptTemplates.get_greeting_prompt()
         Logger.agent_response(greeting)
         self.voice_manager.speak(greeting)
+        self.last_reply = greeting
+        
+        # Pre-render fixed phrases so they play without synthesis cost
+        self.voice_manager.warm_up(PromptTemplates.get_static_phrases())
+        
+        # Build the LLM client while the greeting plays; the microphone is
+        # calibrated once it ends, unless calibrate_during_greeting (experimental)
+        if self.config.agent.fast_start:
+            await asyncio.gather(
+                asyncio.to_thread(
+                    self.voice_manager.calibrate,
+                    not self.config.agent.calibrate_during_greeting
+                ),
+                self.reasoning_chains.warm_up()
+            )
+        Metrics.record("time_to_ready", time.perf_counter() - started)
         
         # Set running flag
+        self._loop = asyncio.get_running_loop()
         self.is_running = True
         
         # Start listening thread
@@ -127,16 +389,47 @@ class PetHealthVoiceAgent:
         )
         listen_thread.start()
         
-        # Start processing loop in main thread
+        # Start processing loop on the event loop
         try:
             await self._process_input_loop()
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
             Logger.info("Shutting down agent...")
         finally:
             self.stop()
+            
+            # Wait for the listener to observe stop_event without blocking the loop
+            await asyncio.to_thread(
+                listen_thread.join,
+                self.config.agent.shutdown_timeout
+            )
+            self.voice_manager.close()
+            self._export_case()
+            await self.reasoning_chains.aclose()
+            self.metrics_exporter.stop()
+            Logger.metrics(Metrics.summary())
+            Logger.info("Agent stopped")
+    
+    def _export_case(self):
+        """Log the case state and write it to case_export_path if configured"""
+        Logger.case_state(self.case_state)
+        
+        path = self.config.agent.case_export_path
+        if path and self.case_state.turns:
+            try:
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(self.case_state.export(), f, indent=2)
+                Logger.success(f"Case exported to {path}")
+            except OSError as e:
+                Logger.error(f"Could not export case: {e}")
     
     def stop(self):
-        """Stop the agent gracefully"""
+        """
+        Stop the agent gracefully
+        Safe to call from any thread
+        """
         self.is_running = False
         self.stop_event.set()
-        Logger.info("Agent stopped")
+        
+        # Wake the processing loop if it is waiting for input
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self.pending_input_queue.put_nowait, None)
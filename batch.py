@@ -0,0 +1,349 @@
+"""
+Batch Triage Entry Point
+Re-runs structured analysis over archived call transcripts, offline
+
+Input: JSONL, one transcript per line. Each record has an optional "id"
+(defaults to the line number) and either
+    {"user_input": "...", "conversation": "..."}   (conversation optional)
+    {"transcript": ["User: ...", "Assistant: ...", "User: ..."]}
+where the last transcript line is analyzed with the earlier lines as
+conversation history (the format ConversationHistory.get_history() returns).
+
+Output: JSONL, one record per transcript, written as each one finishes:
+    {"id": ..., "status": "ok", "analysis": {...}, "attempts": n, "latency_ms": ...}
+    {"id": ..., "status": "error", "error": "..."}
+The output file is the checkpoint: a re-run skips ids that already have an
+"ok" record and appends the rest, so read the last record per id.
+
+Run this file to start a batch: python batch.py INPUT OUTPUT [--concurrency N]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from dataclasses import asdict, dataclass, replace
+from typing import Iterator, Optional, Set, TextIO, Tuple
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+from config import Config
+from chains import ReasoningChains
+from models import HealthOverview
+from utils import Logger, Metrics
+from utils.text import estimate_tokens
+
+
+@dataclass
+class BatchReport:
+    """Totals for one batch run"""
+    processed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0  # Already done in a previous run
+    retries: int = 0
+    rate_limited: int = 0
+    prompt_tokens: int = 0  # Estimated, summed over all attempts
+    completion_tokens: int = 0
+    cost: float = 0.0  # USD, from BatchConfig token prices
+    elapsed: float = 0.0
+    
+    @property
+    def items_per_second(self) -> float:
+        """Throughput of transcripts processed in this run"""
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class BatchTriage:
+    """Analyzes a JSONL file of transcripts with bounded concurrency"""
+    
+    # Print progress every this many processed transcripts
+    PROGRESS_EVERY = 100
+    
+    def __init__(self, config: Config, reasoning_chains: Optional[ReasoningChains] = None):
+        """
+        Initialize the batch runner
+        
+        Args:
+            config: Complete configuration object (uses config.llm and config.batch)
+            reasoning_chains: Chains to analyze with (built from config.llm if omitted)
+        """
+        self.config = config.batch
+        
+        # No response cache or emergency fast path: every transcript gets a full analysis.
+        # Retries (with the shared rate-limit pause) happen per transcript here, and
+        # hedging would only double the load, so the HTTP pool does neither.
+        self.reasoning_chains = reasoning_chains or ReasoningChains(
+            replace(config.llm, max_retries=0, hedge_after=0)
+        )
+        
+        # Tokens of the fixed prompt part, counted once for the cost estimate
+        self._prompt_overhead = estimate_tokens(
+            self.reasoning_chains.reasoning_chain.first.invoke(
+                {"conversation": "", "user_input": ""}
+            ).to_string()
+        )
+        
+        # Shared backoff: after a rate limit, no worker calls the LLM before this time
+        self._resume_at = 0.0
+        self.report = BatchReport()
+    
+    async def run(self, input_path: str, output_path: str, resume: bool = True) -> BatchReport:
+        """
+        Analyze every transcript in the input file
+        
+        Args:
+            input_path: JSONL transcripts
+            output_path: JSONL results (appended to when resuming)
+            resume: Skip ids that already succeeded in output_path
+            
+        Returns:
+            Totals for this run
+        """
+        done = self._completed_ids(output_path) if resume else set()
+        self.report = BatchReport()
+        semaphore = asyncio.Semaphore(self.config.concurrency)
+        tasks: Set[asyncio.Task] = set()
+        started = time.perf_counter()
+        
+        with open(output_path, "a" if resume else "w", encoding="utf-8") as output:
+            if resume and not self._ends_with_newline(output_path):
+                output.write("\n")  # Terminate a line cut off by an interrupted run
+            
+            for item_id, record in self._read_items(input_path):
+                if item_id in done:
+                    self.report.skipped += 1
+                    continue
+                
+                # Admission control: at most `concurrency` transcripts in flight,
+                # so memory stays flat however large the input is
+                await semaphore.acquire()
+                task = asyncio.create_task(self._process(item_id, record, output))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                task.add_done_callback(lambda _: semaphore.release())
+            
+            if tasks:
+                await asyncio.gather(*tasks)
+        
+        self.report.elapsed = time.perf_counter() - started
+        self.report.cost = (
+            self.report.prompt_tokens / 1000 * self.config.input_cost_per_1k_tokens
+            + self.report.completion_tokens / 1000 * self.config.output_cost_per_1k_tokens
+        )
+        return self.report
+    
+    @staticmethod
+    def _completed_ids(output_path: str) -> Set[str]:
+        """Ids with an "ok" record in a previous run's output"""
+        done = set()
+        if not os.path.exists(output_path):
+            return done
+        with open(output_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Partial line from an interrupted run
+                if record.get("status") == "ok":
+                    done.add(str(record.get("id")))
+        return done
+    
+    @staticmethod
+    def _ends_with_newline(path: str) -> bool:
+        """Whether a file is empty or its last line is complete"""
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return True
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    
+    @staticmethod
+    def _read_items(input_path: str) -> Iterator[Tuple[str, dict]]:
+        """Stream (id, record) pairs from the input file"""
+        with open(input_path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    Logger.warning(f"Skipping line {line_number}: {e}")
+                    continue
+                yield str(record.get("id", line_number)), record
+    
+    @staticmethod
+    def _prepare(record: dict) -> Tuple[str, str]:
+        """
+        Split a record into chain inputs
+        
+        Returns:
+            (conversation, user_input)
+        """
+        if "transcript" not in record:
+            return record.get("conversation", ""), record["user_input"]
+        
+        transcript = record["transcript"]
+        if isinstance(transcript, str):
+            return "", transcript
+        
+        *earlier, latest = transcript
+        if latest.startswith("User: "):
+            latest = latest[len("User: "):]
+        return "\n".join(earlier), latest
+    
+    async def _process(self, item_id: str, record: dict, output: TextIO):
+        """Analyze one transcript and append its result"""
+        started = time.perf_counter()
+        try:
+            conversation, user_input = self._prepare(record)
+            analysis, attempts = await self._analyze_with_retry(conversation, user_input)
+            result = {
+                "id": item_id,
+                "status": "ok",
+                "analysis": analysis.model_dump(),
+                "attempts": attempts,
+                "latency_ms": round((time.perf_counter() - started) * 1000, 1)
+            }
+            self.report.succeeded += 1
+            Metrics.record("batch_item", time.perf_counter() - started)
+        
+        except Exception as e:
+            result = {
+                "id": item_id,
+                "status": "error",
+                "error": f"{type(e).__name__}: {e}"
+            }
+            self.report.failed += 1
+            Metrics.increment("batch_failures")
+        
+        # Writes happen on the event loop thread, one whole line at a time;
+        # flushing each line makes the output a crash-safe checkpoint
+        output.write(json.dumps(result) + "\n")
+        output.flush()
+        
+        self.report.processed += 1
+        if self.report.processed % self.PROGRESS_EVERY == 0:
+            Logger.info(
+                f"{self.report.processed} transcripts processed "
+                f"({self.report.failed} failed, {self.report.retries} retries)"
+            )
+    
+    async def _analyze_with_retry(self, conversation: str, user_input: str) -> Tuple[HealthOverview, int]:
+        """
+        Run the reasoning chain, backing off on errors
+        
+        Rate-limit errors honour Retry-After when the provider sends it and
+        pause every worker, not just the one that was throttled.
+        
+        Returns:
+            (analysis, attempts used)
+        """
+        prompt_tokens = self._prompt_overhead + estimate_tokens(conversation) + estimate_tokens(user_input)
+        
+        for attempt in range(self.config.max_retries + 1):
+            wait = self._resume_at - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            
+            self.report.prompt_tokens += prompt_tokens
+            try:
+                analysis = await self.reasoning_chains.analyze(conversation, user_input)
+                self.report.completion_tokens += estimate_tokens(analysis.model_dump_json())
+                return analysis, attempt + 1
+            
+            except Exception as e:
+                if attempt == self.config.max_retries:
+                    raise
+                
+                delay = min(
+                    self.config.retry_max_delay,
+                    self.config.retry_base_delay * 2 ** attempt
+                ) * random.uniform(0.5, 1.0)
+                
+                if _is_rate_limited(e):
+                    delay = _retry_after(e) or delay
+                    self._resume_at = max(self._resume_at, time.monotonic() + delay)
+                    self.report.rate_limited += 1
+                    Metrics.increment("batch_rate_limited")
+                
+                self.report.retries += 1
+                Metrics.increment("batch_retries")
+                await asyncio.sleep(delay)
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """HTTP status of a provider error, if it carries one"""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _is_rate_limited(error: Exception) -> bool:
+    """Whether an error means the provider is throttling us"""
+    return _status_code(error) == 429 or "rate limit" in str(error).lower()
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds from the provider's Retry-After header, if present"""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def print_report(report: BatchReport):
+    """Print end-of-run totals"""
+    Logger.report("BATCH REPORT", [
+        f"Processed: {report.processed} ({report.succeeded} ok, {report.failed} failed), "
+        f"skipped from checkpoint: {report.skipped}",
+        f"Retries: {report.retries} ({report.rate_limited} rate-limited)",
+        f"Throughput: {report.items_per_second:.2f} items/s over {report.elapsed:.1f}s",
+        f"Tokens (est.): {report.prompt_tokens:,} prompt + {report.completion_tokens:,} completion, "
+        f"cost ≈ ${report.cost:.4f}",
+    ], batch={**asdict(report), "items_per_second": report.items_per_second})
+
+
+async def main():
+    """Batch entry point"""
+    parser = argparse.ArgumentParser(description="Pet Health batch triage")
+    parser.add_argument("input", help="JSONL transcripts")
+    parser.add_argument("output", help="JSONL results (also the resume checkpoint)")
+    parser.add_argument("--concurrency", type=int, help="Transcripts analyzed at once")
+    parser.add_argument("--max-retries", type=int, help="Retries per transcript")
+    parser.add_argument("--no-resume", action="store_true", help="Overwrite output instead of resuming")
+    args = parser.parse_args()
+    
+    try:
+        config = Config.load()
+        Logger.configure(config.logging)
+        if args.concurrency:
+            config.batch.concurrency = args.concurrency
+        if args.max_retries is not None:
+            config.batch.max_retries = args.max_retries
+        
+        batch = BatchTriage(config)
+        try:
+            report = await batch.run(args.input, args.output, resume=not args.no_resume)
+        finally:
+            await batch.reasoning_chains.aclose()
+        print_report(report)
+    
+    except ValueError as e:
+        # Configuration error (e.g., missing API key)
+        Logger.error(f"Configuration error: {e}")
+        Logger.info("Please set PERPLEXITY_API_KEY in your .env file")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        Logger.info("Batch interrupted; run again to resume from the output file")
@@ -0,0 +1 @@
+"""Benchmarks package - offline latency benchmarks (run with python -m benchmarks.<name>)"""
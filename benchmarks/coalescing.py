@@ -0,0 +1,126 @@
+"""
+Utterance Coalescing Benchmark
+Replays callers who pause mid-sentence (one utterance recognized as two
+or three fragments) through the input queue and counts the turns, and
+so the two-call LLM passes, started per utterance with and without
+coalescing, plus the dispatch delay it adds. "syntax" is the default
+configuration (no fixed window); "window_only" and "window+syntax" add a
+fixed `--window-ms` wait after every fragment.
+
+Usage:
+    python -m benchmarks.coalescing [--utterances 40] [--gap-ms 600]
+        [--think-ms 2500] [--window-ms 200] [--speed 10]
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import List, Tuple
+
+from config.settings import AgentConfig
+from utils import Metrics, UtteranceCoalescer
+from .turn_latency import percentile
+
+# Utterances as the recognizer splits them when the caller pauses
+FRAGMENTED = [
+    ["my dog has been", "throwing up since this morning"],
+    ["she won't eat and", "she's drinking a lot of water"],
+    ["he ate some chocolate", "about an hour ago"],
+    ["my cat is limping on her", "back left leg"],
+    ["um, so the", "puppy has diarrhea and", "there's some blood in it"],
+    ["is it normal for a rabbit to sneeze this much"],
+    ["yes"],
+    ["he's twelve years old"],
+]
+
+
+async def replay(
+    coalescer: UtteranceCoalescer,
+    utterances: List[List[str]],
+    gap: float,
+    think: float
+) -> Tuple[int, List[float]]:
+    """
+    Feed fragments into a queue and drain it through the coalescer
+    
+    Returns:
+        (turns started, per-turn delay from first fragment to dispatch)
+    """
+    pending: asyncio.Queue = asyncio.Queue()
+    
+    async def caller():
+        for fragments in utterances:
+            for index, fragment in enumerate(fragments):
+                if index:
+                    await asyncio.sleep(gap * random.uniform(0.5, 1.5))
+                pending.put_nowait((fragment, time.perf_counter()))
+            await asyncio.sleep(think)
+        pending.put_nowait(None)
+    
+    feeder = asyncio.create_task(caller())
+    delays = []
+    while True:
+        item = await coalescer.next(pending)
+        if item is None:
+            break
+        delays.append(time.perf_counter() - item[1])
+    await feeder
+    return len(delays), delays
+
+
+async def measure(name: str, coalescer: UtteranceCoalescer, utterances, gap: float, think: float, speed: float):
+    """Run one configuration and print turns per utterance and merge rate"""
+    Metrics.reset()
+    random.seed(7)
+    turns, delays = await replay(coalescer, utterances, gap, think)
+    fragments = Metrics.count("utterance_fragments")
+    merged = Metrics.count("fragments_merged")
+    print(
+        f"{name:<14} turns={turns:4d} llm_passes/utterance={turns / len(utterances):4.2f} "
+        f"merge_rate={merged / fragments if fragments else 0:5.1%} "
+        f"added_p50={percentile(delays, 50) * speed * 1000:6.0f}ms "
+        f"added_p95={percentile(delays, 95) * speed * 1000:6.0f}ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--utterances", type=int, default=40)
+    parser.add_argument("--gap-ms", type=float, default=600, help="Mean pause between fragments")
+    parser.add_argument("--think-ms", type=float, default=2500, help="Pause between utterances")
+    parser.add_argument("--window-ms", type=float, default=200, help="Fixed window of the window_* runs")
+    parser.add_argument("--speed", type=float, default=10, help="Replay this many times faster")
+    args = parser.parse_args()
+    
+    random.seed(7)
+    utterances = [random.choice(FRAGMENTED) for _ in range(args.utterances)]
+    fragments = sum(len(u) for u in utterances)
+    print(f"{args.utterances} utterances as {fragments} fragments (times in real-time ms)")
+    
+    scale = 1 / args.speed
+    gap = args.gap_ms / 1000 * scale
+    think = args.think_ms / 1000 * scale
+    defaults = AgentConfig()
+    window = args.window_ms / 1000 * scale
+    incomplete_wait = defaults.coalesce_incomplete_wait * scale
+    max_hold = defaults.coalesce_max_hold * scale
+    await measure("no_coalescing", UtteranceCoalescer(0, 0, 0), utterances, gap, think, args.speed)
+    await measure(
+        "syntax",
+        UtteranceCoalescer(defaults.coalesce_window * scale, incomplete_wait, max_hold),
+        utterances, gap, think, args.speed
+    )
+    await measure(
+        "window_only",
+        UtteranceCoalescer(window, window, max_hold),
+        utterances, gap, think, args.speed
+    )
+    await measure(
+        "window+syntax",
+        UtteranceCoalescer(window, incomplete_wait, max_hold),
+        utterances, gap, think, args.speed
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,61 @@
+"""
+Emergency Matcher Benchmark
+Measures recall, false-positive rate and throughput of the keyword fast
+path on a labelled corpus (benchmarks/emergency_corpus.jsonl)
+
+Usage:
+    python -m benchmarks.emergency_matcher [--corpus PATH] [--repeat 2000]
+"""
+import argparse
+import json
+import os
+import time
+
+from chains import EmergencyMatcher
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), "emergency_corpus.jsonl")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS)
+    parser.add_argument("--repeat", type=int, default=2000, help="Passes over the corpus for throughput")
+    args = parser.parse_args()
+    
+    with open(args.corpus, encoding="utf-8") as f:
+        corpus = [json.loads(line) for line in f if line.strip()]
+    
+    started = time.perf_counter()
+    matcher = EmergencyMatcher()
+    compile_ms = (time.perf_counter() - started) * 1000
+    
+    true_pos = false_pos = 0
+    for item in corpus:
+        matches = matcher.match(item["text"])
+        if matches and item["emergency"]:
+            true_pos += 1
+        elif matches:
+            false_pos += 1
+            print(f"  false positive: {item['text']!r} -> {[m.phrase for m in matches]}")
+        elif item["emergency"]:
+            print(f"  missed: {item['text']!r}")
+    
+    positives = sum(1 for item in corpus if item["emergency"])
+    negatives = len(corpus) - positives
+    
+    texts = [item["text"] for item in corpus]
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        for text in texts:
+            matcher.match(text)
+    elapsed = time.perf_counter() - started
+    calls = args.repeat * len(texts)
+    
+    print(f"corpus: {positives} emergencies, {negatives} non-emergencies")
+    print(f"recall: {true_pos / positives:.1%}  false-positive rate: {false_pos / negatives:.1%}")
+    print(f"compile: {compile_ms:.1f} ms")
+    print(f"throughput: {calls / elapsed:,.0f} utterances/s ({elapsed / calls * 1e6:.1f} µs each)")
+
+
+if __name__ == "__main__":
+    main()
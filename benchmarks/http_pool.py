@@ -0,0 +1,194 @@
+"""
+HTTP Pool Benchmark
+Runs the pooled Perplexity chat model against a local mock of the chat
+completions API. The mock charges `--connect-ms` on every new connection
+(standing in for TCP + TLS handshakes to a remote host) and makes a
+fraction of responses stragglers, then the benchmark compares:
+
+    new_connection   no keep-alive: every call opens a connection
+    pooled           keep-alive pool, cold at the first call
+    pooled+warm      keep-alive pool warmed up before the first call
+    pooled+hedge     warmed pool, streaming requests hedged against stragglers
+
+Each turn is one non-streaming call (the analysis) and one streaming call
+(the reply), like a two_step turn; latency is time to the full analysis
+and time to the first streamed token.
+
+Usage:
+    python -m benchmarks.http_pool [--turns 40] [--connect-ms 120]
+        [--ttft-ms 150] [--straggler-rate 0.05] [--straggler-ms 1500]
+"""
+import argparse
+import asyncio
+import json
+import random
+import threading
+import time
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from config.settings import LLMConfig
+from chains.fake_llm import FakeTriageChatModel
+from chains.perplexity import PooledPerplexityChat
+from utils import Metrics
+from .turn_latency import percentile
+
+
+class MockCompletionsHandler(BaseHTTPRequestHandler):
+    """OpenAI-style /chat/completions with connection cost and stragglers"""
+    
+    protocol_version = "HTTP/1.1"  # Keep-alive
+    
+    def setup(self):
+        super().setup()
+        server = self.server
+        with server.lock:
+            server.connections += 1
+        time.sleep(server.connect_ms / 1000)  # Handshake cost of a new connection
+    
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+    
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        
+        delay = server.ttft_ms
+        if server.rng.random() < server.straggler_rate:
+            delay += server.straggler_ms
+        time.sleep(delay / 1000)
+        
+        # Same prompt-aware output as the offline fake model
+        system = [m["content"] for m in body["messages"] if m["role"] == "system"]
+        content = server.outputs._choose_output([SystemMessage(content=system[0] if system else "")])
+        
+        if not body.get("stream"):
+            payload = json.dumps({"choices": [{"message": {"role": "assistant", "content": content}}]}).encode()
+            try:
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # Hedge loser, cancelled by the client
+            return
+        
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for token in server.outputs._tokens(content):
+                event = {"choices": [{"delta": {"content": token}}]}
+                self._chunk(f"data: {json.dumps(event)}\n\n".encode())
+                time.sleep(0.002)
+            self._chunk(b"data: [DONE]\n\n")
+            self._chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Hedge loser, cancelled by the client
+    
+    def _chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+    
+    def log_message(self, format, *args):
+        pass
+
+
+def start_mock_server(args: argparse.Namespace) -> ThreadingHTTPServer:
+    """Start the mock API on a free local port"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockCompletionsHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.connect_ms = args.connect_ms
+    server.ttft_ms = args.ttft_ms
+    server.straggler_rate = args.straggler_rate
+    server.straggler_ms = args.straggler_ms
+    server.rng = random.Random(7)
+    server.outputs = FakeTriageChatModel()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def run_turns(model: PooledPerplexityChat, turns: int, gap: float):
+    """Two-call turns with caller think time between them"""
+    messages = [SystemMessage(content="You are a triage assistant."), HumanMessage(content="My dog is vomiting")]
+    analysis, first_token = [], []
+    for _ in range(turns):
+        started = time.perf_counter()
+        await model.ainvoke(messages)
+        analysis.append(time.perf_counter() - started)
+        
+        started = time.perf_counter()
+        first = None
+        async for _ in model.astream(messages):
+            first = first or time.perf_counter() - started
+        first_token.append(first)
+        await asyncio.sleep(gap)
+    return analysis, first_token
+
+
+def row(name: str, samples: List[float]) -> str:
+    return (
+        f"{name:<14} first={samples[0] * 1000:6.0f}ms "
+        f"p50={percentile(samples, 50) * 1000:6.0f}ms "
+        f"p95={percentile(samples, 95) * 1000:6.0f}ms "
+        f"max={max(samples) * 1000:6.0f}ms"
+    )
+
+
+async def measure(name: str, config: LLMConfig, server: ThreadingHTTPServer, args, warm: bool):
+    """Run one configuration on a fresh pool"""
+    Metrics.reset()
+    server.rng.seed(7)
+    before = server.connections
+    model = PooledPerplexityChat(config=config)
+    if warm:
+        await model.awarm_up()
+    try:
+        analysis, first_token = await run_turns(model, args.turns, args.gap_ms / 1000)
+    finally:
+        await model.aclose()
+    print(f"{name}  (connections opened: {server.connections - before}, "
+          f"hedges: {Metrics.count('http_hedges')}, hedge wins: {Metrics.count('http_hedge_wins')})")
+    print("  " + row("analysis", analysis))
+    print("  " + row("first token", first_token))
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=40)
+    parser.add_argument("--connect-ms", type=float, default=120.0, help="Cost of opening a connection")
+    parser.add_argument("--ttft-ms", type=float, default=150.0, help="Server time before responding")
+    parser.add_argument("--straggler-rate", type=float, default=0.05, help="Share of slow responses")
+    parser.add_argument("--straggler-ms", type=float, default=1500.0, help="Extra delay of a slow response")
+    parser.add_argument("--gap-ms", type=float, default=50.0, help="Pause between turns")
+    args = parser.parse_args()
+    
+    server = start_mock_server(args)
+    base = LLMConfig(
+        api_key="mock",
+        base_url=f"http://127.0.0.1:{server.server_address[1]}",
+        hedge_after=0
+    )
+    # Hedge once a response is clearly later than the usual one
+    hedge_after = (args.connect_ms + args.ttft_ms) / 1000 * 1.5
+    
+    try:
+        await measure("new_connection", replace(base, max_keepalive_connections=0), server, args, warm=False)
+        await measure("pooled", base, server, args, warm=False)
+        await measure("pooled+warm", base, server, args, warm=True)
+        await measure("pooled+hedge", replace(base, hedge_after=hedge_after), server, args, warm=True)
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,107 @@
+"""
+Input Dispatch Benchmark
+Compares the old blocking queue poll inside the event loop with the
+asyncio.Queue + call_soon_threadsafe hand-off used by the agent
+
+Usage:
+    python -m benchmarks.input_dispatch [--inputs 20] [--interval 0.2]
+"""
+import argparse
+import asyncio
+import queue
+import threading
+import time
+from typing import List
+
+from benchmarks.turn_latency import percentile
+
+
+def producer(put, inputs: int, interval: float):
+    """Simulated listening thread: emit one utterance per interval"""
+    for _ in range(inputs):
+        time.sleep(interval)
+        put(time.perf_counter())
+    put(None)
+
+
+async def blocking_poll(inputs: int, interval: float, poll_timeout: float) -> List[float]:
+    """Previous design: queue.Queue.get(timeout) called directly on the loop"""
+    pending: queue.Queue = queue.Queue()
+    threading.Thread(target=producer, args=(pending.put, inputs, interval), daemon=True).start()
+    latencies = []
+    
+    while True:
+        try:
+            item = pending.get(timeout=poll_timeout)
+        except queue.Empty:
+            continue
+        if item is None:
+            return latencies
+        latencies.append(time.perf_counter() - item)
+        await asyncio.sleep(0)
+
+
+async def async_handoff(inputs: int, interval: float) -> List[float]:
+    """Current design: asyncio.Queue fed via call_soon_threadsafe"""
+    loop = asyncio.get_running_loop()
+    pending: asyncio.Queue = asyncio.Queue()
+    
+    def put(item):
+        loop.call_soon_threadsafe(pending.put_nowait, item)
+    
+    threading.Thread(target=producer, args=(put, inputs, interval), daemon=True).start()
+    latencies = []
+    
+    while True:
+        item = await pending.get()
+        if item is None:
+            return latencies
+        latencies.append(time.perf_counter() - item)
+
+
+async def loop_stall(duration: float) -> float:
+    """Worst delay seen by a 10 ms ticker task (how blocked the loop is)"""
+    worst = 0.0
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        worst = max(worst, time.perf_counter() - started - 0.01)
+    return worst
+
+
+async def measure(name: str, design, duration: float):
+    """Run one design alone (latency, CPU) and next to a ticker (loop stall)"""
+    cpu_started = time.process_time()
+    latencies = await design()
+    cpu = time.process_time() - cpu_started
+    _, stall = await asyncio.gather(design(), loop_stall(duration))
+    print(
+        f"{name:<16} p50={percentile(latencies, 50) * 1000:7.2f}ms "
+        f"p95={percentile(latencies, 95) * 1000:7.2f}ms "
+        f"loop_stall={stall * 1000:6.1f}ms cpu={cpu * 1000:6.1f}ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--inputs", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.2)
+    parser.add_argument("--poll-timeout", type=float, default=0.5)
+    args = parser.parse_args()
+    
+    duration = args.inputs * args.interval
+    await measure(
+        "blocking_poll",
+        lambda: blocking_poll(args.inputs, args.interval, args.poll_timeout),
+        duration
+    )
+    await measure(
+        "async_handoff",
+        lambda: async_handoff(args.inputs, args.interval),
+        duration
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+"""
+Server Load Test
+Drives the multi-session server with simulated callers and a fake LLM
+
+Each simulated caller connects, waits for the greeting, then sends a few
+utterances separated by fake "speaking" time (standing in for audio capture
+and recognition) and waits for each reply to finish.
+
+Usage:
+    python -m benchmarks.load_test [--sessions 50] [--concurrency 25] [--turns 3]
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import List
+
+from config import Config, ServerConfig
+from server import TriageServer
+from benchmarks.turn_latency import add_fake_llm_args, fake_llm_config, percentile
+
+
+UTTERANCES = [
+    "My dog has been vomiting since this morning",
+    "He is a five year old labrador",
+    "He also seems really tired and won't eat",
+    "My cat keeps sneezing",
+    "Is it okay to wait until tomorrow?",
+]
+
+
+async def caller(port: int, turns: int, speaking_time: float, first_sentence: List[float], turn_latency: List[float]):
+    """One simulated caller session"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    
+    async def next_event() -> dict:
+        line = await reader.readline()
+        if not line:
+            raise ConnectionError("server closed connection")
+        return json.loads(line)
+    
+    greeting = await next_event()
+    if greeting["type"] != "greeting":
+        writer.close()
+        raise ConnectionError(greeting.get("message", "refused"))
+    
+    for _ in range(turns):
+        # Fake audio: the caller talks, then recognition delivers the text
+        await asyncio.sleep(random.uniform(0.5, 1.5) * speaking_time)
+        
+        started = time.perf_counter()
+        message = {"type": "utterance", "text": random.choice(UTTERANCES)}
+        writer.write(json.dumps(message).encode() + b"\n")
+        await writer.drain()
+        
+        got_sentence = False
+        while True:
+            event = await next_event()
+            if event["type"] == "sentence" and not got_sentence:
+                got_sentence = True
+                first_sentence.append(time.perf_counter() - started)
+            if event["type"] in ("done", "error", "busy"):
+                break
+        turn_latency.append(time.perf_counter() - started)
+    
+    writer.write(b'{"type": "end"}\n')
+    await writer.drain()
+    writer.close()
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=50, help="Total caller sessions")
+    parser.add_argument("--concurrency", type=int, default=25, help="Callers connected at once")
+    parser.add_argument("--turns", type=int, default=3, help="Utterances per session")
+    parser.add_argument("--speaking-time", type=float, default=0.5, help="Mean seconds per fake utterance")
+    parser.add_argument("--max-turns", type=int, default=32, help="Server-wide concurrent turn limit")
+    add_fake_llm_args(parser)
+    args = parser.parse_args()
+    
+    config = Config(
+        llm=fake_llm_config(args),
+        server=ServerConfig(port=0, max_concurrent_turns=args.max_turns)
+    )
+    server = TriageServer(config)
+    port = (await server.start()).sockets[0].getsockname()[1]
+    
+    first_sentence: List[float] = []
+    turn_latency: List[float] = []
+    failures = 0
+    limit = asyncio.Semaphore(args.concurrency)
+    
+    async def one_session():
+        nonlocal failures
+        async with limit:
+            try:
+                await caller(port, args.turns, args.speaking_time, first_sentence, turn_latency)
+            except ConnectionError:
+                failures += 1
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(one_session() for _ in range(args.sessions)))
+    elapsed = time.perf_counter() - started
+    await server.stop()
+    
+    completed = args.sessions - failures
+    print(f"sessions: {completed} completed, {failures} failed in {elapsed:.1f}s")
+    print(f"sessions/sec: {completed / elapsed:.2f}")
+    print(f"turns/sec: {len(turn_latency) / elapsed:.2f}")
+    for name, samples in (("first sentence", first_sentence), ("turn", turn_latency)):
+        if samples:
+            print(
+                f"{name:<15} p50={percentile(samples, 50) * 1000:.0f}ms "
+                f"p95={percentile(samples, 95) * 1000:.0f}ms "
+                f"p99={percentile(samples, 99) * 1000:.0f}ms"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
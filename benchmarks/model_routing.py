@@ -0,0 +1,128 @@
+"""
+Model Routing Benchmark
+Replays scripted calls (symptom reports, short follow-ups, emergencies and
+long descriptions) through two_step turns on offline fake models with
+small / default / large latency and price profiles, and compares one
+model for every step against per-step routing: time to first sentence,
+full turn time, estimated cost and the routing mix.
+
+Usage:
+    python -m benchmarks.model_routing [--calls 20] [--concurrency 4]
+"""
+import argparse
+import asyncio
+import time
+from typing import Dict, List, Tuple
+
+from config.settings import LLMConfig
+from chains import ReasoningChains
+from chains.fake_llm import FakeTriageChatModel
+from models.case_state import CaseState
+from utils import Metrics
+from .turn_latency import percentile
+
+# Model name -> (time to first token ms, tokens per second, USD per 1k tokens)
+PROFILES: Dict[str, Tuple[float, float, float]] = {
+    "small": (150.0, 200.0, 0.0002),
+    "default": (350.0, 80.0, 0.001),
+    "large": (600.0, 50.0, 0.005),
+}
+
+# One call: the caller's utterances in order
+SCRIPT = [
+    "Hi, my dog has been vomiting since this morning and won't eat his breakfast",
+    "He's five",
+    "Yes, he drank some water",
+    "Okay, thanks",
+    (
+        "Also I should mention that yesterday evening we were at the park and he was "
+        "sniffing around a lot near the bins, and he might have eaten something there, "
+        "I am not completely sure, and since then he has been a bit quiet and sleeping more"
+    ),
+    "Wait, now he collapsed and isn't getting up",
+    "Okay",
+    "Thank you so much",
+]
+
+
+def fake_models() -> Dict[str, FakeTriageChatModel]:
+    """One fake chat model per profile, keyed by model name"""
+    return {
+        name: FakeTriageChatModel(ttft_ms=ttft, ttft_jitter_ms=ttft / 5, tokens_per_second=rate, seed=42)
+        for name, (ttft, rate, _) in PROFILES.items()
+    }
+
+
+async def run_calls(config: LLMConfig, calls: int, concurrency: int) -> Tuple[List[float], List[float]]:
+    """
+    Run scripted calls, each with its own case state
+    
+    Returns:
+        (time to first sentence, full turn time) per turn, in seconds
+    """
+    chains = ReasoningChains(config, llm=fake_models()[config.model], llms=fake_models())
+    semaphore = asyncio.Semaphore(concurrency)
+    first_sentence: List[float] = []
+    full_turn: List[float] = []
+    
+    async def one_call():
+        case_state = CaseState()
+        conversation = ""
+        for user_input in SCRIPT:
+            conversation += f"User: {user_input}\n"
+            async with semaphore:
+                started = time.perf_counter()
+                structured, sentences = await chains.analyze_and_stream(
+                    conversation,
+                    user_input,
+                    previous_risk=case_state.latest_risk
+                )
+                spoken = []
+                async for sentence in sentences:
+                    if not spoken:
+                        first_sentence.append(time.perf_counter() - started)
+                    spoken.append(sentence)
+                full_turn.append(time.perf_counter() - started)
+            case_state.merge(structured)
+            conversation += f"Assistant: {' '.join(spoken)}\n"
+    
+    await asyncio.gather(*(one_call() for _ in range(calls)))
+    return first_sentence, full_turn
+
+
+async def measure(name: str, config: LLMConfig, args: argparse.Namespace):
+    """Run one configuration and print latency, cost and routing mix"""
+    Metrics.reset()
+    first_sentence, full_turn = await run_calls(config, args.calls, args.concurrency)
+    counters = Metrics.counters()
+    cost = sum(v for k, v in counters.items() if k.startswith("llm_cost_microusd_")) / 1_000_000
+    calls = {model: counters.get(f"llm_calls_{model}", 0) for model in PROFILES}
+    mix = " ".join(f"{model}={count}" for model, count in calls.items() if count)
+    print(
+        f"{name:<14} first_sentence p50={percentile(first_sentence, 50) * 1000:5.0f}ms "
+        f"p95={percentile(first_sentence, 95) * 1000:5.0f}ms  "
+        f"turn p50={percentile(full_turn, 50) * 1000:5.0f}ms  "
+        f"cost/turn=${cost / len(full_turn):.5f}  llm calls: {mix or '-'}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+    
+    costs = {name: price for name, (_, _, price) in PROFILES.items()}
+    print(f"{args.calls} calls x {len(SCRIPT)} turns, two_step, streamed")
+    for model in ("default", "large"):
+        # Routing on with every tier on one model: same metrics, no routing
+        config = LLMConfig(api_key="offline", backend="fake", model=model,
+                           small_model=model, large_model=model, model_costs=costs)
+        await measure(f"all_{model}", config, args)
+    routed = LLMConfig(api_key="offline", backend="fake", model="default",
+                       small_model="small", large_model="large", model_costs=costs)
+    await measure("routed", routed, args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+"""
+Output Parsing Benchmark
+Feeds the structured analysis in the shapes models actually produce
+(clean, fenced, wrapped in prose, trailing commas, single quotes,
+synonym risk levels, truncated, fields missing) to the strict LangChain
+PydanticOutputParser and to the lenient AnalysisParser, and compares how
+many outputs each turns into an analysis without the safe fallback, and
+the time per parse.
+
+Usage:
+    python -m benchmarks.output_parsing [--repeat 200]
+"""
+import argparse
+import json
+import time
+from typing import Callable, Dict, List
+
+from langchain_core.output_parsers import PydanticOutputParser
+
+from chains.fake_llm import SAMPLE_ANALYSIS
+from chains.output_parser import AnalysisParser, IncompleteAnalysisError
+from models.schemas import HealthOverview
+from .turn_latency import percentile
+
+
+def with_changes(**changes) -> str:
+    """SAMPLE_ANALYSIS as JSON with some top-level values replaced"""
+    return json.dumps({**SAMPLE_ANALYSIS, **changes})
+
+
+def without(key: str) -> str:
+    """SAMPLE_ANALYSIS as JSON with one field left out"""
+    return json.dumps({k: v for k, v in SAMPLE_ANALYSIS.items() if k != key})
+
+
+def build_corpus() -> Dict[str, str]:
+    """Label -> model output"""
+    clean = json.dumps(SAMPLE_ANALYSIS)
+    pretty = json.dumps(SAMPLE_ANALYSIS, indent=2)
+    corpus = {
+        "clean": clean,
+        "clean, indented": pretty,
+        "code fence": f"```json\n{pretty}\n```",
+        "prose around": f"Here is the assessment:\n{pretty}\nLet me know if you need more.",
+        "trailing commas": pretty.replace('"\n', '",\n').replace("]\n", "],\n").replace("}\n", "},\n"),
+        "single quotes, Python literals": str(SAMPLE_ANALYSIS),
+        "missing comma": clean.replace(', "risk_level"', ' "risk_level"'),
+        "raw newline in string": clean.replace("since this morning", "since\nthis morning"),
+        "risk 'Moderate'": with_changes(risk_level="Moderate"),
+        "risk 'medium'": with_changes(risk_level="medium"),
+        "risk 'high risk'": with_changes(risk_level="high risk"),
+        "risk 'Critical'": with_changes(risk_level="Critical"),
+        "list field as string": with_changes(safety_flags="Not a substitute for a vet"),
+        "missing requires_vet": without("requires_vet"),
+        "missing risk_level": without("risk_level"),
+    }
+    # Cut off mid-output (token limit, dropped stream)
+    for fraction in (0.5, 0.7, 0.9, 0.97):
+        corpus[f"truncated at {fraction:.0%}"] = clean[:int(len(clean) * fraction)]
+    return corpus
+
+
+def time_calls(fn: Callable[[str], object], text: str, repeat: int) -> List[float]:
+    """Per-call microseconds of fn(text), exceptions included"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        try:
+            fn(text)
+        except Exception:
+            pass
+        samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=200, help="Parses per output for timing")
+    args = parser.parse_args()
+    
+    strict = PydanticOutputParser(pydantic_object=HealthOverview)
+    lenient = AnalysisParser()
+    corpus = build_corpus()
+    
+    print(f"{'output':<32} {'strict':<8} {'lenient':<22} {'strict µs':>9} {'lenient µs':>10}")
+    totals = {"strict": 0, "parsed": 0, "partial": 0}
+    strict_samples: List[float] = []
+    lenient_samples: List[float] = []
+    for label, text in corpus.items():
+        try:
+            strict.parse(text)
+            strict_ok = "ok"
+            totals["strict"] += 1
+        except Exception:
+            strict_ok = "fallback"
+        
+        try:
+            lenient.parse(text)
+            lenient_ok = "ok"
+            totals["parsed"] += 1
+        except IncompleteAnalysisError as e:
+            lenient_ok = f"re-prompt {len(e.missing)} field(s)"
+            totals["partial"] += 1
+        except Exception:
+            lenient_ok = "fallback"
+        
+        strict_us = percentile(time_calls(strict.parse, text, args.repeat), 50)
+        lenient_us = percentile(time_calls(lenient.parse, text, args.repeat), 50)
+        strict_samples.append(strict_us)
+        lenient_samples.append(lenient_us)
+        print(f"{label:<32} {strict_ok:<8} {lenient_ok:<22} {strict_us:9.1f} {lenient_us:10.1f}")
+    
+    count = len(corpus)
+    print(f"\nstrict:  {totals['strict']}/{count} parsed, the rest fall back to the safe reply")
+    print(
+        f"lenient: {totals['parsed']}/{count} parsed, {totals['partial']}/{count} completed by "
+        f"re-prompting only the missing fields, {count - totals['parsed'] - totals['partial']} fall back"
+    )
+    print(
+        f"median µs per parse over outputs: strict {percentile(strict_samples, 50):.1f}, "
+        f"lenient {percentile(lenient_samples, 50):.1f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Prompt Overhead Benchmark
+Measures the per-turn CPU cost of building prompts and parsing the
+structured analysis, separate from any network or model time. Compares
+the old per-call path (format instructions rendered on every invocation,
+full template formatting) with the precomputed chains.
+
+Usage:
+    python -m benchmarks.prompt_overhead [--turns 500]
+"""
+import argparse
+import json
+import time
+from typing import Callable, List
+
+from langchain_core.output_parsers import PydanticOutputParser
+
+from chains import ReasoningChains
+from chains.fake_llm import SAMPLE_ANALYSIS
+from chains.output_parser import AnalysisParser
+from config.prompts import PromptTemplates
+from models.schemas import HealthOverview
+from .turn_latency import percentile
+
+CONVERSATION = (
+    "User: my dog has been vomiting since this morning\n"
+    "Assistant: I'm sorry to hear that. How many times has he vomited?\n"
+    "User: three times, and he won't eat"
+)
+USER_INPUT = "he also seems tired and is drinking a lot of water"
+
+
+def time_calls(fn: Callable[[], object], turns: int) -> List[float]:
+    """Run fn once per turn and return per-call microseconds"""
+    fn()  # warm-up
+    samples = []
+    for _ in range(turns):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def report(label: str, samples: List[float]):
+    print(
+        f"{label:<38} p50 {percentile(samples, 50):8.1f} µs  "
+        f"p95 {percentile(samples, 95):8.1f} µs"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=500)
+    args = parser.parse_args()
+    
+    reasoning_parser = PydanticOutputParser(pydantic_object=HealthOverview)
+    
+    reasoning_prompt = PromptTemplates.get_reasoning_prompt()
+    response_prompt = PromptTemplates.get_conversational_prompt()
+    frozen_reasoning = ReasoningChains._freeze_prefix(
+        reasoning_prompt,
+        format_instructions=reasoning_parser.get_format_instructions()
+    )
+    frozen_response = ReasoningChains._freeze_prefix(response_prompt)
+    
+    inputs = {"conversation": CONVERSATION, "user_input": USER_INPUT}
+    analysis_json = json.dumps(SAMPLE_ANALYSIS, indent=2)
+    response_inputs = {"structured_analysis": analysis_json, "user_input": USER_INPUT}
+    
+    print(f"turns: {args.turns}")
+    report("format instructions (per call)", time_calls(
+        reasoning_parser.get_format_instructions, args.turns
+    ))
+    report("reasoning prompt, old path", time_calls(
+        lambda: reasoning_prompt.invoke({
+            **inputs,
+            "format_instructions": reasoning_parser.get_format_instructions()
+        }),
+        args.turns
+    ))
+    report("reasoning prompt, frozen prefix", time_calls(
+        lambda: frozen_reasoning.invoke(inputs), args.turns
+    ))
+    report("response prompt, frozen prefix", time_calls(
+        lambda: frozen_response.invoke(response_inputs), args.turns
+    ))
+    report("parse structured analysis, LangChain", time_calls(
+        lambda: reasoning_parser.parse(analysis_json), args.turns
+    ))
+    analysis_parser = AnalysisParser()
+    report("parse structured analysis, lenient", time_calls(
+        lambda: analysis_parser.parse(analysis_json), args.turns
+    ))
+    
+    system = frozen_reasoning.invoke(inputs).to_messages()[0].content
+    print(f"stable system prefix: {len(system)} chars")
+
+
+if __name__ == "__main__":
+    main()
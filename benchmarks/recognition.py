@@ -0,0 +1,157 @@
+"""
+Recognition Benchmark
+Drives SpeechRecognizer from a generated WAV file with the transcript
+engine: no microphone, network or model. Reports first-partial and final
+transcript latency per utterance (real-time pacing) and raw capture
+throughput (unpaced).
+
+Usage:
+    python -m benchmarks.recognition [--utterances 8] [--engine transcript]
+        [--model PATH]
+"""
+import argparse
+import math
+import os
+import random
+import struct
+import tempfile
+import threading
+import time
+import wave
+from typing import List, Tuple
+
+from config.settings import VoiceConfig
+from utils import Metrics
+from Voice.speech_recognition import SpeechRecognizer
+from .turn_latency import percentile
+
+SAMPLE_RATE = 16000
+
+PHRASES = [
+    "my dog has been vomiting since this morning",
+    "he is not eating and seems tired",
+    "she ate some chocolate an hour ago",
+    "my cat is breathing fast",
+    "there is blood in his stool",
+    "he keeps scratching his ear",
+]
+
+
+def write_test_audio(path: str, utterances: int, words_per_second: float) -> List[Tuple[float, float]]:
+    """
+    Write a WAV of voiced tone bursts separated by room noise, plus the
+    matching transcript next to it
+    
+    Returns:
+        (start, end) audio time of each utterance in seconds
+    """
+    rng = random.Random(7)
+    samples: List[int] = []
+    spans = []
+    lines = []
+    
+    def noise(seconds: float):
+        samples.extend(int(rng.gauss(0, 80)) for _ in range(int(seconds * SAMPLE_RATE)))
+    
+    noise(1.0)
+    for i in range(utterances):
+        phrase = PHRASES[i % len(PHRASES)]
+        duration = len(phrase.split()) / words_per_second
+        start = len(samples) / SAMPLE_RATE
+        pitch = 140 + 40 * (i % 3)
+        samples.extend(
+            int(3000 * math.sin(2 * math.pi * pitch * n / SAMPLE_RATE) + rng.gauss(0, 80))
+            for n in range(int(duration * SAMPLE_RATE))
+        )
+        spans.append((start, start + duration))
+        lines.append(phrase)
+        noise(1.5)
+    
+    with wave.open(path, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(struct.pack(f"<{len(samples)}h", *samples))
+    
+    with open(os.path.splitext(path)[0] + ".txt", "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    
+    return spans
+
+
+def run(config: VoiceConfig) -> Tuple[List[Tuple[float, str]], List[Tuple[float, str]], float]:
+    """
+    Listen to the whole input file
+    
+    Returns:
+        (partials, finals, wall seconds) with events as (seconds since start, text)
+    """
+    recognizer = SpeechRecognizer(config)
+    partials: List[Tuple[float, str]] = []
+    finals: List[Tuple[float, str]] = []
+    started = time.perf_counter()
+    
+    recognizer.listen_streaming(
+        callback=lambda text: finals.append((time.perf_counter() - started, text)),
+        stop_event=threading.Event(),
+        partial_callback=lambda text: partials.append((time.perf_counter() - started, text))
+    )
+    return partials, finals, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--utterances", type=int, default=8)
+    parser.add_argument("--words-per-second", type=float, default=2.5)
+    parser.add_argument("--engine", choices=("transcript", "vosk"), default="transcript")
+    parser.add_argument("--model", help="Vosk model directory (for --engine vosk)")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "speech.wav")
+        spans = write_test_audio(path, args.utterances, args.words_per_second)
+        audio_seconds = spans[-1][1] + 1.5
+        
+        config = VoiceConfig(
+            recognition_engine=args.engine,
+            recognition_model_path=args.model,
+            recognition_input_file=path
+        )
+        
+        # Real-time pacing: latency relative to where speech is in the audio
+        partials, finals, _ = run(config)
+        first_partial, final = [], []
+        for start, end in spans:
+            heard = [t for t, _ in partials if t >= start]
+            if heard:
+                first_partial.append(heard[0] - start)
+            done = [t for t, _ in finals if t >= end]
+            if done:
+                final.append(done[0] - end)
+        
+        print(f"utterances: {len(spans)}  finals: {len(finals)}  partials: {len(partials)}")
+        if first_partial:
+            print(
+                f"first partial after speech onset  "
+                f"p50 {percentile(first_partial, 50) * 1000:.0f} ms  "
+                f"p95 {percentile(first_partial, 95) * 1000:.0f} ms"
+            )
+        if final:
+            print(
+                f"final transcript after speech end "
+                f"p50 {percentile(final, 50) * 1000:.0f} ms  "
+                f"p95 {percentile(final, 95) * 1000:.0f} ms"
+            )
+        
+        # Unpaced: how fast capture + VAD + engine chew through audio
+        Metrics.reset()
+        config.recognition_realtime = False
+        _, finals, wall = run(config)
+        print(
+            f"throughput: {audio_seconds / wall:.0f}x real time "
+            f"({audio_seconds:.1f}s audio in {wall * 1000:.0f} ms, {len(finals)} finals)"
+        )
+
+
+if __name__ == "__main__":
+    main()
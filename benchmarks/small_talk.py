@@ -0,0 +1,110 @@
+"""
+Small-Talk Classifier Benchmark
+Checks intent accuracy on labelled small talk, that no utterance with
+symptom content is intercepted (the emergency corpus plus ordinary
+symptom reports), and the time per classification against a budget
+
+Usage:
+    python -m benchmarks.small_talk [--repeat 2000] [--budget-us 20]
+"""
+import argparse
+import json
+import sys
+import time
+
+from chains import SmallTalkClassifier
+from .emergency_matcher import DEFAULT_CORPUS
+
+# Utterance -> expected intent
+LABELLED = {
+    "okay": "acknowledge",
+    "Okay, got it.": "acknowledge",
+    "yeah": "acknowledge",
+    "alright": "acknowledge",
+    "sounds good": "acknowledge",
+    "thanks": "thanks",
+    "Thank you so much!": "thanks",
+    "okay, thank you": "thanks",
+    "thanks for your help": "thanks",
+    "can you repeat that?": "repeat",
+    "Sorry, what?": "repeat",
+    "could you say that again please": "repeat",
+    "I didn't catch that": "repeat",
+    "pardon?": "repeat",
+    "hold on": "hold",
+    "hang on a second": "hold",
+    "just a moment": "hold",
+    "wait": "hold",
+    "let me check": "hold",
+    "bye": "goodbye",
+    "okay, bye!": "goodbye",
+    "that's all, thanks": "goodbye",
+    "have a good day": "goodbye",
+}
+
+# Must reach the LLM: content, or only fillers
+NOT_SMALL_TALK = [
+    "okay but he's still limping",
+    "thanks, she also threw up twice",
+    "yes he is drinking water",
+    "no",
+    "no, he hasn't eaten",
+    "wait, he just collapsed",
+    "what should I feed him",
+    "he's fine now",
+    "good boy",
+    "um",
+    "she has been coughing since yesterday",
+    "my cat keeps sneezing",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=2000, help="Passes over all utterances for timing")
+    parser.add_argument("--budget-us", type=float, default=20.0, help="Fail if a classification is slower on average")
+    args = parser.parse_args()
+    
+    with open(DEFAULT_CORPUS, encoding="utf-8") as f:
+        symptoms = [json.loads(line)["text"] for line in f if line.strip()] + NOT_SMALL_TALK
+    
+    started = time.perf_counter()
+    classifier = SmallTalkClassifier()
+    compile_ms = (time.perf_counter() - started) * 1000
+    
+    correct = 0
+    for text, expected in LABELLED.items():
+        intent = classifier.classify(text)
+        if intent == expected:
+            correct += 1
+        else:
+            print(f"  wrong intent: {text!r} -> {intent} (expected {expected})")
+    
+    swallowed = [text for text in symptoms if classifier.classify(text) is not None]
+    for text in swallowed:
+        print(f"  intercepted content: {text!r} -> {classifier.classify(text)}")
+    
+    # After a question, answers ("yes", "okay") must go to the LLM
+    answers = [t for t, intent in LABELLED.items() if intent == "acknowledge"]
+    answered = [t for t in answers if classifier.classify(t, question_pending=True) is not None]
+    
+    texts = list(LABELLED) + symptoms
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        for text in texts:
+            classifier.classify(text)
+    per_call_us = (time.perf_counter() - started) / (args.repeat * len(texts)) * 1e6
+    
+    print(f"intent accuracy: {correct}/{len(LABELLED)}")
+    print(f"content intercepted: {len(swallowed)}/{len(symptoms)}")
+    print(f"answers intercepted after a question: {len(answered)}/{len(answers)}")
+    print(f"compile: {compile_ms:.1f} ms")
+    print(f"classify: {per_call_us:.1f} µs each")
+    
+    if swallowed or answered or per_call_us > args.budget_us:
+        print("❌ Small-talk fast path check failed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+Startup Benchmark
+Measures import time per package and time-to-ready, each in a fresh
+interpreter so nothing is already cached in sys.modules.
+
+Import time also lists which heavy dependencies an import pulled in;
+`--budget-ms` makes the run fail when any import exceeds the budget, so
+an eager import creeping back into a package `__init__` is caught.
+Time-to-ready compares the sequential startup (calibrate, then build the
+LLM client and chains) with fast_start (both at once); calibration is
+simulated with a sleep of ambient_noise_duration, as there may be no
+microphone. This models calibrate_during_greeting; by default the agent
+calibrates after the greeting, which adds the greeting's remaining
+playback time.
+
+Usage:
+    python -m benchmarks.startup [--runs 5] [--budget-ms 0]
+        [--calibration-ms 2000]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import List, Tuple
+
+from config.settings import VoiceConfig
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("langchain_core", "langchain_community", "gtts", "pydub", "speech_recognition")
+
+IMPORT_TARGETS = [
+    "config",
+    "utils",
+    "models",
+    "chains",
+    "Voice",
+    "from config import Config",
+    "from utils import Logger, Metrics",
+    "from chains import ReasoningChains",
+    "from Voice import VoiceManager",
+    "session",
+    "server",
+]
+
+IMPORT_SCRIPT = """
+import sys, time
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(elapsed, ",".join(heavy))
+"""
+
+READY_SCRIPT = """
+import asyncio, sys, time
+started = time.perf_counter()
+from config.settings import LLMConfig
+from chains import ReasoningChains
+from Voice import TextToSpeech
+
+fast_start = sys.argv[1] == "fast"
+calibration = float(sys.argv[2])
+chains = ReasoningChains(LLMConfig(api_key="offline", backend="fake"))
+
+def calibrate():
+    time.sleep(calibration)
+
+async def get_ready():
+    if fast_start:
+        await asyncio.gather(asyncio.to_thread(calibrate), chains.warm_up())
+    else:
+        calibrate()
+        chains.prepare()
+
+asyncio.run(get_ready())
+print(time.perf_counter() - started)
+"""
+
+
+def run_python(script: str, *args: str) -> str:
+    """Run a script in a fresh interpreter from the repo root, returning stdout"""
+    result = subprocess.run(
+        [sys.executable, "-c", script, *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return result.stdout.strip().splitlines()[-1]
+
+
+def time_import(target: str, runs: int) -> Tuple[float, str]:
+    """Median import time in seconds and the heavy modules it loaded"""
+    statement = target if " " in target else f"import {target}"
+    samples: List[float] = []
+    heavy = ""
+    for _ in range(runs):
+        elapsed, _, heavy = run_python(
+            IMPORT_SCRIPT.format(statement=statement, heavy=HEAVY_MODULES)
+        ).partition(" ")
+        samples.append(float(elapsed))
+    return statistics.median(samples), heavy
+
+
+def time_to_ready(mode: str, calibration: float, runs: int) -> float:
+    """Median seconds from interpreter start of the imports to ready"""
+    return statistics.median(
+        float(run_python(READY_SCRIPT, mode, str(calibration))) for _ in range(runs)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=0, help="Fail if any import is slower (0: no check)")
+    parser.add_argument(
+        "--calibration-ms",
+        type=float,
+        default=VoiceConfig().ambient_noise_duration * 1000,
+        help="Simulated microphone calibration"
+    )
+    args = parser.parse_args()
+    
+    print("Import time (fresh interpreter, median):")
+    over_budget = []
+    for target in IMPORT_TARGETS:
+        elapsed, heavy = time_import(target, args.runs)
+        print(f"  {target:<36} {elapsed * 1000:7.1f}ms  loads: {heavy or '-'}")
+        if args.budget_ms and elapsed * 1000 > args.budget_ms:
+            over_budget.append(target)
+    
+    print("\nTime to ready (imports + calibration + LLM client and chains):")
+    calibration = args.calibration_ms / 1000
+    for mode in ("sequential", "fast"):
+        elapsed = time_to_ready(mode, calibration, args.runs)
+        print(f"  {mode:<12} {elapsed * 1000:7.0f}ms")
+    
+    if over_budget:
+        print(f"\n❌ Over the {args.budget_ms:.0f}ms import budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Turn Latency Benchmark
+Compares two_step, combined and pipelined chain modes on the offline fake model
+
+Usage:
+    python -m benchmarks.turn_latency [--turns 50] [--concurrency 4]
+        [--ttft-ms 350] [--distribution gaussian] [--tokens-per-second 80]
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+from config.settings import LLMConfig
+from chains import ReasoningChains
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of samples"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def fake_llm_config(args: argparse.Namespace, **overrides) -> LLMConfig:
+    """Build an LLMConfig for the offline fake backend from CLI args"""
+    return LLMConfig(
+        api_key="offline",
+        backend="fake",
+        fake_ttft_ms=args.ttft_ms,
+        fake_latency_distribution=args.distribution,
+        fake_tokens_per_second=args.tokens_per_second,
+        fake_seed=42,
+        **overrides
+    )
+
+
+def add_fake_llm_args(parser: argparse.ArgumentParser):
+    """Add fake backend latency options to a benchmark CLI"""
+    parser.add_argument("--ttft-ms", type=float, default=350.0, help="Mean time to first token")
+    parser.add_argument(
+        "--distribution",
+        choices=("fixed", "gaussian", "lognormal"),
+        default="gaussian",
+        help="Time-to-first-token distribution"
+    )
+    parser.add_argument("--tokens-per-second", type=float, default=80.0, help="Streaming rate")
+
+
+async def run_mode(config: LLMConfig, turns: int, concurrency: int, streaming: bool) -> List[float]:
+    """
+    Run turns through one chain mode
+    
+    Returns:
+        Per-turn latencies in seconds (to full response, or to first
+        sentence when streaming)
+    """
+    chains = ReasoningChains(config)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    
+    async def one_turn():
+        async with semaphore:
+            started = time.perf_counter()
+            if streaming:
+                _, sentences = await chains.analyze_and_stream("", "My dog keeps vomiting")
+                async for _ in sentences:
+                    latencies.append(time.perf_counter() - started)
+                    break
+                await sentences.aclose()
+            else:
+                await chains.analyze_and_respond("", "My dog keeps vomiting")
+                latencies.append(time.perf_counter() - started)
+    
+    await asyncio.gather(*(one_turn() for _ in range(turns)))
+    return latencies
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=4)
+    add_fake_llm_args(parser)
+    args = parser.parse_args()
+    
+    print(f"{'mode':<10} {'measure':<16} {'p50 ms':>8} {'p95 ms':>8}")
+    for mode in ("two_step", "combined", "pipelined"):
+        for streaming, label in ((False, "full response"), (True, "first sentence")):
+            config = fake_llm_config(args, chain_mode=mode)
+            latencies = await run_mode(config, args.turns, args.concurrency, streaming)
+            print(
+                f"{mode:<10} {label:<16} "
+                f"{percentile(latencies, 50) * 1000:>8.0f} "
+                f"{percentile(latencies, 95) * 1000:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
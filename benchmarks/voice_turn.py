@@ -0,0 +1,103 @@
+"""
+Voice Turn Benchmark
+Runs analyze -> stream -> speak end to end offline: fake LLM, simulated
+synthesis and a real-time null audio sink. Reports time to first audio and
+interrupt-to-silence latency for several playback block sizes.
+
+Usage:
+    python -m benchmarks.voice_turn [--turns 10] [--synthesis-ms 150]
+        [--interrupt-after-ms 400] [--ttft-ms 350] [--tokens-per-second 80]
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from pydub import AudioSegment
+from pydub.generators import Sine
+
+from config.settings import VoiceConfig
+from chains import ReasoningChains
+from utils import Metrics
+from Voice import TextToSpeech
+from Voice.playback import NullSink
+from .turn_latency import add_fake_llm_args, fake_llm_config
+
+
+class OfflineTextToSpeech(TextToSpeech):
+    """TextToSpeech with gTTS replaced by a fixed-latency tone generator"""
+    
+    def __init__(self, config: VoiceConfig, synthesis_ms: float):
+        super().__init__(config, sink=NullSink(realtime=True))
+        self.synthesis_ms = synthesis_ms
+    
+    def _synthesize(self, text: str) -> AudioSegment:
+        started = time.perf_counter()
+        time.sleep(self.synthesis_ms / 1000)
+        # Roughly speaking pace: 60 ms per character
+        audio = Sine(440).to_audio_segment(duration=len(text) * 60)
+        Metrics.record("tts_synthesis", time.perf_counter() - started)
+        return audio
+
+
+def _first_audio_count() -> int:
+    """Number of time_to_first_audio samples recorded so far"""
+    timing = Metrics.summary()["timings"].get("time_to_first_audio")
+    return timing["count"] if timing else 0
+
+
+async def run_turns(
+    chains: ReasoningChains,
+    tts: OfflineTextToSpeech,
+    turns: int,
+    interrupt_after_ms: float
+):
+    """Speak a streamed reply per turn, then barge in after a random delay"""
+    rng = random.Random(42)
+    for turn in range(turns):
+        tts.begin_turn()
+        _, sentences = await chains.analyze_and_stream(
+            "",
+            "My dog keeps vomiting",
+            min_sentence_length=tts.config.min_sentence_length
+        )
+        async for sentence in sentences:
+            tts.speak(sentence)
+        
+        # Let the first audio start, then interrupt mid-reply
+        while _first_audio_count() <= turn and tts.is_currently_speaking():
+            await asyncio.sleep(0.005)
+        await asyncio.sleep(rng.uniform(0, 2 * interrupt_after_ms) / 1000)
+        await asyncio.to_thread(tts.interrupt)
+        await asyncio.to_thread(tts.wait_until_finished, 5.0)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--synthesis-ms", type=float, default=150.0, help="Simulated TTS latency")
+    parser.add_argument("--interrupt-after-ms", type=float, default=400.0, help="Mean barge-in delay after first audio")
+    add_fake_llm_args(parser)
+    args = parser.parse_args()
+    
+    chains = ReasoningChains(fake_llm_config(args, chain_mode="combined"))
+    
+    print(f"{'block ms':>8} {'first audio p50':>16} {'p95':>8} {'silence p50':>12} {'p95':>8}")
+    for block_ms in (20, 100, 500):
+        Metrics.reset()
+        config = VoiceConfig(playback_block_ms=block_ms, audio_cache_dir=None)
+        tts = OfflineTextToSpeech(config, args.synthesis_ms)
+        await run_turns(chains, tts, args.turns, args.interrupt_after_ms)
+        tts.close()
+        
+        print(
+            f"{block_ms:>8} "
+            f"{Metrics.percentile('time_to_first_audio', 50) * 1000:>13.0f} ms "
+            f"{Metrics.percentile('time_to_first_audio', 95) * 1000:>5.0f} ms "
+            f"{Metrics.percentile('interrupt_to_silence', 50) * 1000:>9.1f} ms "
+            f"{Metrics.percentile('interrupt_to_silence', 95) * 1000:>5.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,4 +1,22 @@
 """Chains package - exports LangChain reasoning chains"""
-from .reasoning import ReasoningChains
+from typing import TYPE_CHECKING
 
-__all__ = ['ReasoningChains']
+from utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .reasoning import ReasoningChains
+    from .cache import ResponseCache
+    from .emergency import EmergencyMatcher
+    from .router import ModelRouter
+    from .small_talk import SmallTalkClassifier
+    from .output_parser import AnalysisParser
+
+# Export name -> defining module, loaded on first use (utils/lazy.py)
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    'ReasoningChains': '.reasoning',
+    'ResponseCache': '.cache',
+    'EmergencyMatcher': '.emergency',
+    'ModelRouter': '.router',
+    'SmallTalkClassifier': '.small_talk',
+    'AnalysisParser': '.output_parser',
+})
@@ -0,0 +1,54 @@
+"""
+LLM Backends
+Builds the chat model selected by LLMConfig.backend
+"""
+from typing import TYPE_CHECKING, Optional
+
+from config.settings import LLMConfig
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
+
+def create_chat_model(config: LLMConfig, share_with: Optional['BaseChatModel'] = None) -> 'BaseChatModel':
+    """
+    Create the chat model for the configured backend
+    
+    Args:
+        config: LLM configuration settings
+        share_with: Model already built for this backend (e.g. for another
+            model name) whose HTTP connection pool the new one reuses
+            
+    Returns:
+        LangChain chat model
+        
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if config.backend == "perplexity" and config.http_pool:
+        from .perplexity import PooledPerplexityChat
+        
+        return PooledPerplexityChat(config=config, pool=getattr(share_with, "pool", None))
+    
+    if config.backend == "perplexity":
+        from langchain_community.chat_models import ChatPerplexity
+        
+        return ChatPerplexity(
+            pplx_api_key=config.api_key,
+            model=config.model,
+            temperature=config.temperature,
+            streaming=config.streaming
+        )
+    
+    if config.backend == "fake":
+        from .fake_llm import FakeTriageChatModel
+        
+        return FakeTriageChatModel(
+            ttft_ms=config.fake_ttft_ms,
+            ttft_jitter_ms=config.fake_ttft_jitter_ms,
+            latency_distribution=config.fake_latency_distribution,
+            tokens_per_second=config.fake_tokens_per_second,
+            seed=config.fake_seed
+        )
+    
+    raise ValueError(f"Unknown LLM backend: {config.backend}")
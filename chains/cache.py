@@ -0,0 +1,216 @@
+"""
+Response Cache
+Caches analyze_and_respond results for repeated symptom descriptions
+"""
+import hashlib
+import math
+import re
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from config.settings import CacheConfig
+from models.schemas import HealthOverview
+from utils.metrics import Metrics
+
+
+# Words whose presence or absence flips meaning ("ate" vs "didn't eat")
+_NEGATIONS = frozenset({"no", "not", "never", "without", "isnt", "doesnt", "didnt", "wont", "cant", "hasnt", "havent"})
+
+# Function words that may differ between two descriptions of the same
+# complaint; every other word (symptoms, severity, body parts) must match
+_FUNCTION_WORDS = frozenset({
+    "a", "an", "the", "my", "our", "his", "her", "its", "their", "he", "she", "it", "they",
+    "i", "we", "you", "me", "him", "them", "is", "are", "was", "were", "be", "been", "being",
+    "has", "have", "had", "hes", "shes", "theyre", "im", "ive", "do", "does", "did",
+    "and", "or", "but", "so", "of", "to", "in", "on", "at", "for", "with", "from", "since",
+    "this", "that", "these", "those", "just", "really", "very", "keeps", "kept", "still",
+    "some", "any", "all", "also", "too", "like", "um", "uh", "well", "oh", "please",
+})
+
+
+@dataclass
+class CacheEntry:
+    """One cached turn result"""
+    structured: HealthOverview
+    response: str
+    context_digest: str
+    normalized_input: str
+    vector: Dict[str, int]
+    guard: tuple  # Negations, numbers and content words that must match exactly
+    created_at: float
+    compute_seconds: float  # LLM time the entry saves on each hit
+
+
+class ResponseCache:
+    """
+    Two-tier LRU cache with TTL
+    
+    Tier 1 matches normalized input exactly; tier 2 (off unless
+    similarity_threshold < 1.0) matches character n-gram vectors by cosine
+    similarity, and only between inputs with the same negations, numbers
+    and content words: "vomiting" vs "vomiting blood" or "sneezing" vs
+    "wheezing" score above 0.9 but are different complaints. Both tiers
+    only match entries with the same recent-context digest.
+    """
+    
+    def __init__(self, config: CacheConfig):
+        """
+        Initialize cache
+        
+        Args:
+            config: Cache configuration settings
+        """
+        self.config = config
+        self._entries: "OrderedDict[tuple, CacheEntry]" = OrderedDict()
+    
+    def get(self, conversation: str, user_input: str) -> Optional[CacheEntry]:
+        """
+        Look up a cached result
+        
+        Args:
+            conversation: Full conversation history (including user_input)
+            user_input: Latest user message
+            
+        Returns:
+            Matching entry, or None on miss
+        """
+        digest = self._context_digest(conversation, user_input)
+        normalized = self._normalize(user_input)
+        now = time.monotonic()
+        
+        entry = self._entries.get((digest, normalized))
+        if entry is not None and self._is_fresh(entry, now):
+            self._entries.move_to_end((digest, normalized))
+            self._record_hit("exact", entry)
+            return entry
+        
+        if self.config.similarity_threshold < 1.0:
+            entry = self._find_similar(digest, normalized, now)
+            if entry is not None:
+                self._record_hit("similar", entry)
+                return entry
+        
+        Metrics.increment("cache_misses")
+        return None
+    
+    def put(
+        self,
+        conversation: str,
+        user_input: str,
+        structured: HealthOverview,
+        response: str,
+        compute_seconds: float
+    ):
+        """
+        Store a result
+        
+        Args:
+            conversation: Full conversation history (including user_input)
+            user_input: Latest user message
+            structured: Structured analysis to cache
+            response: Conversational response to cache
+            compute_seconds: Time it took to compute the result
+        """
+        digest = self._context_digest(conversation, user_input)
+        normalized = self._normalize(user_input)
+        key = (digest, normalized)
+        
+        self._entries[key] = CacheEntry(
+            structured=structured,
+            response=response,
+            context_digest=digest,
+            normalized_input=normalized,
+            vector=self._vectorize(normalized),
+            guard=self._guard(normalized),
+            created_at=time.monotonic(),
+            compute_seconds=compute_seconds
+        )
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+            Metrics.increment("cache_evictions")
+    
+    def clear(self):
+        """Remove all entries"""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        """Number of cached entries"""
+        return len(self._entries)
+    
+    def _find_similar(self, digest: str, normalized: str, now: float) -> Optional[CacheEntry]:
+        """Best entry above the similarity threshold with the same context"""
+        vector = self._vectorize(normalized)
+        guard = self._guard(normalized)
+        best_key, best_score = None, self.config.similarity_threshold
+        
+        for key, entry in list(self._entries.items()):
+            if not self._is_fresh(entry, now):
+                del self._entries[key]
+                continue
+            if entry.context_digest != digest or entry.guard != guard:
+                continue
+            
+            score = self._cosine(vector, entry.vector)
+            if score >= best_score:
+                best_key, best_score = key, score
+        
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key]
+    
+    def _is_fresh(self, entry: CacheEntry, now: float) -> bool:
+        """Check entry against the TTL"""
+        return now - entry.created_at <= self.config.ttl_seconds
+    
+    def _record_hit(self, tier: str, entry: CacheEntry):
+        """Update hit counters and latency saved"""
+        Metrics.increment(f"cache_hits_{tier}")
+        Metrics.record("cache_latency_saved", entry.compute_seconds)
+    
+    def _context_digest(self, conversation: str, user_input: str) -> str:
+        """Digest of the last few history lines before the latest user message"""
+        lines = [line for line in conversation.splitlines() if line.strip()]
+        if lines and lines[-1] == f"User: {user_input}":
+            lines = lines[:-1]
+        
+        recent = lines[-self.config.context_messages:] if self.config.context_messages > 0 else []
+        normalized = "\n".join(self._normalize(line) for line in recent)
+        return hashlib.sha1(normalized.encode()).hexdigest()
+    
+    @staticmethod
+    def _normalize(text: str) -> str:
+        """Lowercase, drop punctuation/apostrophes and collapse whitespace"""
+        text = text.lower().replace("'", "").replace("’", "")
+        text = re.sub(r"[^a-z0-9]+", " ", text)
+        return text.strip()
+    
+    @staticmethod
+    def _vectorize(normalized: str) -> Dict[str, int]:
+        """Character trigram counts with word boundary markers"""
+        padded = f" {normalized} "
+        return Counter(padded[i:i + 3] for i in range(len(padded) - 2))
+    
+    @staticmethod
+    def _guard(normalized: str) -> tuple:
+        """Negations, numbers and content words, which similarity alone must not paper over"""
+        words = normalized.split()
+        return (
+            tuple(sorted({w for w in words if w in _NEGATIONS})),
+            tuple(sorted({w for w in words if w.isdigit()})),
+            tuple(sorted({w for w in words if w not in _FUNCTION_WORDS and w not in _NEGATIONS}))
+        )
+    
+    @staticmethod
+    def _cosine(a: Dict[str, int], b: Dict[str, int]) -> float:
+        """Cosine similarity of two sparse count vectors"""
+        if not a or not b:
+            return 0.0
+        dot = sum(count * b.get(gram, 0) for gram, count in a.items())
+        norm_a = math.sqrt(sum(c * c for c in a.values()))
+        norm_b = math.sqrt(sum(c * c for c in b.values()))
+        return dot / (norm_a * norm_b)
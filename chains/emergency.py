@@ -0,0 +1,223 @@
+"""
+Emergency Matcher
+Precompiled keyword triage that flags emergencies without an LLM call
+"""
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Pattern
+
+from models.schemas import HealthOverview, SymptomAnalysis
+
+
+# Curated lexicon: category -> regex alternatives (synonyms and inflections).
+# Patterns are matched case-insensitively on word boundaries. Ambiguous
+# words need present-tense or severity context ("is choking", not
+# "choked"; "was poisoned", not "poison"), since a match skips the LLM.
+EMERGENCY_LEXICON: Dict[str, List[str]] = {
+    "breathing": [
+        r"(?:not|isn'?t|wasn'?t|stopped|stops) breathing",
+        r"(?:can'?t|cannot|can not|struggling to|fighting to|trouble|difficulty|hard time) breath(?:e|ing)",
+        r"gasping(?: for air)?",
+        r"(?:is|'s|are|keeps|kept|still|started|been|was) choking",
+        r"choking (?:on|and)",
+        r"(?:blue|purple|grey|gray|white) (?:gums|tongue|lips)",
+        r"(?:gums|tongue|lips) (?:look|looks|are|is|turning|turned|went) (?:blue|purple|grey|gray|white)",
+    ],
+    "poisoning": [
+        r"(?:ate|eaten|eat|swallowed|licked|chewed|drank|drunk|got into|ingested)"
+        r"(?: \w+){0,4} (?:rat|mouse|rodent|slug|snail) (?:poison|bait|pellets)",
+        r"(?:rat|mouse|rodent) poison",
+        r"rodenticide",
+        r"anti ?freeze",
+        r"xylitol",
+        r"(?:ate|eaten|swallowed|chewed|got into)(?: \w+){0,4} (?:ibuprofen|paracetamol|acetaminophen|tylenol|advil|antidepressants?|pills|medication|medicine)",
+        r"(?:ate|eaten|swallowed|chewed|licked|drank|got into)(?: \w+){0,4} (?:grapes|raisins|lilies|lily|bleach|insecticide|pesticide)",
+        r"(?:was|been|got|is|'s|being) poisoned",
+        r"poisoning",
+    ],
+    "seizure": [
+        r"seiz(?:ure|ures|ing|ed)",
+        r"convuls(?:ing|ion|ions|ed)",
+        r"(?:having|had|has) (?:a )?fits?",
+    ],
+    "trauma": [
+        r"(?:hit|struck|run over|ran over|knocked down) by (?:a |the )?(?:car|truck|vehicle|bike|van|bus)",
+        r"(?:got|was|been) run over",
+        r"(?:fell|fallen|jumped) (?:off|from|out of) (?:a |the )?(?:balcony|window|roof|building|stairs)",
+        r"attacked by (?:a |another )?(?:dog|coyote|animal)",
+    ],
+    "bleeding": [
+        r"(?:bleeding|bleeds) (?:a lot|heavily|badly|everywhere|profusely)",
+        r"(?:won'?t|will not|doesn'?t|does not|can'?t) stop bleeding",
+        r"(?:lots|a lot|pool) of blood",
+        r"(?:vomiting|throwing up|coughing up) blood",
+    ],
+    "collapse": [
+        r"collaps(?:ed|ing|es)",
+        r"unconscious",
+        r"unresponsive",
+        r"(?:passed|passing) out",
+        r"(?:can'?t|cannot|unable to) (?:stand|get up|walk)",
+        r"won'?t (?:stand|get up)",
+        r"not moving(?! (?:much|as much|a lot|around much|very much))",
+    ],
+    "bloat": [
+        r"(?:bloated|swollen|distended|hard) (?:belly|stomach|abdomen|tummy)",
+        r"(?:belly|stomach|abdomen|tummy) (?:is )?(?:bloated|swollen|distended|hard)",
+        r"(?:retching|trying to vomit|dry heaving)(?: \w+){0,3} (?:nothing|but nothing)",
+    ],
+    "urinary_blockage": [
+        r"(?:can'?t|cannot|unable to|straining to) (?:pee|urinate|wee)",
+    ],
+}
+
+# Safety flag marking an analysis built from keyword matches alone
+KEYWORD_MATCH_FLAG = "Flagged by emergency keyword match before full analysis"
+
+# Cues that negate a match when they appear before it in the same clause
+_NEGATION_CUES = re.compile(
+    r"\b(?:no|not|never|without|isn'?t|wasn'?t|didn'?t|doesn'?t|don'?t|hasn'?t|haven'?t|hadn'?t|denies)\b",
+    re.IGNORECASE
+)
+
+# A negation does not reach across clauses ("not eating and collapsed")
+_CLAUSE_BOUNDARY = re.compile(r"[,.;:!?]|\b(?:and|but|then|so|because|now)\b", re.IGNORECASE)
+
+# Past or temporal context and resolution are judged per sentence
+_SENTENCE_BOUNDARY = re.compile(r"[.;!?]")
+
+# Anywhere in the sentence: the event is long past
+_PAST_CUES = re.compile(
+    r"\b(?:(?:a|an|one|two|three|four|five|few|several|many|\d+) )?(?:weeks?|months?|years?) ago\b"
+    r"|\blast (?:week|month|year)\b|\bas a (?:puppy|kitten)\b|\bused to\b",
+    re.IGNORECASE
+)
+
+# After the match: the pet has recovered ("... but he's fine now")
+_RESOLVED_CUES = re.compile(
+    r"\b(?:fine|okay|ok|normal|better|recovered) (?:now|again)\b",
+    re.IGNORECASE
+)
+
+# Sentence opens as a question or hypothetical ("could chocolate poison ...")
+_HYPOTHETICAL_START = re.compile(
+    r"^\W*(?:could|can|would|will|should|might|is|are|does|do|what|how|which|why|if)\b(?!'t| not)",
+    re.IGNORECASE
+)
+
+
+@dataclass
+class EmergencyMatch:
+    """One emergency phrase found in an utterance"""
+    category: str
+    phrase: str
+    start: int
+    end: int
+
+
+class EmergencyMatcher:
+    """
+    Single-pass emergency detector over a curated symptom lexicon
+    
+    All categories compile into one alternation with a named group per
+    category, so an utterance is scanned once regardless of lexicon size.
+    A match is ignored when a negation cue ("no", "doesn't seem to be")
+    occurs before it in its clause, when its sentence places it in the
+    past ("two years ago") or says the pet has recovered after it, or when
+    the sentence is a question or hypothetical. Ignored matches still
+    reach the LLM: the fast path only has to avoid false alarms.
+    """
+    
+    def __init__(self, lexicon: Optional[Dict[str, List[str]]] = None):
+        """
+        Compile the lexicon
+        
+        Args:
+            lexicon: Category -> regex alternatives (defaults to EMERGENCY_LEXICON)
+        """
+        self.lexicon = lexicon or EMERGENCY_LEXICON
+        self._pattern: Pattern = re.compile(
+            "|".join(
+                rf"(?P<{category}>\b(?:{'|'.join(patterns)})\b)"
+                for category, patterns in self.lexicon.items()
+            ),
+            re.IGNORECASE
+        )
+    
+    def match(self, text: str) -> List[EmergencyMatch]:
+        """
+        Find current, non-negated emergency phrases
+        
+        Args:
+            text: User utterance
+            
+        Returns:
+            Matches in order of appearance (empty if none)
+        """
+        matches = []
+        for found in self._pattern.finditer(text):
+            category = found.lastgroup
+            phrase = found.group(category)
+            if self._is_negated(text, found.start()) or self._is_not_current(text, found):
+                continue
+            matches.append(EmergencyMatch(category, phrase, found.start(), found.end()))
+        return matches
+    
+    @staticmethod
+    def _is_negated(text: str, start: int) -> bool:
+        """Check the match's clause, up to the match, for a negation cue"""
+        clause = _CLAUSE_BOUNDARY.split(text[:start])[-1]
+        return _NEGATION_CUES.search(clause) is not None
+    
+    @staticmethod
+    def _is_not_current(text: str, found: re.Match) -> bool:
+        """Check the match's sentence for past, resolved or hypothetical context"""
+        before = _SENTENCE_BOUNDARY.split(text[:found.start()])[-1]
+        after = _SENTENCE_BOUNDARY.split(text[found.end():])[0]
+        return (
+            _PAST_CUES.search(f"{before} {after}") is not None
+            or _RESOLVED_CUES.search(after) is not None
+            or _HYPOTHETICAL_START.search(before) is not None
+        )
+    
+    @staticmethod
+    def categories(matches: List[EmergencyMatch]) -> List[str]:
+        """Distinct categories of a match list, in order of appearance"""
+        return list(dict.fromkeys(m.category for m in matches))
+    
+    @staticmethod
+    def is_keyword_overview(analysis: HealthOverview) -> bool:
+        """True for a keyword-match analysis the full analysis never replaced"""
+        return KEYWORD_MATCH_FLAG in analysis.safety_flags
+    
+    @staticmethod
+    def to_overview(matches: List[EmergencyMatch]) -> HealthOverview:
+        """
+        Build the immediate EMERGENCY analysis for a set of matches
+        
+        Args:
+            matches: Non-empty list of matches
+            
+        Returns:
+            Structured analysis with risk_level EMERGENCY
+        """
+        categories = EmergencyMatcher.categories(matches)
+        return HealthOverview(
+            health_overview="Possible emergency detected: " + ", ".join(
+                c.replace("_", " ") for c in categories
+            ),
+            symptom_analysis=SymptomAnalysis(
+                symptoms_identified=[m.phrase for m in matches],
+                severity_indicators=categories,
+                duration=None,
+                pet_type=None,
+                age_mentioned=None
+            ),
+            risk_level="EMERGENCY",
+            recommendations=["Contact a veterinarian or emergency animal hospital immediately"],
+            safety_flags=[
+                KEYWORD_MATCH_FLAG,
+                "This is not professional veterinary advice"
+            ],
+            requires_vet=True
+        )
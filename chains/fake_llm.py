@@ -0,0 +1,142 @@
+"""
+Fake Chat Model
+Offline, deterministic stand-in for the Perplexity chat model with
+simulated latency, used for load tests and benchmarks
+"""
+import asyncio
+import json
+import math
+import random
+import time
+from typing import Any, AsyncIterator, List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from config.prompts import PromptTemplates
+
+
+SAMPLE_ANALYSIS = {
+    "health_overview": "Dog with repeated vomiting since this morning",
+    "symptom_analysis": {
+        "symptoms_identified": ["vomiting", "lethargy"],
+        "duration": "since this morning",
+        "severity_indicators": ["repeated episodes"],
+        "pet_type": "dog",
+        "age_mentioned": None
+    },
+    "risk_level": "MODERATE",
+    "recommendations": [
+        "Withhold food for a few hours",
+        "Offer small amounts of water",
+        "Schedule a vet appointment if vomiting continues"
+    ],
+    "safety_flags": ["This is not a substitute for professional veterinary care"],
+    "requires_vet": True
+}
+
+SAMPLE_RESPONSE = (
+    "I'm sorry your dog isn't feeling well, that sounds worrying. "
+    "Repeated vomiting with low energy is worth a call to your vet today. "
+    "In the meantime, offer small sips of water and hold off on food for a few hours. "
+    "I'm not a replacement for your vet, so please reach out if anything gets worse."
+)
+
+
+class FakeTriageChatModel(BaseChatModel):
+    """Chat model returning schema-valid triage output with simulated latency"""
+    
+    ttft_ms: float = 350.0  # Mean time to first token
+    ttft_jitter_ms: float = 100.0  # Spread of time to first token
+    latency_distribution: str = "gaussian"  # "fixed", "gaussian" or "lognormal"
+    tokens_per_second: float = 80.0  # Streaming rate after first token
+    seed: Optional[int] = None
+    
+    _rng: Any = None
+    
+    @property
+    def _llm_type(self) -> str:
+        return "fake-triage"
+    
+    def _choose_output(self, messages: List[BaseMessage]) -> str:
+        """Pick the output matching the prompt that was sent"""
+        system = str(messages[0].content) if messages else ""
+        analysis = json.dumps(SAMPLE_ANALYSIS)
+        
+        if PromptTemplates.get_field_order_instruction() in system:
+            order = ("symptom_analysis", "risk_level", "requires_vet")
+            reordered = {key: SAMPLE_ANALYSIS[key] for key in order}
+            reordered.update(SAMPLE_ANALYSIS)
+            analysis = json.dumps(reordered)
+        
+        if PromptTemplates.RESPONSE_DELIMITER in system:
+            return f"{analysis}\n{PromptTemplates.RESPONSE_DELIMITER}\n{SAMPLE_RESPONSE}"
+        if "{" in system and "properties" in system:
+            return analysis
+        return SAMPLE_RESPONSE
+    
+    def _tokens(self, text: str) -> List[str]:
+        """Split text into word-sized tokens, keeping whitespace"""
+        tokens = []
+        current = ""
+        for char in text:
+            current += char
+            if char in " \n":
+                tokens.append(current)
+                current = ""
+        if current:
+            tokens.append(current)
+        return tokens
+    
+    def _first_token_delay(self) -> float:
+        """Sample time to first token in seconds"""
+        if self._rng is None:
+            self._rng = random.Random(self.seed)
+        
+        if self.latency_distribution == "fixed" or self.ttft_jitter_ms <= 0:
+            delay = self.ttft_ms
+        elif self.latency_distribution == "lognormal":
+            # Parameters chosen so mean and std dev match ttft_ms / ttft_jitter_ms
+            sigma_sq = math.log(1 + (self.ttft_jitter_ms / self.ttft_ms) ** 2)
+            mu = math.log(self.ttft_ms) - sigma_sq / 2
+            delay = self._rng.lognormvariate(mu, math.sqrt(sigma_sq))
+        else:
+            delay = self._rng.gauss(self.ttft_ms, self.ttft_jitter_ms)
+        return max(0.0, delay) / 1000
+    
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        text = self._choose_output(messages)
+        time.sleep(self._first_token_delay() + len(self._tokens(text)) / self.tokens_per_second)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+    
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        text = self._choose_output(messages)
+        await asyncio.sleep(self._first_token_delay() + len(self._tokens(text)) / self.tokens_per_second)
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text))])
+    
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        text = self._choose_output(messages)
+        await asyncio.sleep(self._first_token_delay())
+        
+        for token in self._tokens(text):
+            await asyncio.sleep(1 / self.tokens_per_second)
+            yield ChatGenerationChunk(message=AIMessageChunk(content=token))
@@ -0,0 +1,237 @@
+"""
+HTTP Client Pool
+One managed async HTTP client for the LLM backend: keep-alive, per-call
+timeouts, retries, hedged requests and connection warm-up
+"""
+import asyncio
+import importlib.util
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from config.settings import LLMConfig
+from utils.logger import Logger
+from utils.metrics import Metrics
+from utils.tracing import Tracer
+
+# Statuses worth another attempt (throttling and transient server errors)
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Longest Retry-After we honour before giving up on that attempt's advice
+MAX_RETRY_AFTER = 10.0
+
+
+class HTTPClientPool:
+    """
+    Shared httpx.AsyncClient with explicitly managed connections
+    
+    All chains call the same chat model and so share this pool: a
+    connection opened by one call (or by warm_up) is kept alive and reused
+    by the next, so only the first request on a connection pays for TCP
+    and TLS setup. Streaming requests that have not produced response
+    headers after `hedge_after` seconds get one duplicate on another
+    connection; the first response wins and the other request is
+    cancelled. Non-streaming requests are never hedged: their headers
+    arrive only once generation has finished, so a slow call would just
+    pay for a second one. Connection errors, 429 and 5xx are retried with
+    jittered exponential backoff.
+    
+    Timings: `http_response_headers`, `http_connect` (TCP + TLS, new
+    connections only). Counters: `http_connections_opened`, `http_retries`,
+    `http_hedges`, `http_hedge_wins`.
+    """
+    
+    def __init__(self, config: LLMConfig, headers: Optional[Dict[str, str]] = None):
+        """
+        Initialize the pool (the client is created on first use)
+        
+        Args:
+            config: LLM configuration (base_url, limits, timeouts, retries)
+            headers: Headers sent with every request (e.g. authorization)
+        """
+        self.config = config
+        self.headers = headers or {}
+        self.http2 = config.http2 and importlib.util.find_spec("h2") is not None
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled client, created on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.config.base_url,
+                headers=self.headers,
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_keepalive_connections,
+                    keepalive_expiry=self.config.keepalive_expiry
+                ),
+                timeout=httpx.Timeout(
+                    connect=self.config.connect_timeout,
+                    read=self.config.read_timeout,
+                    write=self.config.connect_timeout,
+                    pool=self.config.pool_timeout
+                )
+            )
+        return self._client
+    
+    async def send(self, method: str, url: str, json: Any = None, stream: bool = False) -> httpx.Response:
+        """
+        Send a request with hedging and retries
+        
+        Args:
+            method: HTTP method
+            url: Path relative to base_url
+            json: JSON body
+            stream: Leave the body unread (the caller must close the response)
+            
+        Returns:
+            Successful response
+            
+        Raises:
+            httpx.HTTPStatusError: Error status that is not retryable, or
+                still failing after max_retries
+            httpx.TransportError: Connection or timeout error after max_retries
+        """
+        attempt = 0
+        while True:
+            last_attempt = attempt >= self.config.max_retries
+            attempt += 1
+            try:
+                response = await self._hedged(method, url, json, hedge=stream)
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+                Metrics.increment("http_retries")
+                await asyncio.sleep(self._backoff(attempt))
+                continue
+            
+            if response.status_code < 400:
+                if not stream:
+                    await response.aread()
+                return response
+            
+            # Read the error body: releases the connection, keeps the message
+            await response.aread()
+            if response.status_code not in RETRY_STATUSES or last_attempt:
+                response.raise_for_status()
+            Metrics.increment("http_retries")
+            await asyncio.sleep(self._retry_after(response) or self._backoff(attempt))
+    
+    async def _hedged(self, method: str, url: str, json: Any, hedge: bool) -> httpx.Response:
+        """First response from the request and, if hedging and it is slow, one duplicate"""
+        attempts: List[asyncio.Task] = [asyncio.create_task(self._send_once(method, url, json))]
+        winner: Optional[asyncio.Task] = None
+        try:
+            if hedge and self.config.hedge_after > 0:
+                done, _ = await asyncio.wait(attempts, timeout=self.config.hedge_after)
+                if not done:
+                    Metrics.increment("http_hedges")
+                    attempts.append(asyncio.create_task(self._send_once(method, url, json)))
+            
+            pending = set(attempts)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        winner = task
+                        if task is not attempts[0]:
+                            Metrics.increment("http_hedge_wins")
+                        return task.result()
+            
+            # Every attempt failed: surface the original request's error
+            return attempts[0].result()
+        finally:
+            for task in attempts:
+                if task is not winner:
+                    self._discard(task)
+    
+    @staticmethod
+    def _discard(task: asyncio.Task):
+        """Cancel a losing attempt, or close its response if it also finished"""
+        if not task.done():
+            task.cancel()
+        elif not task.cancelled() and task.exception() is None:
+            asyncio.ensure_future(task.result().aclose())
+    
+    async def _send_once(self, method: str, url: str, json: Any) -> httpx.Response:
+        """One request, returned as soon as the response headers arrive"""
+        request = self.client.build_request(
+            method,
+            url,
+            json=json,
+            extensions={"trace": self._connection_tracer()}
+        )
+        started = time.perf_counter()
+        response = await self.client.send(request, stream=True)
+        Metrics.record("http_response_headers", time.perf_counter() - started)
+        return response
+    
+    @staticmethod
+    def _connection_tracer():
+        """httpcore trace hook timing connection setup for one request"""
+        started: Dict[str, float] = {}
+        
+        async def trace(event: str, info: dict):
+            if event in ("connection.connect_tcp.started", "connection.start_tls.started"):
+                started.setdefault("connect", time.perf_counter())
+            elif event == "connection.connect_tcp.complete":
+                Metrics.increment("http_connections_opened")
+            elif event in ("http11.send_request_headers.started", "http2.send_request_headers.started"):
+                if "connect" in started:
+                    Tracer.record("http_connect", started.pop("connect"), time.perf_counter())
+        
+        return trace
+    
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Jittered exponential backoff in seconds (attempt counts from 1)"""
+        return random.uniform(0.5, 1.0) * min(0.25 * 2 ** (attempt - 1), 4.0)
+    
+    @staticmethod
+    def _retry_after(response: httpx.Response) -> Optional[float]:
+        """Seconds from a Retry-After header, capped at MAX_RETRY_AFTER"""
+        try:
+            return min(float(response.headers.get("retry-after")), MAX_RETRY_AFTER)
+        except (TypeError, ValueError):
+            return None
+    
+    async def warm_up(self, path: str = "/", connections: Optional[int] = None):
+        """
+        Open connections before the first real request
+        
+        Sends concurrent lightweight requests so that many connections are
+        set up (DNS, TCP, TLS) and left idle in the pool. Any status is
+        fine; only connection failures are reported.
+        
+        Args:
+            path: Path to request (relative to base_url)
+            connections: Connections to open (defaults to warm_connections)
+        """
+        count = self.config.warm_connections if connections is None else connections
+        if count <= 0:
+            return
+        
+        async def _touch():
+            request = self.client.build_request(
+                "HEAD",
+                path,
+                extensions={"trace": self._connection_tracer()}
+            )
+            response = await self.client.send(request)
+            await response.aclose()
+        
+        with Tracer.span("http_warm_up"):
+            results = await asyncio.gather(*(_touch() for _ in range(count)), return_exceptions=True)
+        errors = [r for r in results if isinstance(r, Exception)]
+        if errors:
+            Logger.warning(f"HTTP warm-up: {len(errors)}/{count} connections failed ({errors[0]!r})")
+    
+    async def aclose(self):
+        """Close every pooled connection"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
@@ -0,0 +1,329 @@
+"""
+Lenient Analysis Parser
+Extracts, repairs and validates the HealthOverview JSON in LLM output
+"""
+import json
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from pydantic import ValidationError
+
+from models.schemas import HealthOverview, SymptomAnalysis
+from utils.metrics import Metrics
+
+# Python spellings of JSON literals
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+# Characters that end a JSON value (a following value is missing its comma)
+_VALUE_END = set('"}]0123456789el')
+
+# Numeric literals are read as one token (sign, digits, fraction, exponent)
+_NUMBER_START = set("-+0123456789.")
+_NUMBER_CHARS = set("0123456789.eE+-")
+
+# Dangling tail of a truncated object: `"key":`, `"key": tru`, or a bare `"key"`
+_DANGLING_MEMBER = re.compile(r'([,{])\s*"(?:[^"\\]|\\.)*"\s*(?::\s*[A-Za-z]*)?$')
+
+# List-valued fields a model sometimes writes as a single string
+_LIST_FIELDS = {
+    name for name, field in HealthOverview.model_fields.items() if field.annotation == list[str]
+}
+_SYMPTOM_LIST_FIELDS = {
+    name for name, field in SymptomAnalysis.model_fields.items() if field.annotation == list[str]
+}
+
+
+class AnalysisParseError(ValueError):
+    """No usable analysis could be recovered from the output"""
+
+
+class IncompleteAnalysisError(AnalysisParseError):
+    """
+    Output repaired into JSON, but some required fields are missing or
+    invalid; `partial` holds the valid fields and `missing` names the rest
+    """
+    
+    def __init__(self, partial: Dict[str, Any], missing: List[str], message: str):
+        super().__init__(message)
+        self.partial = partial
+        self.missing = missing
+
+
+def extract_json_block(text: str) -> str:
+    """
+    The first JSON object in text, without code fences or surrounding prose
+    
+    Args:
+        text: Raw model output
+        
+    Returns:
+        The object from its '{' to the matching '}' (or to the end of the
+        text, less a closing fence, if it was cut off), or "" if there is
+        no object
+    """
+    start = text.find("{")
+    if start < 0:
+        return ""
+    
+    depth = 0
+    quote = None
+    escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if quote:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return text[start:index + 1]
+    return text[start:].rstrip().removesuffix("```").rstrip()
+
+
+def repair_json(text: str) -> str:
+    """
+    Fix the defects models commonly produce in JSON
+    
+    Single-quoted strings, raw newlines in strings, Python literals
+    (True/False/None), trailing commas, missing commas between values and
+    truncation (unterminated strings, dangling keys, unclosed brackets).
+    
+    Args:
+        text: A JSON object as extracted by extract_json_block
+        
+    Returns:
+        Repaired JSON text (json.loads may still reject it)
+    """
+    out: List[str] = []
+    stack: List[str] = []
+    quote = None
+    escaped = False
+    index = 0
+    
+    while index < len(text):
+        char = text[index]
+        index += 1
+        
+        if quote:
+            if escaped:
+                escaped = False
+                out.append(char)
+            elif char == "\\":
+                escaped = True
+                out.append(char)
+            elif char == quote:
+                quote = None
+                out.append('"')
+            elif char == '"':
+                out.append('\\"')  # Double quote inside a single-quoted string
+            elif char == "\n":
+                out.append("\\n")
+            else:
+                out.append(char)
+            continue
+        
+        if char.isspace():
+            out.append(char)
+            continue
+        
+        if char in "}]":
+            _drop_trailing_comma(out)
+            if stack:
+                out.append("}" if stack.pop() == "{" else "]")
+            continue
+        
+        if char in ",:":
+            out.append(char)
+            continue
+        
+        # A new value right after another one: the comma is missing
+        if stack and _last_significant(out) in _VALUE_END:
+            out.append(",")
+        
+        if char in "\"'":
+            quote = char
+            out.append('"')
+        elif char in "{[":
+            stack.append(char)
+            out.append(char)
+        elif char.isalpha():
+            end = index
+            while end < len(text) and text[end].isalpha():
+                end += 1
+            word = char + text[index:end]
+            index = end
+            out.append(_PYTHON_LITERALS.get(word, word))
+        elif char in _NUMBER_START:
+            # One token, so the missing-comma check never splits a number
+            end = index
+            while end < len(text) and text[end] in _NUMBER_CHARS:
+                end += 1
+            out.append(char + text[index:end])
+            index = end
+        else:
+            out.append(char)
+    
+    # Truncated output: close the open string, drop a dangling member, close brackets
+    if quote:
+        if escaped:
+            out.pop()
+        out.append('"')
+    repaired = "".join(out).rstrip()
+    if stack and stack[-1] == "{":
+        repaired = _DANGLING_MEMBER.sub(lambda m: "{" if m.group(1) == "{" else "", repaired)
+    repaired = repaired.rstrip().rstrip(",").rstrip(":")
+    return repaired + "".join("}" if opener == "{" else "]" for opener in reversed(stack))
+
+
+def _last_significant(out: List[str]) -> str:
+    """Last non-whitespace character written"""
+    for chunk in reversed(out):
+        stripped = chunk.rstrip()
+        if stripped:
+            return stripped[-1]
+    return ""
+
+
+def _drop_trailing_comma(out: List[str]):
+    """Remove a comma written just before a closing bracket"""
+    for position in range(len(out) - 1, -1, -1):
+        if out[position].isspace():
+            continue
+        if out[position] == ",":
+            del out[position]
+        return
+
+
+class AnalysisParser:
+    """
+    Fast, lenient parsing of the structured analysis
+    
+    Well-formed output is validated straight from the JSON text by the
+    model's compiled pydantic validator. Anything else is extracted from
+    fences and prose, repaired, coerced (single strings for list fields)
+    and validated again; risk_level is normalized to RISK_LEVELS by the
+    schema. If required fields are still missing or invalid, the valid
+    ones are kept and IncompleteAnalysisError names the rest, so the
+    caller can ask the model for just those.
+    
+    Timing: `analysis_parse`. Counters: `analysis_parse_strict`,
+    `analysis_parse_repaired`, `analysis_parse_incomplete`,
+    `analysis_parse_failed`.
+    """
+    
+    def parse(self, text: str) -> HealthOverview:
+        """
+        Parse model output into a HealthOverview
+        
+        Args:
+            text: Raw model output
+            
+        Returns:
+            Validated analysis
+            
+        Raises:
+            IncompleteAnalysisError: Some required fields could not be recovered
+            AnalysisParseError: No JSON object could be recovered at all
+        """
+        started = time.perf_counter()
+        try:
+            return self._parse(text)
+        finally:
+            Metrics.record("analysis_parse", time.perf_counter() - started)
+    
+    def _parse(self, text: str) -> HealthOverview:
+        try:
+            overview = HealthOverview.model_validate_json(text.strip())
+            Metrics.increment("analysis_parse_strict")
+            return overview
+        except ValidationError:
+            pass
+        
+        data = self.load(text)
+        if data is None:
+            Metrics.increment("analysis_parse_failed")
+            raise AnalysisParseError(f"No parsable JSON object in model output: {text[:200]!r}")
+        
+        try:
+            overview = HealthOverview.model_validate(data)
+            Metrics.increment("analysis_parse_repaired")
+            return overview
+        except ValidationError as e:
+            Metrics.increment("analysis_parse_incomplete")
+            raise self._incomplete(data, e) from e
+    
+    def complete(self, partial: Dict[str, Any], missing: List[str], text: str) -> HealthOverview:
+        """
+        Fill the missing fields of a partial analysis from a follow-up output
+        
+        Args:
+            partial: Valid fields recovered so far
+            missing: Names of the fields that were requested
+            text: Model output holding (at least) the missing fields
+            
+        Returns:
+            Validated analysis
+            
+        Raises:
+            AnalysisParseError: The fields are still missing or invalid
+        """
+        data = self.load(text) or {}
+        merged = {**partial, **{key: data[key] for key in missing if key in data}}
+        try:
+            return HealthOverview.model_validate(merged)
+        except ValidationError as e:
+            raise AnalysisParseError(f"Analysis still incomplete after re-prompt: {e}") from e
+    
+    @staticmethod
+    def load(text: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract, repair and decode the first JSON object in text
+        
+        Returns:
+            The decoded object with list fields coerced, or None
+        """
+        block = extract_json_block(text)
+        if not block:
+            return None
+        try:
+            data = json.loads(block, strict=False)  # strict=False: raw control characters in strings
+        except ValueError:
+            try:
+                data = json.loads(repair_json(block), strict=False)
+            except ValueError:
+                return None
+        if not isinstance(data, dict):
+            return None
+        
+        for name in _LIST_FIELDS:
+            if isinstance(data.get(name), str):
+                data[name] = [data[name]]
+        symptoms = data.get("symptom_analysis")
+        if isinstance(symptoms, dict):
+            for name in _SYMPTOM_LIST_FIELDS:
+                if isinstance(symptoms.get(name), str):
+                    symptoms[name] = [symptoms[name]]
+        return data
+    
+    @staticmethod
+    def _incomplete(data: Dict[str, Any], error: ValidationError) -> IncompleteAnalysisError:
+        """Split decoded fields into valid ones and the top-level fields to re-request"""
+        missing = sorted({str(item["loc"][0]) for item in error.errors() if item["loc"]})
+        partial = {
+            key: value for key, value in data.items()
+            if key in HealthOverview.model_fields and key not in missing
+        }
+        return IncompleteAnalysisError(
+            partial,
+            missing,
+            f"Analysis missing or invalid fields: {', '.join(missing)}"
+        )
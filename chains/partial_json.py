@@ -0,0 +1,154 @@
+"""
+Incremental JSON Scanner
+Reports JSON values as soon as they are complete in a token stream
+"""
+import json
+from typing import Any, List, Tuple
+
+
+class IncrementalJSONScanner:
+    """
+    Character-level scanner over a streamed JSON object
+    
+    Text before the first '{' (e.g. a code fence) is ignored. Each completed
+    value is reported once with its key path, e.g. ("risk_level",) or
+    ("symptom_analysis", "symptoms_identified").
+    """
+    
+    def __init__(self):
+        """Initialize scanner state"""
+        self._started = False
+        self._done = False
+        
+        # Stack of open containers: [kind, current_key, expecting_key]
+        self._stack: List[list] = []
+        
+        # Raw text of the value being read and where it started
+        self._raw = ""
+        self._value_starts: List[int] = []
+        
+        # String state
+        self._in_string = False
+        self._escaped = False
+        self._string_is_key = False
+        self._string_buffer = ""
+        
+        # Bare scalar state (numbers, true/false/null)
+        self._scalar = ""
+    
+    @property
+    def done(self) -> bool:
+        """True once the top-level object has closed"""
+        return self._done
+    
+    def feed(self, text: str) -> List[Tuple[Tuple[str, ...], Any]]:
+        """
+        Scan more streamed text
+        
+        Args:
+            text: Next chunk of the stream
+            
+        Returns:
+            List of (path, value) for values completed by this chunk
+        """
+        completed = []
+        for char in text:
+            if self._done:
+                break
+            self._scan(char, completed)
+        return completed
+    
+    def _path(self) -> Tuple[str, ...]:
+        """Key path of the value currently being read"""
+        return tuple(str(frame[1]) for frame in self._stack if frame[1] is not None)
+    
+    def _scan(self, char: str, completed: list):
+        """Advance the state machine by one character"""
+        if not self._started:
+            if char == "{":
+                self._started = True
+                self._raw = "{"
+                self._stack.append(["object", None, True])
+                self._value_starts.append(0)
+            return
+        
+        self._raw += char
+        
+        if self._in_string:
+            self._scan_string(char, completed)
+            return
+        
+        if self._scalar:
+            if char in ",}] \t\r\n":
+                self._finish_value(self._scalar, completed)
+                self._scalar = ""
+            else:
+                self._scalar += char
+                return
+        
+        frame = self._stack[-1]
+        
+        if char == '"':
+            self._in_string = True
+            self._string_is_key = frame[0] == "object" and frame[2]
+            self._string_buffer = ""
+            if not self._string_is_key:
+                self._value_starts.append(len(self._raw) - 1)
+        elif char == ":":
+            frame[2] = False
+        elif char == ",":
+            if frame[0] == "object":
+                frame[2] = True
+            else:
+                frame[1] += 1
+        elif char in "{[":
+            self._value_starts.append(len(self._raw) - 1)
+            if char == "{":
+                self._stack.append(["object", None, True])
+            else:
+                self._stack.append(["array", 0, False])
+        elif char in "}]":
+            self._stack.pop()
+            start = self._value_starts.pop()
+            raw = self._raw[start:]
+            if not self._stack:
+                self._done = True
+                return
+            self._emit(raw, completed)
+        elif not char.isspace():
+            self._value_starts.append(len(self._raw) - 1)
+            self._scalar = char
+    
+    def _scan_string(self, char: str, completed: list):
+        """Handle one character inside a string literal"""
+        if self._escaped:
+            self._escaped = False
+            self._string_buffer += char
+            return
+        if char == "\\":
+            self._escaped = True
+            self._string_buffer += char
+            return
+        if char != '"':
+            self._string_buffer += char
+            return
+        
+        self._in_string = False
+        if self._string_is_key:
+            self._stack[-1][1] = json.loads(f'"{self._string_buffer}"')
+        else:
+            start = self._value_starts.pop()
+            self._emit(self._raw[start:], completed)
+    
+    def _finish_value(self, raw: str, completed: list):
+        """Complete a bare scalar value"""
+        self._value_starts.pop()
+        self._emit(raw, completed)
+    
+    def _emit(self, raw: str, completed: list):
+        """Decode a completed value and record it with its path"""
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            return
+        completed.append((self._path(), value))
@@ -0,0 +1,136 @@
+"""
+Pooled Perplexity Chat Model
+Async chat model for Perplexity's OpenAI-compatible API on a managed
+HTTP client pool (keep-alive, hedging, retries, warm-up)
+"""
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import httpx
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from config.settings import LLMConfig
+from .http_pool import HTTPClientPool
+
+# LangChain message type -> OpenAI-style chat role
+ROLES = {"system": "system", "human": "user", "ai": "assistant"}
+
+COMPLETIONS_PATH = "/chat/completions"
+
+
+class PooledPerplexityChat(BaseChatModel):
+    """
+    Perplexity chat completions over a shared HTTPClientPool
+    
+    langchain_community's ChatPerplexity is synchronous: async calls run in
+    a worker thread on a client this app cannot tune. This model talks
+    to the same endpoint natively async, so reasoning_chain and
+    response_chain share one pool of kept-alive connections.
+    """
+    
+    config: LLMConfig
+    pool: Any = None  # HTTPClientPool, created from config when omitted
+    
+    def __init__(self, **data: Any):
+        super().__init__(**data)
+        if self.pool is None:
+            self.pool = HTTPClientPool(
+                self.config,
+                headers={"Authorization": f"Bearer {self.config.api_key}"}
+            )
+    
+    @property
+    def _llm_type(self) -> str:
+        return "perplexity-pooled"
+    
+    def _payload(self, messages: List[BaseMessage], stop: Optional[List[str]], stream: bool) -> Dict[str, Any]:
+        """Request body for the chat completions endpoint"""
+        payload = {
+            "model": self.config.model,
+            "temperature": self.config.temperature,
+            "messages": [
+                {"role": ROLES.get(message.type, "user"), "content": message.content}
+                for message in messages
+            ],
+            "stream": stream,
+        }
+        if stop:
+            payload["stop"] = stop
+        return payload
+    
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        # Synchronous callers get a plain one-off request (the pool is async)
+        response = httpx.post(
+            self.config.base_url + COMPLETIONS_PATH,
+            json=self._payload(messages, stop, stream=False),
+            headers=self.pool.headers,
+            timeout=httpx.Timeout(self.config.read_timeout, connect=self.config.connect_timeout)
+        )
+        response.raise_for_status()
+        return self._result(response.json())
+    
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        response = await self.pool.send(
+            "POST",
+            COMPLETIONS_PATH,
+            json=self._payload(messages, stop, stream=False)
+        )
+        return self._result(response.json())
+    
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        response = await self.pool.send(
+            "POST",
+            COMPLETIONS_PATH,
+            json=self._payload(messages, stop, stream=True),
+            stream=True
+        )
+        try:
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    continue  # Read to the end so the connection can be reused
+                choices = json.loads(data).get("choices") or [{}]
+                content = (choices[0].get("delta") or {}).get("content")
+                if content:
+                    if run_manager is not None:
+                        await run_manager.on_llm_new_token(content)
+                    yield ChatGenerationChunk(message=AIMessageChunk(content=content))
+        finally:
+            # Also when the consumer stops early (barge-in): frees the connection
+            await response.aclose()
+    
+    @staticmethod
+    def _result(body: Dict[str, Any]) -> ChatResult:
+        """ChatResult from a non-streaming completion body"""
+        content = body["choices"][0]["message"]["content"]
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+    
+    async def awarm_up(self, path: str = "/"):
+        """Open pooled connections ahead of the first completion"""
+        await self.pool.warm_up(path)
+    
+    async def aclose(self):
+        """Close the pooled connections"""
+        await self.pool.aclose()
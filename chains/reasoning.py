@@ -2,71 +2,396 @@
 LangChain Reasoning Chains
 Handles LLM interactions and structured reasoning
 """
-from langchain_community.chat_models import ChatPerplexity
-from langchain_core.output_parsers import PydanticOutputParser, StrOutputParser
+import asyncio
+import json
+import time
+from contextvars import ContextVar
+from dataclasses import replace
+from functools import cached_property
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Optional, Tuple
 
 from config.settings import LLMConfig
 from config.prompts import PromptTemplates
-from models.schemas import HealthOverview, SymptomAnalysis
+from models.schemas import HealthOverview, SymptomAnalysis, normalize_risk_level
+from utils.logger import Logger
+from utils.metrics import Metrics
+from utils.tracing import Tracer
+from utils.text import SentenceSplitter
+from .backends import create_chat_model
+from .cache import ResponseCache
+from .emergency import EmergencyMatcher
+from .output_parser import AnalysisParser, IncompleteAnalysisError
+from .partial_json import IncrementalJSONScanner
+from .router import ModelRouter, Route
+
+if TYPE_CHECKING:
+    # LangChain is imported on first use, not when this module loads
+    from langchain_core.language_models import BaseChatModel
+    from langchain_core.output_parsers import PydanticOutputParser, StrOutputParser
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_core.runnables import Runnable
+
+
+class AnalysisStream:
+    """
+    Sentences of a streamed reply, with the analysis behind them
+    
+    Iterates like a plain sentence iterator. `analysis` starts as the
+    analysis returned alongside the stream; on an emergency fast-path turn
+    it is replaced by the full LLM analysis once that arrives (`refined`
+    is then True), so callers read it after the stream is exhausted.
+    """
+    
+    def __init__(self, analysis: HealthOverview, sentences: Optional[AsyncIterator[str]] = None):
+        self.analysis = analysis
+        self.refined = False
+        self.sentences = sentences
+    
+    def __aiter__(self) -> 'AnalysisStream':
+        return self
+    
+    async def __anext__(self) -> str:
+        return await self.sentences.__anext__()
+    
+    async def aclose(self):
+        """Close the underlying sentence generator"""
+        close = getattr(self.sentences, "aclose", None)
+        if close is not None:
+            await close()
 
 
 class ReasoningChains:
     """Manages LangChain reasoning chains for health analysis"""
     
-    def __init__(self, config: LLMConfig):
+    # Fields that must be final before pipelined mode starts step 2 early
+    SPECULATION_FIELDS = (
+        ("risk_level",),
+        ("requires_vet",),
+        ("symptom_analysis", "symptoms_identified"),
+    )
+    
+    # Chain name -> (frozen prompt, output parser) it composes around a model
+    CHAIN_PARTS = {
+        "reasoning_chain": ("_reasoning_prompt", "string_parser"),
+        "response_chain": ("_conversational_prompt", "string_parser"),
+        "combined_chain": ("_combined_prompt", "string_parser"),
+        "reasoning_text_chain": ("_reasoning_text_prompt", "string_parser"),
+        "completion_chain": ("_completion_prompt", "string_parser"),
+    }
+    
+    # health_overview of the safe fallback analysis returned when the LLM fails
+    FALLBACK_OVERVIEW = "Unable to fully analyze, please consult vet"
+    
+    # Analysis route of the turn being processed (set by the public entry points)
+    _route: ContextVar[Optional[Route]] = ContextVar("model_route", default=None)
+    
+    def __init__(
+        self, 
+        config: LLMConfig, 
+        llm: Optional['BaseChatModel'] = None,
+        cache: Optional[ResponseCache] = None,
+        emergency_matcher: Optional[EmergencyMatcher] = None,
+        llms: Optional[Dict[str, 'BaseChatModel']] = None
+    ):
         """
         Initialize reasoning chains
         
+        Nothing LangChain-related is built here: the LLM client, parsers
+        and chains are created on first use (or by warm_up()), so startup
+        does not wait on importing LangChain or the provider SDK.
+        
         Args:
             config: LLM configuration settings
+            llm: Optional pre-built chat model (defaults to config.backend)
+            cache: Optional response cache consulted before any LLM call
+            emergency_matcher: Optional keyword matcher that answers
+                emergencies immediately, ahead of the cache and the LLM
+            llms: Optional pre-built chat models by model name, used when
+                routing picks that model (others are built from config)
         """
         self.config = config
+        self.cache = cache
+        self.emergency_matcher = emergency_matcher
+        self._background_tasks: set = set()
+        self.analysis_parser = AnalysisParser()
+        
+        # Per-step model routing when a small or large model is configured
+        self.router: Optional[ModelRouter] = None
+        if config.small_model or config.large_model:
+            self.router = ModelRouter(config, emergency_matcher)
+        self._routed_llms: Dict[str, 'BaseChatModel'] = dict(llms or {})
+        self._routed_chains: Dict[Tuple[str, str], 'Runnable'] = {}
         
-        # Initialize LLM
-        self.llm = ChatPerplexity(
-            pplx_api_key=config.api_key,
-            model=config.model,
-            temperature=config.temperature,
-            streaming=config.streaming
+        if llm is not None:
+            self.llm = llm
+    
+    @cached_property
+    def llm(self) -> 'BaseChatModel':
+        """Chat model for config.backend"""
+        return create_chat_model(self.config)
+    
+    @cached_property
+    def reasoning_parser(self) -> 'PydanticOutputParser':
+        """HealthOverview parser, used for its format instructions (parsing goes through analysis_parser)"""
+        from langchain_core.output_parsers import PydanticOutputParser
+        
+        return PydanticOutputParser(pydantic_object=HealthOverview)
+    
+    @cached_property
+    def string_parser(self) -> 'StrOutputParser':
+        """Plain text output parser"""
+        from langchain_core.output_parsers import StrOutputParser
+        
+        return StrOutputParser()
+    
+    @cached_property
+    def _format_instructions(self) -> str:
+        """Format instructions are static: render them once, not per call"""
+        return self.reasoning_parser.get_format_instructions()
+    
+    @cached_property
+    def _reasoning_prompt(self) -> 'ChatPromptTemplate':
+        return self._freeze_prefix(
+            PromptTemplates.get_reasoning_prompt(),
+            format_instructions=self._format_instructions
+        )
+    
+    @cached_property
+    def _conversational_prompt(self) -> 'ChatPromptTemplate':
+        return self._freeze_prefix(PromptTemplates.get_conversational_prompt())
+    
+    @cached_property
+    def _combined_prompt(self) -> 'ChatPromptTemplate':
+        return self._freeze_prefix(
+            PromptTemplates.get_combined_prompt(),
+            format_instructions=self._format_instructions
+        )
+    
+    @cached_property
+    def _reasoning_text_prompt(self) -> 'ChatPromptTemplate':
+        ordered_instructions = (
+            self._format_instructions + "\n\n" + PromptTemplates.get_field_order_instruction()
+        )
+        return self._freeze_prefix(
+            PromptTemplates.get_reasoning_prompt(),
+            format_instructions=ordered_instructions
         )
+    
+    @cached_property
+    def _completion_prompt(self) -> 'ChatPromptTemplate':
+        return self._freeze_prefix(
+            PromptTemplates.get_completion_prompt(),
+            format_instructions=self._format_instructions
+        )
+    
+    @cached_property
+    def reasoning_chain(self) -> 'Runnable':
+        """Chain 1: Structured Reasoning (raw text, parsed by analysis_parser)"""
+        return self._compose("reasoning_chain", self.llm)
+    
+    @cached_property
+    def response_chain(self) -> 'Runnable':
+        """Chain 2: Conversational Response"""
+        return self._compose("response_chain", self.llm)
+    
+    @cached_property
+    def combined_chain(self) -> 'Runnable':
+        """Chain 3: Combined analysis + delimiter + spoken reply in one LLM call"""
+        return self._compose("combined_chain", self.llm)
+    
+    @cached_property
+    def reasoning_text_chain(self) -> 'Runnable':
+        """Chain 4: Structured reasoning as raw text with key fields first (pipelined mode)"""
+        return self._compose("reasoning_text_chain", self.llm)
+    
+    @cached_property
+    def completion_chain(self) -> 'Runnable':
+        """Chain 5: Only the fields a parsed analysis is missing"""
+        return self._compose("completion_chain", self.llm)
+    
+    def _compose(self, name: str, llm: 'Runnable') -> 'Runnable':
+        """Build chain `name` around a model"""
+        prompt, parser = self.CHAIN_PARTS[name]
+        return getattr(self, prompt) | llm | getattr(self, parser)
+    
+    def _chain(self, name: str, risk: Optional[str] = None) -> 'Runnable':
+        """
+        Chain `name` on the model routed for the current turn
         
-        # Setup parsers
-        self.reasoning_parser = PydanticOutputParser(pydantic_object=HealthOverview)
-        self.string_parser = StrOutputParser()
+        Args:
+            name: Key of CHAIN_PARTS
+            risk: risk_level of the analysis a response_chain call rewrites
+            
+        Returns:
+            Routed chain, or the default-model chain when routing is off
+        """
+        route = self._route.get()
+        if self.router is None or route is None:
+            return getattr(self, name)
         
-        # Build chains
-        self._build_chains()
+        if name == "response_chain":
+            model, tier = self.router.response_model(risk)
+            Metrics.increment(f"route_response_{tier}")
+        else:
+            model = route.model
+            Metrics.increment(f"route_analysis_{route.tier}")
+            Metrics.increment(f"route_reason_{route.reason}")
+        return self._routed_chain(name, model)
+    
+    def _routed_chain(self, name: str, model: str) -> 'Runnable':
+        """Chain `name` on a named model, metered per model (built once)"""
+        chain = self._routed_chains.get((name, model))
+        if chain is None:
+            from .usage import ModelUsageRecorder
+            
+            recorder = ModelUsageRecorder(model, self.config.model_costs.get(model, 0.0))
+            llm = self._routed_llm(model).with_config(callbacks=[recorder])
+            chain = self._routed_chains[(name, model)] = self._compose(name, llm)
+        return chain
+    
+    def _routed_llm(self, model: str) -> 'BaseChatModel':
+        """Chat model for a model name, sharing the default model's connections"""
+        llm = self._routed_llms.get(model)
+        if llm is None:
+            if model == self.config.model:
+                llm = self.llm
+            else:
+                llm = create_chat_model(replace(self.config, model=model), share_with=self.llm)
+            self._routed_llms[model] = llm
+        return llm
+    
+    def _begin_route(self, user_input: str, previous_risk: Optional[str]):
+        """Route the current turn's analysis step (no-op when routing is off)"""
+        if self.router is not None:
+            self._route.set(self.router.route(user_input, previous_risk))
     
-    def _build_chains(self):
-        """Build LangChain LCEL chains"""
+    def prepare(self):
+        """Build the LLM client, parsers and every chain now (blocking)"""
+        for name in self.CHAIN_PARTS:
+            getattr(self, name)
+            if self.router is not None:
+                for model in self.router.models:
+                    self._routed_chain(name, model)
+    
+    async def warm_up(self):
+        """
+        Run prepare() in a worker thread so the first turn does not pay for
+        importing LangChain and building the chains, then let the model
+        open its connections if it manages a pool
         
-        # Chain 1: Structured Reasoning
-        reasoning_prompt = PromptTemplates.get_reasoning_prompt()
+        Failures are reported, not raised: the first turn retries the
+        build and surfaces the error through its normal handling.
+        """
+        try:
+            with Tracer.span("llm_warm_up"):
+                await asyncio.to_thread(self.prepare)
+                connect = getattr(self.llm, "awarm_up", None)
+                if connect is not None:
+                    await connect()
+        except Exception as e:
+            Logger.warning(f"LLM warm-up failed: {e}")
+    
+    async def aclose(self):
+        """Release the models' pooled connections (if they were ever built)"""
+        models = {id(llm): llm for llm in (self.__dict__.get("llm"), *self._routed_llms.values())}
+        for llm in models.values():
+            close = getattr(llm, "aclose", None)
+            if close is not None:
+                await close()
+    
+    @staticmethod
+    def _freeze_prefix(prompt: 'ChatPromptTemplate', **static_values) -> 'ChatPromptTemplate':
+        """
+        Render a prompt's system message once into a literal message
         
-        self.reasoning_chain = (
-            {
-                "conversation": lambda x: x["conversation"],
-                "user_input": lambda x: x["user_input"],
-                "format_instructions": lambda _: self.reasoning_parser.get_format_instructions()
-            }
-            | reasoning_prompt
-            | self.llm
-            | self.reasoning_parser
-        )
+        The system block then costs nothing to format per turn and is
+        byte-identical across calls, so provider prompt caching can reuse it.
         
-        # Chain 2: Conversational Response
-        response_prompt = PromptTemplates.get_conversational_prompt()
+        Args:
+            prompt: Shared template whose system message uses only static_values
+            **static_values: Values for the system message variables
+            
+        Returns:
+            New template with a fixed system message and the other messages as-is
+        """
+        from langchain_core.messages import SystemMessage
+        from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate
         
-        self.response_chain = (
-            response_prompt
-            | self.llm
-            | self.string_parser
-        )
+        return ChatPromptTemplate.from_messages([
+            SystemMessage(content=message.format(**static_values).content)
+            if isinstance(message, SystemMessagePromptTemplate) else message
+            for message in prompt.messages
+        ])
+    
+    async def analyze(
+        self, 
+        conversation: str, 
+        user_input: str,
+        previous_risk: Optional[str] = None
+    ) -> HealthOverview:
+        """
+        Step 1 only: generate structured health analysis
+        
+        Args:
+            conversation: Full conversation history
+            user_input: Latest user message
+            previous_risk: risk_level of the previous analysis (for routing)
+            
+        Returns:
+            Parsed structured analysis (raises on LLM or parse failure)
+        """
+        self._begin_route(user_input, previous_risk)
+        return await self._analyze(conversation, user_input)
+    
+    async def _analyze(self, conversation: str, user_input: str) -> HealthOverview:
+        """analyze() on the current route"""
+        with Tracer.span("reasoning_step1"):
+            output = await self._chain("reasoning_chain").ainvoke({
+                "conversation": conversation,
+                "user_input": user_input
+            })
+        return await self._parse_analysis(output, conversation, user_input)
+    
+    async def _parse_analysis(self, text: str, conversation: str, user_input: str) -> HealthOverview:
+        """
+        Parse analysis output leniently, re-prompting only for missing fields
+        
+        Malformed JSON is repaired rather than discarded; if required
+        fields are still missing or invalid, one completion_chain call
+        asks for just those instead of falling back to the safe reply.
+        
+        Args:
+            text: Raw analysis output
+            conversation: Full conversation history
+            user_input: Latest user message
+            
+        Returns:
+            Validated analysis (raises AnalysisParseError if unrecoverable)
+        """
+        try:
+            return self.analysis_parser.parse(text)
+        except IncompleteAnalysisError as e:
+            Logger.warning(f"Analysis incomplete, re-prompting for: {', '.join(e.missing)}")
+            with Tracer.span("reasoning_completion"):
+                output = await self._chain("completion_chain").ainvoke({
+                    "conversation": conversation,
+                    "user_input": user_input,
+                    "partial_analysis": json.dumps(e.partial, indent=2),
+                    "missing_fields": ", ".join(e.missing)
+                })
+            try:
+                structured = self.analysis_parser.complete(e.partial, e.missing, output)
+            except ValueError:
+                Metrics.increment("analysis_parse_failed")
+                raise
+            Metrics.increment("analysis_parse_completed")
+            return structured
     
     async def analyze_and_respond(
         self, 
         conversation: str, 
-        user_input: str
+        user_input: str,
+        previous_risk: Optional[str] = None
     ) -> tuple[HealthOverview, str]:
         """
         Two-step reasoning process:
@@ -76,30 +401,634 @@ class ReasoningChains:
         Args:
             conversation: Full conversation history
             user_input: Latest user message
+            previous_risk: risk_level of the previous analysis (for routing)
             
         Returns:
             Tuple of (structured_analysis, conversational_response)
         """
+        self._begin_route(user_input, previous_risk)
+        emergency = self._match_emergency(user_input)
+        if emergency is not None:
+            return await self._refine_emergency(*emergency, conversation, user_input)
+        
+        if self.cache is not None:
+            entry = self.cache.get(conversation, user_input)
+            if entry is not None:
+                self._revalidate_if_emergency(entry, conversation, user_input)
+                return entry.structured, entry.response
+        
+        started = time.perf_counter()
+        structured, response = await self._analyze_and_respond_uncached(conversation, user_input)
+        self._cache_result(conversation, user_input, structured, response, started)
+        return structured, response
+    
+    async def _analyze_and_respond_uncached(
+        self, 
+        conversation: str, 
+        user_input: str
+    ) -> tuple[HealthOverview, str]:
+        """analyze_and_respond without the cache, dispatched on chain_mode"""
+        if self.config.chain_mode == "combined":
+            return await self._combined_respond(conversation, user_input)
+        
+        if self.config.chain_mode == "pipelined":
+            return await self._pipelined_respond(conversation, user_input)
+        
         try:
             # Step 1: Structured reasoning
-            structured = await self.reasoning_chain.ainvoke({
-                "conversation": conversation,
-                "user_input": user_input
-            })
+            structured = await self._analyze(conversation, user_input)
             
             # Step 2: Conversational response generation
-            response = await self.response_chain.ainvoke({
-                "structured_analysis": structured.model_dump_json(indent=2),
-                "user_input": user_input
-            })
+            with Tracer.span("reasoning_step2"):
+                response = await self._chain("response_chain", structured.risk_level).ainvoke({
+                    "structured_analysis": structured.model_dump_json(indent=2),
+                    "user_input": user_input
+                })
             
             return structured, response
         
         except Exception as e:
             # Return safe fallback on any error
-            print(f"⚠️  Reasoning error: {e}")
+            Logger.warning(f"Reasoning error: {e}")
+            return self._get_fallback_response()
+    
+    async def analyze_and_stream(
+        self, 
+        conversation: str, 
+        user_input: str,
+        min_sentence_length: int = 20,
+        previous_risk: Optional[str] = None
+    ) -> tuple[HealthOverview, AnalysisStream]:
+        """
+        Streaming variant of analyze_and_respond
+        Runs step 1 to completion, then streams step 2 sentence by sentence
+        so playback can start before the full response is generated
+        
+        Args:
+            conversation: Full conversation history
+            user_input: Latest user message
+            min_sentence_length: Minimum characters per yielded sentence
+            previous_risk: risk_level of the previous analysis (for routing)
+            
+        Returns:
+            Tuple of (structured_analysis, sentence stream); the stream's
+            `analysis` is final once it is exhausted
+        """
+        self._begin_route(user_input, previous_risk)
+        emergency = self._match_emergency(user_input)
+        if emergency is not None:
+            structured, directive = emergency
+            stream = AnalysisStream(structured)
+            stream.sentences = self._emergency_stream(
+                stream,
+                directive,
+                conversation,
+                user_input,
+                min_sentence_length
+            )
+            return structured, stream
+        
+        if self.cache is not None:
+            entry = self.cache.get(conversation, user_input)
+            if entry is not None:
+                self._revalidate_if_emergency(entry, conversation, user_input)
+                return entry.structured, AnalysisStream(entry.structured, self._iterate(
+                    self._split_sentences(entry.response, min_sentence_length)
+                ))
+        
+        started = time.perf_counter()
+        structured, sentences = await self._analyze_and_stream_uncached(
+            conversation,
+            user_input,
+            min_sentence_length
+        )
+        if self.cache is not None:
+            sentences = self._cache_when_complete(
+                conversation,
+                user_input,
+                structured,
+                sentences,
+                started
+            )
+        return structured, AnalysisStream(structured, self._never_silent(sentences))
+    
+    async def _analyze_and_stream_uncached(
+        self, 
+        conversation: str, 
+        user_input: str,
+        min_sentence_length: int
+    ) -> tuple[HealthOverview, AsyncIterator[str]]:
+        """analyze_and_stream without the cache, dispatched on chain_mode"""
+        if self.config.chain_mode == "combined":
+            return await self._combined_stream(
+                conversation,
+                user_input,
+                min_sentence_length
+            )
+        
+        try:
+            if self.config.chain_mode == "pipelined":
+                structured, tokens = await self._pipelined_turn(conversation, user_input)
+                return structured, self._stream_sentences(tokens, min_sentence_length)
+            
+            structured = await self._analyze(conversation, user_input)
+        except Exception as e:
+            Logger.warning(f"Reasoning error: {e}")
+            structured, fallback = self._get_fallback_response()
+            return structured, self._iterate([fallback])
+        
+        return structured, self._stream_response(structured, user_input, min_sentence_length)
+    
+    def _stream_response(
+        self, 
+        structured: HealthOverview, 
+        user_input: str, 
+        min_sentence_length: int
+    ) -> AsyncIterator[str]:
+        """Stream response_chain output for a completed analysis as sentences"""
+        response_chain = self._chain("response_chain", structured.risk_level)
+        tokens = Tracer.stream("reasoning_step2", response_chain.astream({
+            "structured_analysis": structured.model_dump_json(indent=2),
+            "user_input": user_input
+        }))
+        return self._stream_sentences(tokens, min_sentence_length)
+    
+    async def _combined_respond(
+        self, 
+        conversation: str, 
+        user_input: str
+    ) -> tuple[HealthOverview, str]:
+        """
+        Single LLM call returning both analysis and spoken reply
+        
+        Args:
+            conversation: Full conversation history
+            user_input: Latest user message
+            
+        Returns:
+            Tuple of (structured_analysis, conversational_response)
+        """
+        try:
+            with Tracer.span("reasoning_combined"):
+                output = await self._chain("combined_chain").ainvoke({
+                    "conversation": conversation,
+                    "user_input": user_input
+                })
+            
+            analysis_text, _, response = output.partition(PromptTemplates.RESPONSE_DELIMITER)
+            structured = await self._parse_analysis(analysis_text, conversation, user_input)
+            response = response.strip()
+            
+            # Model skipped the spoken part: generate it the two-step way
+            if not response:
+                response = await self._chain("response_chain", structured.risk_level).ainvoke({
+                    "structured_analysis": structured.model_dump_json(indent=2),
+                    "user_input": user_input
+                })
+            
+            return structured, response
+        
+        except Exception as e:
+            Logger.warning(f"Reasoning error: {e}")
             return self._get_fallback_response()
     
+    async def _combined_stream(
+        self, 
+        conversation: str, 
+        user_input: str,
+        min_sentence_length: int
+    ) -> tuple[HealthOverview, AsyncIterator[str]]:
+        """
+        Single LLM call, streamed: parse the analysis once the delimiter
+        arrives, then keep streaming the same call as spoken sentences
+        
+        Args:
+            conversation: Full conversation history
+            user_input: Latest user message
+            min_sentence_length: Minimum characters per yielded sentence
+            
+        Returns:
+            Tuple of (structured_analysis, async iterator of sentences)
+        """
+        delimiter = PromptTemplates.RESPONSE_DELIMITER
+        tokens = self._chain("combined_chain").astream({
+            "conversation": conversation,
+            "user_input": user_input
+        })
+        buffer = ""
+        started = time.perf_counter()
+        
+        try:
+            async for token in tokens:
+                buffer += token
+                if delimiter in buffer:
+                    break
+            
+            analysis_text, found, remainder = buffer.partition(delimiter)
+            structured = await self._parse_analysis(analysis_text, conversation, user_input)
+            
+            # Same span names as two-step mode: analysis part, then the reply
+            Tracer.record("reasoning_step1", started, time.perf_counter())
+        
+        except Exception as e:
+            Logger.warning(f"Reasoning error: {e}")
+            await tokens.aclose()
+            structured, fallback = self._get_fallback_response()
+            return structured, self._iterate([fallback])
+        
+        # Model skipped the spoken part: generate it the two-step way
+        if not found:
+            return structured, self._stream_response(structured, user_input, min_sentence_length)
+        
+        return structured, self._stream_sentences(
+            Tracer.stream("reasoning_step2", tokens),
+            min_sentence_length,
+            prefix=remainder
+        )
+    
+    async def _pipelined_respond(
+        self, 
+        conversation: str, 
+        user_input: str
+    ) -> tuple[HealthOverview, str]:
+        """
+        Two-step reasoning with step 2 started speculatively during step 1
+        
+        Args:
+            conversation: Full conversation history
+            user_input: Latest user message
+            
+        Returns:
+            Tuple of (structured_analysis, conversational_response)
+        """
+        try:
+            structured, tokens = await self._pipelined_turn(conversation, user_input)
+            response = "".join([token async for token in tokens])
+            return structured, response
+        
+        except Exception as e:
+            Logger.warning(f"Reasoning error: {e}")
+            return self._get_fallback_response()
+    
+    async def _pipelined_turn(
+        self, 
+        conversation: str, 
+        user_input: str
+    ) -> tuple[HealthOverview, AsyncIterator[str]]:
+        """
+        Stream step 1 and start step 2 as soon as the triage-critical fields
+        (SPECULATION_FIELDS) are final. If the validated analysis contradicts
+        what the speculative start saw, it is cancelled and step 2 re-runs.
+        
+        Args:
+            conversation: Full conversation history
+            user_input: Latest user message
+            
+        Returns:
+            Tuple of (structured_analysis, async iterator of response tokens)
+        """
+        scanner = IncrementalJSONScanner()
+        known: dict = {}
+        buffer = ""
+        speculation = None
+        started = time.perf_counter()
+        
+        try:
+            async for token in self._chain("reasoning_text_chain").astream({
+                "conversation": conversation,
+                "user_input": user_input
+            }):
+                buffer += token
+                for path, value in scanner.feed(token):
+                    known[path] = value
+                
+                if speculation is None and all(f in known for f in self.SPECULATION_FIELDS):
+                    partial = self._partial_analysis(known)
+                    speculation = (partial, *self._start_response(partial, user_input))
+            
+            structured = await self._parse_analysis(buffer, conversation, user_input)
+            Tracer.record("reasoning_step1", started, time.perf_counter())
+        
+        except BaseException:
+            if speculation is not None:
+                speculation[2].cancel()
+            raise
+        
+        if speculation is not None:
+            partial, queue, task = speculation
+            if self._contradicts(partial, structured):
+                task.cancel()
+                Metrics.increment("speculation_cancelled")
+                speculation = None
+            else:
+                Metrics.increment("speculation_used")
+        
+        if speculation is None:
+            queue, task = self._start_response(structured.model_dump(), user_input)
+        
+        return structured, Tracer.stream("reasoning_step2", self._drain(queue, task))
+    
+    def _start_response(
+        self, 
+        analysis: dict, 
+        user_input: str
+    ) -> tuple[asyncio.Queue, asyncio.Task]:
+        """
+        Start streaming response_chain into a queue in the background
+        
+        Args:
+            analysis: (Partial) structured analysis as a dict
+            user_input: Latest user message
+            
+        Returns:
+            Tuple of (token queue, producer task)
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        response_chain = self._chain("response_chain", str(analysis.get("risk_level", "")))
+        
+        async def _produce():
+            try:
+                async for token in response_chain.astream({
+                    "structured_analysis": json.dumps(analysis, indent=2),
+                    "user_input": user_input
+                }):
+                    queue.put_nowait(token)
+                queue.put_nowait(None)
+            except Exception as e:
+                queue.put_nowait(e)
+        
+        return queue, asyncio.create_task(_produce())
+    
+    @staticmethod
+    async def _drain(queue: asyncio.Queue, task: asyncio.Task) -> AsyncIterator[str]:
+        """Yield tokens from a producer queue until it finishes"""
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            if not task.done():
+                task.cancel()
+    
+    @staticmethod
+    def _partial_analysis(known: dict) -> dict:
+        """Build a nested analysis dict from completed top-level and symptom fields"""
+        partial: dict = {}
+        for path, value in known.items():
+            if path == ("risk_level",):
+                partial["risk_level"] = normalize_risk_level(value)
+            elif len(path) == 1:
+                partial[path[0]] = value
+            elif len(path) == 2 and path[0] == "symptom_analysis":
+                partial.setdefault("symptom_analysis", {})[path[1]] = value
+        return partial
+    
+    @staticmethod
+    def _contradicts(partial: dict, structured: HealthOverview) -> bool:
+        """Check if the validated analysis disagrees with the speculative one"""
+        speculated_symptoms = partial.get("symptom_analysis", {}).get("symptoms_identified", [])
+        return (
+            partial.get("risk_level") != structured.risk_level
+            or partial.get("requires_vet") != structured.requires_vet
+            or set(speculated_symptoms) != set(structured.symptom_analysis.symptoms_identified)
+        )
+    
+    async def _stream_sentences(
+        self, 
+        tokens: AsyncIterator[str], 
+        min_sentence_length: int,
+        prefix: str = ""
+    ) -> AsyncIterator[str]:
+        """
+        Consume streamed tokens and yield complete sentences
+        
+        Args:
+            tokens: Async iterator of streamed text chunks
+            min_sentence_length: Minimum characters per yielded sentence
+            prefix: Text already received before tokens
+            
+        Yields:
+            Complete sentences as soon as they are generated (stream errors
+            propagate; see _never_silent)
+        """
+        splitter = SentenceSplitter(min_length=min_sentence_length)
+        
+        for sentence in splitter.feed(prefix.lstrip()):
+            yield sentence
+        
+        async for token in tokens:
+            for sentence in splitter.feed(token):
+                yield sentence
+        
+        for sentence in splitter.flush():
+            yield sentence
+    
+    @staticmethod
+    async def _never_silent(sentences: AsyncIterator[str]) -> AsyncIterator[str]:
+        """
+        Report a failed response stream instead of raising, and ask for
+        clarification if it failed before producing any sentence
+        """
+        emitted = False
+        try:
+            async for sentence in sentences:
+                emitted = True
+                yield sentence
+        except Exception as e:
+            Logger.warning(f"Response streaming error: {e}")
+        
+        if not emitted:
+            yield PromptTemplates.get_clarification_prompt()
+    
+    def _cache_result(
+        self, 
+        conversation: str, 
+        user_input: str, 
+        structured: HealthOverview, 
+        response: str, 
+        started: float
+    ):
+        """Store a completed turn in the cache (fallback answers are never cached)"""
+        if self.cache is None or response == PromptTemplates.get_clarification_prompt():
+            return
+        self.cache.put(
+            conversation,
+            user_input,
+            structured,
+            response,
+            time.perf_counter() - started
+        )
+    
+    async def _cache_when_complete(
+        self, 
+        conversation: str, 
+        user_input: str, 
+        structured: HealthOverview, 
+        sentences: AsyncIterator[str], 
+        started: float
+    ) -> AsyncIterator[str]:
+        """
+        Pass sentences through and cache the full response once streaming
+        ends; a stream that fails part-way raises before anything is cached
+        """
+        spoken = []
+        async for sentence in sentences:
+            spoken.append(sentence)
+            yield sentence
+        self._cache_result(conversation, user_input, structured, " ".join(spoken), started)
+    
+    def _revalidate_if_emergency(self, entry, conversation: str, user_input: str):
+        """
+        Serve cached EMERGENCY results immediately, but re-run the LLM in
+        the background so the entry is refreshed on every hit
+        """
+        if entry.structured.risk_level.strip().upper() != "EMERGENCY":
+            return
+        
+        async def _revalidate():
+            started = time.perf_counter()
+            structured, response = await self._analyze_and_respond_uncached(conversation, user_input)
+            self._cache_result(conversation, user_input, structured, response, started)
+        
+        Metrics.increment("cache_revalidations")
+        task = asyncio.create_task(_revalidate())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    def _match_emergency(self, user_input: str) -> Optional[tuple[HealthOverview, str]]:
+        """
+        Keyword fast path: EMERGENCY analysis and pre-rendered directive
+        
+        Returns:
+            Tuple of (structured_analysis, directive), or None if no match
+        """
+        if self.emergency_matcher is None:
+            return None
+        
+        started = time.perf_counter()
+        matches = self.emergency_matcher.match(user_input)
+        Metrics.record("emergency_match", time.perf_counter() - started)
+        if not matches:
+            return None
+        
+        Metrics.increment("emergency_fast_path")
+        categories = EmergencyMatcher.categories(matches)
+        return (
+            EmergencyMatcher.to_overview(matches),
+            PromptTemplates.get_emergency_directive(categories)
+        )
+    
+    @classmethod
+    def is_fallback(cls, analysis: HealthOverview) -> bool:
+        """True for the safe fallback analysis of a failed LLM call"""
+        return analysis.health_overview == cls.FALLBACK_OVERVIEW
+    
+    @classmethod
+    def is_mergeable(cls, analysis: HealthOverview) -> bool:
+        """
+        Whether a turn's final analysis belongs in the case state
+        
+        The fallback of a failed LLM call and a keyword-match emergency
+        the full analysis never replaced are placeholders, not findings:
+        merging them would carry an invented risk into every later turn.
+        """
+        return not (cls.is_fallback(analysis) or EmergencyMatcher.is_keyword_overview(analysis))
+    
+    def _record_refinement(self, structured: HealthOverview) -> bool:
+        """
+        Count whether the full analysis agreed with the keyword match
+        
+        Returns:
+            True if the full analysis downgrades the emergency; a failed
+            analysis (the fallback) never does
+        """
+        if self.is_fallback(structured):
+            Metrics.increment("emergency_unrefined")
+            return False
+        if structured.risk_level == "EMERGENCY":
+            Metrics.increment("emergency_confirmed")
+            return False
+        Metrics.increment("emergency_overruled")
+        return True
+    
+    async def _refine_emergency(
+        self,
+        emergency: HealthOverview,
+        directive: str,
+        conversation: str,
+        user_input: str
+    ) -> tuple[HealthOverview, str]:
+        """
+        Non-streaming fast-path turn: nothing has been said yet, so wait
+        for the full analysis and let it decide the reply
+        
+        Returns:
+            The full analysis with the directive ahead of its reply, or
+            only its reply if it downgrades the emergency; the keyword
+            analysis and directive if the full analysis failed
+        """
+        started = time.perf_counter()
+        structured, response = await self._analyze_and_respond_uncached(conversation, user_input)
+        self._cache_result(conversation, user_input, structured, response, started)
+        if self._record_refinement(structured):
+            return structured, response
+        if self.is_fallback(structured):
+            return emergency, directive
+        return structured, f"{directive} {response}"
+    
+    async def _emergency_stream(
+        self, 
+        stream: AnalysisStream,
+        directive: str, 
+        conversation: str, 
+        user_input: str, 
+        min_sentence_length: int
+    ) -> AsyncIterator[str]:
+        """
+        Speak the directive at once while the full analysis runs, then
+        continue with the refined response. The full analysis replaces
+        stream.analysis; if it downgrades the emergency, a correction is
+        spoken before its reply.
+        """
+        refined = asyncio.create_task(
+            self._analyze_and_stream_uncached(conversation, user_input, min_sentence_length)
+        )
+        try:
+            yield directive
+            
+            structured, sentences = await refined
+            if self._record_refinement(structured):
+                yield PromptTemplates.get_emergency_correction()
+            if not self.is_fallback(structured):
+                stream.analysis = structured
+                stream.refined = True
+            try:
+                async for sentence in sentences:
+                    # A failed refinement must not ask for clarification after a directive
+                    if sentence != PromptTemplates.get_clarification_prompt():
+                        yield sentence
+            except Exception as e:
+                Logger.warning(f"Response streaming error: {e}")
+        finally:
+            if not refined.done():
+                refined.cancel()
+    
+    @staticmethod
+    def _split_sentences(text: str, min_sentence_length: int) -> list[str]:
+        """Split complete text into sentences the same way streaming does"""
+        splitter = SentenceSplitter(min_length=min_sentence_length)
+        return splitter.feed(text + " ") + splitter.flush()
+    
+    @staticmethod
+    async def _iterate(items: list[str]) -> AsyncIterator[str]:
+        """Wrap a list of strings as an async iterator"""
+        for item in items:
+            yield item
+    
     def _get_fallback_response(self) -> tuple[HealthOverview, str]:
         """
         Generate safe fallback response when LLM fails
@@ -108,7 +1037,7 @@ class ReasoningChains:
             Tuple of (fallback_structured, fallback_message)
         """
         fallback_structured = HealthOverview(
-            health_overview="Unable to fully analyze, please consult vet",
+            health_overview=self.FALLBACK_OVERVIEW,
             symptom_analysis=SymptomAnalysis(
                 symptoms_identified=["Unable to parse"],
                 severity_indicators=[],
@@ -0,0 +1,109 @@
+"""
+Model Router
+Picks the chat model for each chain step from cheap turn features
+"""
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from config.settings import LLMConfig
+from models.case_state import RISK_ORDER
+from utils.metrics import Metrics
+from .emergency import EmergencyMatcher
+
+# Risk levels whose analysis and reply always get the full-size models
+HIGH_RISK = frozenset({"HIGH", "EMERGENCY"})
+
+
+@dataclass
+class Route:
+    """Analysis model chosen for one turn, and why"""
+    model: str
+    tier: str  # "small", "default" or "large"
+    reason: str  # "emergency", "risk", "long", "short" or "default"
+
+
+class ModelRouter:
+    """
+    Per-turn model selection for the reasoning chain steps
+    
+    The analysis step goes to large_model when the emergency matcher
+    fires, the previous turn's risk_level was HIGH or EMERGENCY, or the
+    utterance is long; to small_model when the utterance is short and the
+    previous risk is at most route_small_max_risk ("thanks", "okay",
+    "she's three"); otherwise to the configured model. The conversational
+    rewrite goes to small_model unless the analysis it rewrites is high
+    risk. Features are a word count, one regex scan and a set lookup, so
+    a decision costs microseconds.
+    
+    Timing: `model_route`. ReasoningChains counts the decisions that
+    reach an LLM call: `route_analysis_<tier>`, `route_reason_<reason>`
+    and `route_response_<tier>`.
+    """
+    
+    def __init__(self, config: LLMConfig, emergency_matcher: Optional[EmergencyMatcher] = None):
+        """
+        Initialize the router
+        
+        Args:
+            config: LLM configuration (model names and routing thresholds)
+            emergency_matcher: Matcher for the emergency feature (a default
+                one is compiled when omitted)
+        """
+        self.config = config
+        self.emergency_matcher = emergency_matcher or EmergencyMatcher()
+        self.small_model = config.small_model or config.model
+        self.large_model = config.large_model or config.model
+        self._small_max_risk = RISK_ORDER.index(config.route_small_max_risk.strip().upper())
+    
+    @property
+    def models(self) -> List[str]:
+        """Distinct model names this router can pick"""
+        return list(dict.fromkeys([self.config.model, self.small_model, self.large_model]))
+    
+    def route(self, user_input: str, previous_risk: Optional[str] = None) -> Route:
+        """
+        Choose the analysis model for a turn
+        
+        Args:
+            user_input: Latest user message
+            previous_risk: risk_level of the previous analysis in this call
+            
+        Returns:
+            Chosen model, its tier and the deciding feature
+        """
+        started = time.perf_counter()
+        risk = (previous_risk or "").strip().upper()
+        words = len(user_input.split())
+        
+        if self.emergency_matcher.match(user_input):
+            route = Route(self.large_model, "large", "emergency")
+        elif risk in HIGH_RISK:
+            route = Route(self.large_model, "large", "risk")
+        elif words >= self.config.route_long_words:
+            route = Route(self.large_model, "large", "long")
+        elif words <= self.config.route_short_words and self._low_risk(risk):
+            route = Route(self.small_model, "small", "short")
+        else:
+            route = Route(self.config.model, "default", "default")
+        
+        Metrics.record("model_route", time.perf_counter() - started)
+        return route
+    
+    def response_model(self, risk: Optional[str]) -> Tuple[str, str]:
+        """
+        Choose the model for the conversational rewrite of an analysis
+        
+        Args:
+            risk: risk_level of the analysis being rewritten
+            
+        Returns:
+            Tuple of (model, tier)
+        """
+        if (risk or "").strip().upper() in HIGH_RISK:
+            return self.config.model, "default"
+        return self.small_model, "small"
+    
+    def _low_risk(self, risk: str) -> bool:
+        """Whether a previous risk level (or none yet) allows small_model"""
+        return risk not in RISK_ORDER or RISK_ORDER.index(risk) <= self._small_max_risk
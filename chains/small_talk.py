@@ -0,0 +1,176 @@
+"""
+Small-Talk Classifier
+Precompiled whole-utterance matcher for acknowledgements, thanks, repeat
+and hold requests and goodbyes, answered without an LLM call
+"""
+import re
+import time
+from typing import Dict, List, Optional, Pattern
+
+from utils.metrics import Metrics
+
+# Intent -> regex alternatives over normalized text (lowercase, no punctuation
+# except apostrophes, single spaces). Intents are listed in priority order:
+# an utterance mixing several ("okay, wait, what?") takes the first.
+SMALL_TALK_LEXICON: Dict[str, List[str]] = {
+    "repeat": [
+        r"(?:can|could|would) you (?:please )?(?:repeat|say) (?:that|it|what you said|the last part)(?: again)?",
+        r"repeat (?:that|it|the last part)",
+        r"repeat",
+        r"say (?:that|it) again",
+        r"come again",
+        r"what did you (?:just )?say",
+        r"i didn'?t (?:catch|hear|get|understand) (?:that|it|what you said|you)",
+        r"one more time",
+        r"pardon(?: me)?",
+        r"excuse me",
+        r"what",
+    ],
+    "hold": [
+        r"(?:hold|hang) on(?: a (?:sec|second|moment|minute))?",
+        r"(?:just |give me )?(?:a|one) (?:sec|second|moment|minute)",
+        r"wait(?: a (?:sec|second|moment|minute))?",
+        r"bear with me",
+        r"let me (?:check|look|see)",
+    ],
+    "goodbye": [
+        r"(?:good ?)?bye(?: bye)?",
+        r"see (?:you|ya)(?: later)?",
+        r"talk (?:to you )?later",
+        r"have a (?:good|nice|great) (?:day|one|night|evening)",
+        r"that'?s (?:all|it|everything)(?: for now)?",
+        r"that is (?:all|it|everything)(?: for now)?",
+    ],
+    "thanks": [
+        r"thank(?:s| you)(?: (?:so|very) much| a lot| a million)?(?: for (?:the|your|all (?:the|your)) help)?",
+        r"(?:many|big) thanks",
+        r"cheers",
+        r"(?:much|really|i) appreciate(?:d| it| that)",
+    ],
+    "acknowledge": [
+        r"o ?k(?:ay)?",
+        r"k",
+        r"al(?:l ?)?right",
+        r"right",
+        r"sure",
+        r"yes",
+        r"yeah",
+        r"yep",
+        r"yup",
+        r"got it",
+        r"i see",
+        r"i understand",
+        r"understood",
+        r"makes sense",
+        r"sounds good",
+        r"will do",
+        r"i will",
+        r"i'?ll do that",
+        r"perfect",
+        r"great",
+        r"good",
+        r"cool",
+        r"fine",
+        r"noted",
+    ],
+}
+
+# Words that may surround small talk without carrying content
+_FILLERS = r"um+|uh+|erm?|hmm+|oh|ah|well|so|hey|please|sorry|just|then|now|again|very|really"
+
+# Intents that are also answers ("yes", "sure"): not short-circuited while a question is open
+ANSWER_INTENTS = frozenset({"acknowledge"})
+
+# Longer utterances are never small talk; checked before any regex work
+MAX_CHARS = 80
+
+_PUNCTUATION = re.compile(r"[^\w\s']+")
+_WHITESPACE = re.compile(r"\s+")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+class SmallTalkClassifier:
+    """
+    Rule-based intent classifier for content-free turns
+    
+    The whole utterance must be covered by lexicon phrases and fillers,
+    so anything else in it ("okay, but he's limping") makes it fall
+    through to the LLM: symptom content is never swallowed. Phrases are
+    consumed left to right with one precompiled alternation, so
+    classification is a handful of regex steps, in the microseconds.
+    
+    Timing (classify_turn): `small_talk_classify`. Counters:
+    `small_talk_<intent>`.
+    """
+    
+    def __init__(self, lexicon: Optional[Dict[str, List[str]]] = None):
+        """
+        Compile the lexicon
+        
+        Args:
+            lexicon: Intent -> regex alternatives in priority order
+                (defaults to SMALL_TALK_LEXICON)
+        """
+        self.lexicon = lexicon or SMALL_TALK_LEXICON
+        self._priority = {intent: rank for rank, intent in enumerate(self.lexicon)}
+        alternatives = [
+            rf"(?P<{intent}>{'|'.join(patterns)})"
+            for intent, patterns in self.lexicon.items()
+        ]
+        alternatives.append(rf"(?P<filler>{_FILLERS})")
+        self._pattern: Pattern = re.compile(rf" ?(?:{'|'.join(alternatives)})(?= |$)")
+    
+    def classify(self, text: str, question_pending: bool = False) -> Optional[str]:
+        """
+        Intent of an utterance, if it is nothing but small talk
+        
+        Args:
+            text: Recognized utterance
+            question_pending: The agent's last reply asked a question, so
+                "yes" / "okay" may be an answer and must reach the LLM
+                
+        Returns:
+            Intent name, or None if the utterance needs the LLM
+        """
+        if len(text) > MAX_CHARS:
+            return None
+        normalized = _WHITESPACE.sub(" ", _PUNCTUATION.sub(" ", text.lower())).strip()
+        
+        intent = None
+        position = 0
+        while position < len(normalized):
+            match = self._pattern.match(normalized, position)
+            if match is None:
+                return None
+            found = match.lastgroup
+            if found in ANSWER_INTENTS and question_pending:
+                return None
+            if found != "filler" and (intent is None or self._priority[found] < self._priority[intent]):
+                intent = found
+            position = match.end()
+        return intent
+    
+    def classify_turn(self, text: str, last_reply: str) -> Optional[str]:
+        """
+        Intent of a caller's turn, timed and counted
+        
+        Args:
+            text: Recognized utterance
+            last_reply: The agent's previous reply; if its last sentence
+                asks a question, "yes" / "okay" count as answers
+                
+        Returns:
+            Intent name, or None if the utterance needs the LLM
+        """
+        started = time.perf_counter()
+        intent = self.classify(text, question_pending=self.asks_question(last_reply))
+        Metrics.record("small_talk_classify", time.perf_counter() - started)
+        if intent is not None:
+            Metrics.increment(f"small_talk_{intent}")
+        return intent
+    
+    @staticmethod
+    def asks_question(reply: str) -> bool:
+        """Whether a reply ends on a question (only its last sentence counts)"""
+        sentences = _SENTENCE_END.split(reply.strip())
+        return "?" in sentences[-1]
@@ -0,0 +1,75 @@
+"""
+Model Usage Recording
+LangChain callback that times each call to one model and estimates its
+tokens and cost
+"""
+import time
+from typing import Any, Dict, List, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+from utils.metrics import Metrics
+from utils.text import estimate_tokens
+
+
+class ModelUsageRecorder(BaseCallbackHandler):
+    """
+    Per-model latency, token and cost metrics
+    
+    Attached to a routed model so every chain using it is measured,
+    whether invoked or streamed. A call counts once it ends; calls that
+    fail or are cancelled (barge-in) are dropped.
+    
+    Timing: `llm_call_<model>`. Counters: `llm_calls_<model>`,
+    `llm_prompt_tokens_<model>`, `llm_completion_tokens_<model>` (estimated)
+    and `llm_cost_microusd_<model>`.
+    """
+    
+    run_inline = True  # Bookkeeping only: no need for an executor hop
+    
+    def __init__(self, model: str, cost_per_1k_tokens: float = 0.0):
+        """
+        Initialize the recorder
+        
+        Args:
+            model: Model name used in the metric names
+            cost_per_1k_tokens: USD per 1k tokens (prompt and completion)
+        """
+        self.model = model
+        self.cost_per_1k_tokens = cost_per_1k_tokens
+        self._calls: Dict[UUID, Tuple[float, int]] = {}  # run_id -> (start, prompt tokens)
+    
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[BaseMessage]],
+        *,
+        run_id: UUID,
+        **kwargs: Any
+    ):
+        prompt_tokens = sum(estimate_tokens(str(m.content)) for batch in messages for m in batch)
+        self._calls[run_id] = (time.perf_counter(), prompt_tokens)
+    
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any):
+        call = self._calls.pop(run_id, None)
+        if call is None:
+            return
+        started, prompt_tokens = call
+        completion_tokens = sum(
+            estimate_tokens(generation.text)
+            for generations in response.generations
+            for generation in generations
+        )
+        cost = (prompt_tokens + completion_tokens) / 1000 * self.cost_per_1k_tokens
+        
+        Metrics.record(f"llm_call_{self.model}", time.perf_counter() - started)
+        Metrics.increment(f"llm_calls_{self.model}")
+        Metrics.increment(f"llm_prompt_tokens_{self.model}", prompt_tokens)
+        Metrics.increment(f"llm_completion_tokens_{self.model}", completion_tokens)
+        Metrics.increment(f"llm_cost_microusd_{self.model}", round(cost * 1_000_000))
+    
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any):
+        self._calls.pop(run_id, None)
@@ -1,5 +1,25 @@
 """Configuration package - exports all config classes"""
-from .settings import Config, LLMConfig, VoiceConfig, AgentConfig
-from .prompts import PromptTemplates
+from typing import TYPE_CHECKING
 
-__all__ = ['Config', 'LLMConfig', 'VoiceConfig', 'AgentConfig', 'PromptTemplates']
+from utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .settings import (
+        Config, LLMConfig, VoiceConfig, AgentConfig, ServerConfig, CacheConfig,
+        BatchConfig, TracingConfig, LoggingConfig
+    )
+    from .prompts import PromptTemplates
+
+# Export name -> defining module, loaded on first use (utils/lazy.py)
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    'Config': '.settings',
+    'LLMConfig': '.settings',
+    'VoiceConfig': '.settings',
+    'AgentConfig': '.settings',
+    'ServerConfig': '.settings',
+    'CacheConfig': '.settings',
+    'BatchConfig': '.settings',
+    'TracingConfig': '.settings',
+    'LoggingConfig': '.settings',
+    'PromptTemplates': '.prompts',
+})
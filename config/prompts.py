@@ -2,18 +2,32 @@
 Prompt templates for LLM interactions
 Centralized location for all prompt engineering
 """
-from langchain_core.prompts import ChatPromptTemplate
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from langchain_core.prompts import ChatPromptTemplate
 
 
 class PromptTemplates:
-    """Container for all prompt templates"""
+    """
+    Container for all prompt templates
+    
+    The chat prompts are built once, on first use, and shared (they are
+    never mutated); the plain-text prompts need no LangChain import.
+    Each keeps its system message free of per-turn variables so it forms
+    a stable prefix that provider-side prompt caching can reuse.
+    """
     
     @staticmethod
-    def get_reasoning_prompt() -> ChatPromptTemplate:
+    @lru_cache(maxsize=None)
+    def get_reasoning_prompt() -> 'ChatPromptTemplate':
         """
         Prompt for structured reasoning and risk assessment
         Returns: ChatPromptTemplate with system and user messages
         """
+        from langchain_core.prompts import ChatPromptTemplate
+        
         return ChatPromptTemplate.from_messages([
             ("system", """You are a veterinary triage assistant that analyzes pet symptoms.
 
@@ -49,11 +63,14 @@ Please analyze the above and provide a structured health assessment.""")
         ])
     
     @staticmethod
-    def get_conversational_prompt() -> ChatPromptTemplate:
+    @lru_cache(maxsize=None)
+    def get_conversational_prompt() -> 'ChatPromptTemplate':
         """
         Prompt for converting structured analysis to natural speech
         Returns: ChatPromptTemplate for empathetic responses
         """
+        from langchain_core.prompts import ChatPromptTemplate
+        
         return ChatPromptTemplate.from_messages([
             ("system", """You are a caring, knowledgeable veterinary assistant speaking to a worried pet owner.
 
@@ -86,17 +103,110 @@ AVOID:
 - Robotic or overly formal language
 - Medical terminology without explanation
 - Definitive diagnoses
-- Dismissive tone
-
-Structured Analysis:
+- Dismissive tone"""),
+            ("user", """Structured Analysis:
 {structured_analysis}
 
 User's latest message: {user_input}
 
-Now provide a warm, conversational spoken response:"""),
-            ("user", "{user_input}")
+Now provide a warm, conversational spoken response:""")
+        ])
+    
+    # Separates the JSON analysis from the spoken reply in the combined prompt
+    RESPONSE_DELIMITER = "###RESPONSE###"
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_combined_prompt() -> 'ChatPromptTemplate':
+        """
+        Single-call prompt producing structured analysis and spoken reply
+        Output is the JSON analysis, then RESPONSE_DELIMITER on its own line,
+        then the conversational response (streamable)
+        Returns: ChatPromptTemplate with system and user messages
+        """
+        from langchain_core.prompts import ChatPromptTemplate
+        
+        return ChatPromptTemplate.from_messages([
+            ("system", """You are a veterinary triage assistant that analyzes pet symptoms and then speaks to a worried pet owner.
+
+CRITICAL SAFETY RULES:
+1. NEVER provide definitive diagnoses
+2. ALWAYS recommend vet visit for serious symptoms
+3. Flag emergency symptoms immediately:
+   - Difficulty breathing
+   - Seizures
+   - Severe bleeding
+   - Suspected poisoning
+   - Collapse or inability to stand
+   - Severe trauma
+   - Bloated/distended abdomen
+   - Continuous vomiting/diarrhea with blood
+4. Include disclaimers about not replacing professional vet care
+
+RISK LEVEL GUIDELINES:
+- EMERGENCY: Life-threatening symptoms, immediate vet needed
+- HIGH: Serious symptoms, vet visit within 24 hours
+- MODERATE: Concerning symptoms, schedule vet appointment
+- LOW: Minor symptoms, monitor and provide care tips
+
+OUTPUT FORMAT (follow exactly):
+Part 1: The structured analysis as JSON only.
+Part 2: A line containing only """ + PromptTemplates.RESPONSE_DELIMITER + """
+Part 3: A warm, conversational spoken response to the pet owner.
+
+SPOKEN RESPONSE GUIDELINES:
+- Be empathetic and reassuring, use simple language without medical jargon
+- EMERGENCY: 3-4 sentences, urgent but calm, go to an emergency vet right now
+- HIGH: 3 sentences, express concern, vet visit within 24 hours
+- MODERATE: 2-3 sentences, suggest a vet appointment
+- LOW: 2 sentences, home care tips and reassurance
+- Naturally include a disclaimer about not replacing professional veterinary care
+- Never give definitive diagnoses or sound dismissive
+
+{format_instructions}"""),
+            ("user", """Conversation history:
+{conversation}
+
+Latest user input: {user_input}
+
+Provide the structured assessment, the delimiter line, then your spoken response.""")
         ])
     
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_completion_prompt() -> 'ChatPromptTemplate':
+        """
+        Prompt asking only for the fields a structured analysis is missing
+        Returns: ChatPromptTemplate with the partial analysis in the user message
+        """
+        from langchain_core.prompts import ChatPromptTemplate
+        
+        return ChatPromptTemplate.from_messages([
+            ("system", """You are a veterinary triage assistant completing a structured health assessment.
+
+Part of the assessment is already done. Provide ONLY the missing fields listed by the user, as a single JSON object with exactly those keys, consistent with the partial assessment. Use risk_level EMERGENCY, HIGH, MODERATE or LOW.
+
+{format_instructions}"""),
+            ("user", """Conversation history:
+{conversation}
+
+Latest user input: {user_input}
+
+Partial assessment:
+{partial_analysis}
+
+Missing fields: {missing_fields}""")
+        ])
+    
+    @staticmethod
+    def get_field_order_instruction() -> str:
+        """
+        Extra format instruction for pipelined mode
+        Puts the triage-critical fields first so step 2 can start early
+        Returns: String appended to the format instructions
+        """
+        return "Output the JSON keys in this order: symptom_analysis, risk_level, requires_vet, health_overview, recommendations, safety_flags."
+    
     @staticmethod
     def get_greeting_prompt() -> str:
         """
@@ -105,6 +215,75 @@ Now provide a warm, conversational spoken response:"""),
         """
         return "Hello! I'm here to help you understand your pet's symptoms. Please tell me what's concerning you about your pet today."
     
+    @staticmethod
+    def get_static_phrases() -> list[str]:
+        """
+        Fixed phrases spoken verbatim, pre-rendered into the TTS cache at startup
+        Returns: List of phrase strings
+        """
+        return [
+            PromptTemplates.get_greeting_prompt(),
+            PromptTemplates.get_clarification_prompt(),
+            *PromptTemplates.get_emergency_directives().values(),
+            PromptTemplates.get_emergency_correction(),
+            *PromptTemplates.get_small_talk_responses().values(),
+        ]
+    
+    @staticmethod
+    def get_small_talk_responses() -> dict[str, str]:
+        """
+        Canned replies for small-talk turns answered without the LLM
+        ("repeat" replays the previous reply instead)
+        Returns: Dict of intent to reply
+        """
+        return {
+            "acknowledge": "Alright. Tell me whenever there's anything else you notice about your pet.",
+            "thanks": "You're welcome. If anything changes or gets worse, please contact your vet.",
+            "hold": "Of course, take your time. I'm here when you're ready.",
+            "goodbye": "Take care, and I hope your pet feels better soon. Goodbye!",
+        }
+    
+    @staticmethod
+    def get_emergency_directives() -> dict[str, str]:
+        """
+        Spoken directives for keyword-matched emergencies, by category
+        Kept fixed so they are pre-rendered and play without any LLM or TTS delay
+        Returns: Dict of category to directive ("general" is the default)
+        """
+        call_now = "Please call your vet or the nearest emergency animal hospital right now."
+        return {
+            "general": f"This sounds like an emergency. {call_now}",
+            "breathing": f"Trouble breathing is an emergency. {call_now} Keep your pet calm and their airway clear.",
+            "poisoning": f"Possible poisoning is an emergency. {call_now} Do not make your pet vomit unless a vet tells you to, and keep the packaging.",
+            "seizure": f"A seizure is an emergency. {call_now} Keep your pet away from stairs and hard edges, and do not put anything in their mouth.",
+            "trauma": f"After an accident your pet needs to be seen urgently. {call_now} Move them gently on a flat surface.",
+            "bleeding": f"Heavy bleeding is an emergency. {call_now} Press a clean cloth firmly on the wound on the way.",
+            "collapse": f"Collapse is an emergency. {call_now} Keep your pet warm and still.",
+            "bloat": f"A swollen belly with retching can be life threatening. {call_now}",
+            "urinary_blockage": f"Not being able to urinate is an emergency, especially in cats. {call_now}",
+        }
+    
+    @staticmethod
+    def get_emergency_correction() -> str:
+        """
+        Spoken when the full analysis downgrades a keyword-matched emergency
+        after its directive was already played
+        Returns: Correction string
+        """
+        return "Looking at everything you've told me, this may be less urgent than it first sounded."
+    
+    @staticmethod
+    def get_emergency_directive(categories: list[str]) -> str:
+        """
+        Directive for the first matched emergency category
+        Returns: Directive string
+        """
+        directives = PromptTemplates.get_emergency_directives()
+        for category in categories:
+            if category in directives:
+                return directives[category]
+        return directives["general"]
+    
     @staticmethod
     def get_clarification_prompt() -> str:
         """
@@ -3,8 +3,8 @@ Configuration settings for the voice agent
 Centralized configuration management
 """
 import os
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 
 
 @dataclass
@@ -14,19 +14,66 @@ class LLMConfig:
     model: str = "sonar-small-chat"
     temperature: float = 0.3
     streaming: bool = True
+    chain_mode: str = "two_step"  # "two_step", "combined" (one LLM call) or "pipelined" (speculative step 2)
+    
+    # Backend: "perplexity" or "fake" (offline, for load tests and benchmarks)
+    backend: str = "perplexity"
+    fake_ttft_ms: float = 350.0  # Fake backend: mean time to first token
+    fake_ttft_jitter_ms: float = 100.0  # Fake backend: spread of time to first token
+    fake_latency_distribution: str = "gaussian"  # "fixed", "gaussian" or "lognormal"
+    fake_tokens_per_second: float = 80.0  # Fake backend: streaming rate
+    fake_seed: Optional[int] = None  # Fake backend: RNG seed for reproducible runs
+    
+    # HTTP client pool (perplexity backend)
+    http_pool: bool = True  # Pooled async client; False uses langchain_community's ChatPerplexity
+    base_url: str = "https://api.perplexity.ai"
+    http2: bool = True  # Used when the h2 package is installed
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0  # Seconds an idle connection stays open
+    connect_timeout: float = 5.0  # TCP + TLS setup
+    read_timeout: float = 30.0  # Longest gap between bytes of a response
+    pool_timeout: float = 5.0  # Wait for a free connection
+    max_retries: int = 2  # On connection errors, 429 and 5xx
+    hedge_after: float = 0.0  # Duplicate a streaming request with no response headers by then (0, the default, disables)
+    warm_connections: int = 2  # Connections opened by warm-up before the first call
+    
+    # Model routing per chain step (off unless small_model or large_model is set)
+    small_model: Optional[str] = None  # Short, low-risk turns and conversational rewrites
+    large_model: Optional[str] = None  # Emergencies, high-risk and long turns (default: model)
+    route_short_words: int = 6  # Utterances up to this many words may use small_model
+    route_long_words: int = 40  # Utterances from this many words use large_model
+    route_small_max_risk: str = "MODERATE"  # Highest previous risk_level still routed to small_model
+    model_costs: Dict[str, float] = field(default_factory=dict)  # USD per 1k tokens by model, for cost metrics
     
     @classmethod
     def from_env(cls) -> 'LLMConfig':
         """Load configuration from environment variables"""
-        api_key = os.getenv("PERPLEXITY_API_KEY")
-        if not api_key:
+        backend = os.getenv("LLM_BACKEND", "perplexity")
+        api_key = os.getenv("PERPLEXITY_API_KEY", "")
+        if not api_key and backend == "perplexity":
             raise ValueError("PERPLEXITY_API_KEY environment variable not set")
         
+        fake_seed = os.getenv("FAKE_LLM_SEED")
+        
         return cls(
             api_key=api_key,
             model=os.getenv("PERPLEXITY_MODEL", "sonar-small-chat"),
             temperature=float(os.getenv("LLM_TEMPERATURE", "0.3")),
-            streaming=os.getenv("LLM_STREAMING", "true").lower() == "true"
+            streaming=os.getenv("LLM_STREAMING", "true").lower() == "true",
+            chain_mode=os.getenv("LLM_CHAIN_MODE", "two_step"),
+            backend=backend,
+            fake_ttft_ms=float(os.getenv("FAKE_LLM_TTFT_MS", "350")),
+            fake_ttft_jitter_ms=float(os.getenv("FAKE_LLM_TTFT_JITTER_MS", "100")),
+            fake_latency_distribution=os.getenv("FAKE_LLM_LATENCY_DISTRIBUTION", "gaussian"),
+            fake_tokens_per_second=float(os.getenv("FAKE_LLM_TOKENS_PER_SECOND", "80")),
+            fake_seed=int(fake_seed) if fake_seed else None,
+            http_pool=os.getenv("LLM_HTTP_POOL", "true").lower() == "true",
+            base_url=os.getenv("LLM_BASE_URL", "https://api.perplexity.ai"),
+            hedge_after=float(os.getenv("LLM_HEDGE_AFTER", "0")),
+            warm_connections=int(os.getenv("LLM_WARM_CONNECTIONS", "2")),
+            small_model=os.getenv("LLM_SMALL_MODEL") or None,
+            large_model=os.getenv("LLM_LARGE_MODEL") or None
         )
 
 
@@ -37,15 +84,42 @@ class VoiceConfig:
     recognition_timeout: float = 1.0  # Seconds to wait for speech to start
     phrase_time_limit: int = 15  # Max seconds for continuous speech
     ambient_noise_duration: float = 2.0  # Calibration duration
+    recognition_engine: str = "google"  # "google", "vosk" (offline) or "transcript" (tests)
+    recognition_model_path: Optional[str] = None  # Vosk model directory
+    recognition_input_file: Optional[str] = None  # WAV file to use instead of the microphone
+    recognition_transcript: Optional[str] = None  # Reference text for "transcript" (default: <wav>.txt)
+    recognition_realtime: bool = True  # Pace WAV input at real-time speed
+    partial_results: bool = True  # Stream partial transcripts when the engine supports it
+    
+    # Voice Activity Detection (gates recognition requests)
+    vad_enabled: bool = True
+    vad_frame_ms: int = 30  # Analysis frame length
+    vad_energy_ratio: float = 3.0  # Speech RMS vs. noise floor (~10 dB)
+    vad_barge_in_ratio: float = 6.0  # Stricter ratio while the agent is speaking
+    vad_max_zcr: float = 0.35  # Zero-crossing rate above this is broadband noise
+    vad_min_speech_ms: int = 200  # Shortest speech run that reaches recognition
+    vad_noise_adapt_rate: float = 0.05  # Noise floor smoothing per frame
     
     # Text-to-Speech
     tts_language: str = "en"
     tts_slow: bool = False
     
     # Audio Playback
-    audio_chunk_length: int = 500  # Milliseconds for interrupt checking
+    playback_sink: str = "pyaudio"  # "pyaudio", "null" (headless) or "file" (WAV)
+    playback_file: Optional[str] = None  # Output path for the "file" sink
+    playback_sample_rate: int = 24000  # Output stream rate (gTTS native)
+    playback_block_ms: int = 20  # Milliseconds per block written to the stream
+    playback_buffer_seconds: float = 30.0  # Ring buffer capacity
     interrupt_timeout: float = 1.0  # Max wait time for interrupt
     
+    # Streaming Playback
+    min_sentence_length: int = 20  # Min characters per streamed TTS sentence
+    
+    # Audio Cache
+    audio_cache_size: int = 64  # Decoded phrases kept in memory
+    audio_cache_dir: Optional[str] = ".cache/tts"  # Encoded phrases on disk (None disables)
+    audio_cache_max_files: int = 500  # Phrases kept on disk, least recently used evicted first
+    
     @classmethod
     def default(cls) -> 'VoiceConfig':
         """Get default voice configuration"""
@@ -56,7 +130,23 @@ class VoiceConfig:
 class AgentConfig:
     """Agent behavior configuration"""
     conversation_history_limit: int = 10  # Number of exchanges to keep
-    queue_timeout: float = 0.5  # Seconds to wait for queue items
+    context_token_budget: int = 1500  # Max estimated tokens of history per prompt
+    summarize_history: bool = True  # Keep evicted user statements in a rolling summary
+    summary_token_budget: int = 200  # Max estimated tokens of that summary
+    case_state_enabled: bool = True  # Prompt with merged case state + recent exchanges only
+    recent_exchanges: int = 2  # Exchanges sent verbatim alongside the case state
+    case_export_path: Optional[str] = None  # Write the case state JSON here when the call ends
+    shutdown_timeout: float = 2.0  # Seconds to wait for the listener to stop
+    fast_start: bool = True  # Greet, calibrate the mic and warm up the LLM concurrently
+    calibrate_during_greeting: bool = False  # Experimental (fast_start only): calibrate while the greeting plays, not after it
+    stream_responses: bool = True  # Speak sentences as the LLM streams them
+    emergency_fast_path: bool = True  # Answer keyword-matched emergencies before the LLM
+    small_talk_fast_path: bool = True  # Answer "okay", "thanks", "repeat that", "hold on", "bye" without the LLM
+    cancel_on_barge_in: bool = True  # A new utterance cancels the turn still in progress
+    merge_interrupted_utterances: bool = True  # Re-ask an unanswered cancelled utterance with the new one
+    coalesce_window: float = 0.0  # Voice agent: extra wait after every complete-looking fragment (delays each turn by this much)
+    coalesce_incomplete_wait: float = 1.5  # Longer wait after a fragment cut off mid-sentence
+    coalesce_max_hold: float = 4.0  # Cap on the total wait from the first fragment
     
     @classmethod
     def default(cls) -> 'AgentConfig':
@@ -64,6 +154,98 @@ class AgentConfig:
         return cls()
 
 
+@dataclass
+class ServerConfig:
+    """Multi-session server configuration"""
+    host: str = "127.0.0.1"
+    port: int = 8765
+    max_sessions: int = 200  # Connections beyond this are refused
+    max_concurrent_turns: int = 32  # Turns running LLM calls at once, across sessions
+    session_queue_size: int = 4  # Pending utterances per session before "busy"
+    
+    @classmethod
+    def default(cls) -> 'ServerConfig':
+        """Get default server configuration"""
+        return cls()
+
+
+@dataclass
+class CacheConfig:
+    """Response cache configuration"""
+    enabled: bool = True
+    max_entries: int = 512  # LRU size bound
+    ttl_seconds: float = 3600.0  # Entries older than this are ignored
+    similarity_threshold: float = 1.0  # Cosine similarity for the fuzzy tier (1.0, the default, disables it)
+    context_messages: int = 2  # History lines (before the latest input) included in the key
+    
+    @classmethod
+    def default(cls) -> 'CacheConfig':
+        """Get default cache configuration"""
+        return cls()
+
+
+@dataclass
+class BatchConfig:
+    """Offline batch triage configuration"""
+    concurrency: int = 8  # Transcripts analyzed at once
+    max_retries: int = 5  # Retries per transcript after the first attempt
+    retry_base_delay: float = 1.0  # Seconds; doubles each retry (with jitter)
+    retry_max_delay: float = 60.0  # Cap on a single backoff
+    input_cost_per_1k_tokens: float = 0.0002  # USD, for the end-of-run cost estimate
+    output_cost_per_1k_tokens: float = 0.0002
+    
+    @classmethod
+    def default(cls) -> 'BatchConfig':
+        """Get default batch configuration"""
+        return cls()
+
+
+@dataclass
+class TracingConfig:
+    """Latency tracing and metrics export configuration"""
+    waterfall: bool = False  # Debug: print a per-turn span waterfall
+    prometheus_port: Optional[int] = None  # Serve /metrics (Prometheus text) and /metrics.json
+    prometheus_host: str = "127.0.0.1"
+    json_path: Optional[str] = None  # Periodically write the metrics snapshot here
+    json_interval: float = 10.0  # Seconds between JSON snapshots
+    
+    @classmethod
+    def from_env(cls) -> 'TracingConfig':
+        """Load configuration from environment variables"""
+        port = os.getenv("METRICS_PORT")
+        return cls(
+            waterfall=os.getenv("TRACE_WATERFALL", "false").lower() == "true",
+            prometheus_port=int(port) if port else None,
+            json_path=os.getenv("METRICS_JSON_PATH") or None
+        )
+
+
+@dataclass
+class LoggingConfig:
+    """Logging backend configuration"""
+    console: bool = True  # Emoji console output
+    json_path: Optional[str] = None  # Structured JSON lines ("-" for stdout)
+    level: str = "info"  # "debug", "info", "warning" or "error"
+    sample_rates: Dict[str, float] = field(default_factory=dict)  # Level -> fraction of JSON records kept
+    queue_size: int = 10000  # Records waiting for the writer before new ones are dropped
+    batch_size: int = 256  # Records written per sink call
+    
+    @classmethod
+    def from_env(cls) -> 'LoggingConfig':
+        """Load configuration from environment variables"""
+        sample_rates = {
+            level: float(os.environ[f"LOG_SAMPLE_{level.upper()}"])
+            for level in ("debug", "info", "warning", "error")
+            if f"LOG_SAMPLE_{level.upper()}" in os.environ
+        }
+        return cls(
+            console=os.getenv("LOG_CONSOLE", "true").lower() == "true",
+            json_path=os.getenv("LOG_JSON_PATH") or None,
+            level=os.getenv("LOG_LEVEL", "info").lower(),
+            sample_rates=sample_rates
+        )
+
+
 class Config:
     """Master configuration container"""
     
@@ -71,11 +253,21 @@ class Config:
         self,
         llm: Optional[LLMConfig] = None,
         voice: Optional[VoiceConfig] = None,
-        agent: Optional[AgentConfig] = None
+        agent: Optional[AgentConfig] = None,
+        server: Optional[ServerConfig] = None,
+        cache: Optional[CacheConfig] = None,
+        batch: Optional[BatchConfig] = None,
+        tracing: Optional[TracingConfig] = None,
+        logging: Optional[LoggingConfig] = None
     ):
         self.llm = llm or LLMConfig.from_env()
         self.voice = voice or VoiceConfig.default()
         self.agent = agent or AgentConfig.default()
+        self.server = server or ServerConfig.default()
+        self.cache = cache or CacheConfig.default()
+        self.batch = batch or BatchConfig.default()
+        self.tracing = tracing or TracingConfig()
+        self.logging = logging or LoggingConfig()
     
     @classmethod
     def load(cls) -> 'Config':
@@ -83,5 +275,10 @@ class Config:
         return cls(
             llm=LLMConfig.from_env(),
             voice=VoiceConfig.default(),
-            agent=AgentConfig.default()
+            agent=AgentConfig.default(),
+            server=ServerConfig.default(),
+            cache=CacheConfig.default(),
+            batch=BatchConfig.default(),
+            tracing=TracingConfig.from_env(),
+            logging=LoggingConfig.from_env()
         )
@@ -18,6 +18,7 @@ async def main():
     try:
         # Load configuration
         config = Config.load()
+        Logger.configure(config.logging)
         
         # Create agent
         agent = PetHealthVoiceAgent(config)
@@ -1,4 +1,5 @@
 """Models package - exports all data models"""
 from .schemas import SymptomAnalysis, HealthOverview
+from .case_state import CaseState
 
-__all__ = ['SymptomAnalysis', 'HealthOverview']
+__all__ = ['SymptomAnalysis', 'HealthOverview', 'CaseState']
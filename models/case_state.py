@@ -0,0 +1,102 @@
+"""
+Accumulated pet case state
+Merges each turn's structured analysis into one record for the call
+"""
+from pydantic import BaseModel, Field
+from typing import ClassVar, Optional
+
+from .schemas import RISK_LEVELS, HealthOverview
+
+
+# Risk levels in increasing order of severity
+RISK_ORDER = RISK_LEVELS
+
+# Symptoms the fallback analysis reports when parsing failed
+_PLACEHOLDER_SYMPTOMS = {"unable to parse"}
+
+
+class CaseState(BaseModel):
+    """What is known about the pet so far in this call"""
+    pet_type: Optional[str] = Field(default=None, description="Type of pet")
+    age: Optional[str] = Field(default=None, description="Pet age")
+    duration: Optional[str] = Field(default=None, description="Most recent symptom duration")
+    symptoms: list[str] = Field(default_factory=list, description="Distinct symptoms, first mention first")
+    severity_indicators: list[str] = Field(default_factory=list, description="Distinct severity indicators")
+    highest_risk: Optional[str] = Field(default=None, description="Highest risk level seen")
+    latest_risk: Optional[str] = Field(default=None, description="Risk level of the most recent analysis")
+    requires_vet: bool = Field(default=False, description="Whether any turn required a vet visit")
+    turns: int = Field(default=0, description="Number of analyses merged")
+    
+    # Cap list growth so the rendered state stays compact
+    MAX_ITEMS: ClassVar[int] = 20
+    
+    def merge(self, overview: HealthOverview):
+        """
+        Fold one turn's analysis into the case
+        The overview is only read (it may be shared with the response cache)
+        
+        Args:
+            overview: Structured analysis from the latest turn
+        """
+        analysis = overview.symptom_analysis
+        symptoms = [s for s in analysis.symptoms_identified if s.strip().lower() not in _PLACEHOLDER_SYMPTOMS]
+        
+        self.pet_type = analysis.pet_type or self.pet_type
+        self.age = analysis.age_mentioned or self.age
+        self.duration = analysis.duration or self.duration
+        self.symptoms = self._union(self.symptoms, symptoms)
+        self.severity_indicators = self._union(self.severity_indicators, analysis.severity_indicators)
+        self.requires_vet = self.requires_vet or overview.requires_vet
+        
+        risk = overview.risk_level.strip().upper()
+        if risk in RISK_ORDER:
+            self.latest_risk = risk
+            if self.highest_risk is None or RISK_ORDER.index(risk) > RISK_ORDER.index(self.highest_risk):
+                self.highest_risk = risk
+        
+        self.turns += 1
+    
+    def _union(self, known: list[str], new: list[str]) -> list[str]:
+        """Case-insensitive ordered union, capped at MAX_ITEMS"""
+        seen = {item.strip().lower() for item in known}
+        merged = list(known)
+        for item in new:
+            key = item.strip().lower()
+            if key and key not in seen:
+                seen.add(key)
+                merged.append(item.strip())
+        return merged[:self.MAX_ITEMS]
+    
+    def render(self) -> str:
+        """
+        Compact one-line summary for the prompt
+        
+        Returns:
+            Case summary, or "" if nothing is known yet
+        """
+        if self.turns == 0:
+            return ""
+        
+        parts = [
+            f"{label}: {value}"
+            for label, value in (
+                ("pet", self.pet_type),
+                ("age", self.age),
+                ("duration", self.duration),
+                ("symptoms", ", ".join(self.symptoms)),
+                ("severity", ", ".join(self.severity_indicators)),
+                ("highest risk so far", self.highest_risk),
+                ("vet needed", "yes" if self.requires_vet else None),
+            )
+            if value
+        ]
+        return "Case so far: " + "; ".join(parts)
+    
+    def export(self) -> dict:
+        """
+        Case record for hand-off at the end of the call
+        
+        Returns:
+            JSON-serializable dict
+        """
+        return self.model_dump()
@@ -2,8 +2,49 @@
 Pydantic models for structured health analysis
 Separates data structures from business logic
 """
-from pydantic import BaseModel, Field
-from typing import Optional
+import re
+from pydantic import BaseModel, Field, field_validator
+from typing import Any, Literal, Optional
+
+
+# Canonical risk levels, in increasing order of severity
+RISK_LEVELS = ("LOW", "MODERATE", "HIGH", "EMERGENCY")
+RiskLevel = Literal["LOW", "MODERATE", "HIGH", "EMERGENCY"]
+
+# Other wordings models use for the risk levels
+_RISK_SYNONYMS = {
+    "NONE": "LOW",
+    "MINIMAL": "LOW",
+    "MINOR": "LOW",
+    "MILD": "LOW",
+    "MEDIUM": "MODERATE",
+    "MED": "MODERATE",
+    "ELEVATED": "HIGH",
+    "SERIOUS": "HIGH",
+    "SEVERE": "HIGH",
+    "URGENT": "HIGH",
+    "CRITICAL": "EMERGENCY",
+    "LIFE THREATENING": "EMERGENCY",
+    "IMMEDIATE": "EMERGENCY",
+}
+
+_NOT_LETTERS = re.compile(r"[^A-Z]+")
+_RISK_NOISE = re.compile(r"\b(?:RISK|LEVEL|PRIORITY|URGENCY)\b")
+
+
+def normalize_risk_level(value: Any) -> Any:
+    """
+    Map a risk level as written by a model ("Moderate", "medium risk",
+    "critical") to one of RISK_LEVELS; anything unrecognized is returned
+    unchanged for validation to reject
+    """
+    if not isinstance(value, str):
+        return value
+    words = _RISK_NOISE.sub(" ", _NOT_LETTERS.sub(" ", value.upper()))
+    key = " ".join(words.split())
+    if key in RISK_LEVELS:
+        return key
+    return _RISK_SYNONYMS.get(key, value)
 
 
 class SymptomAnalysis(BaseModel):
@@ -38,7 +79,7 @@ class HealthOverview(BaseModel):
     symptom_analysis: SymptomAnalysis = Field(
         description="Detailed symptom breakdown"
     )
-    risk_level: str = Field(
+    risk_level: RiskLevel = Field(
         description="Must be one of: LOW, MODERATE, HIGH, or EMERGENCY"
     )
     recommendations: list[str] = Field(
@@ -52,3 +93,8 @@ class HealthOverview(BaseModel):
     requires_vet: bool = Field(
         description="Whether immediate vet visit is needed"
     )
+    
+    @field_validator("risk_level", mode="before")
+    @classmethod
+    def _normalize_risk_level(cls, value: Any) -> Any:
+        return normalize_risk_level(value)
@@ -0,0 +1,196 @@
+"""
+Multi-Session Server Entry Point
+Serves many concurrent triage conversations in one process
+
+Protocol: newline-delimited JSON over TCP. Clients do their own audio
+capture/playback and exchange text with the server.
+    client -> server: {"type": "utterance", "text": "..."} | {"type": "end"}
+    server -> client: {"type": "greeting" | "analysis" | "sentence" | "done" | "busy" | "error", ...}
+                      ("done" has an "intent" when small talk was answered without the LLM)
+                      (a second "analysis" with "refined": true follows an emergency
+                      fast-path reply, carrying the full analysis that replaces it)
+                      {"type": "case", "state": {...}} last, when the session ends
+
+Run this file to start the server: python server.py [--host HOST] [--port PORT]
+"""
+import argparse
+import asyncio
+import itertools
+import json
+from typing import Dict, Optional
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+from config import Config
+from chains import EmergencyMatcher, ReasoningChains, ResponseCache, SmallTalkClassifier
+from session import TriageSession
+from utils import Logger, Metrics, MetricsExporter
+
+
+class TriageServer:
+    """Accepts caller connections and runs one TriageSession per connection"""
+    
+    def __init__(self, config: Config, reasoning_chains: Optional[ReasoningChains] = None):
+        """
+        Initialize the server
+        
+        Args:
+            config: Complete configuration object
+            reasoning_chains: Shared chains (built from config.llm if omitted)
+        """
+        self.config = config
+        self.reasoning_chains = reasoning_chains or ReasoningChains(
+            config.llm,
+            cache=ResponseCache(config.cache) if config.cache.enabled else None,
+            emergency_matcher=EmergencyMatcher() if config.agent.emergency_fast_path else None
+        )
+        self.small_talk = SmallTalkClassifier() if config.agent.small_talk_fast_path else None
+        self.turn_semaphore = asyncio.Semaphore(config.server.max_concurrent_turns)
+        self.sessions: Dict[str, TriageSession] = {}
+        self._session_ids = itertools.count(1)
+        self._server: Optional[asyncio.AbstractServer] = None
+    
+    async def start(self) -> asyncio.AbstractServer:
+        """
+        Start listening for connections
+        
+        Returns:
+            The underlying asyncio server (use .sockets to find the bound port)
+        """
+        # Build the LLM client and chains before the first caller needs them
+        await self.reasoning_chains.warm_up()
+        self._server = await asyncio.start_server(
+            self._handle_client,
+            self.config.server.host,
+            self.config.server.port
+        )
+        return self._server
+    
+    async def serve_forever(self):
+        """Start the server and run until cancelled"""
+        server = await self.start()
+        address = server.sockets[0].getsockname()
+        Logger.success(f"Triage server listening on {address[0]}:{address[1]}")
+        async with server:
+            await server.serve_forever()
+    
+    async def stop(self):
+        """Close all sessions and stop accepting connections"""
+        for session in list(self.sessions.values()):
+            session.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        await self.reasoning_chains.aclose()
+    
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Run one caller connection
+        
+        Args:
+            reader: Connection reader
+            writer: Connection writer
+        """
+        async def send(event: dict):
+            writer.write(json.dumps(event).encode() + b"\n")
+            # Waits when the client reads slowly (output backpressure)
+            await writer.drain()
+        
+        if len(self.sessions) >= self.config.server.max_sessions:
+            Metrics.increment("sessions_refused")
+            await send({"type": "error", "message": "server busy"})
+            writer.close()
+            return
+        
+        session_id = f"s{next(self._session_ids)}"
+        session = TriageSession(
+            session_id,
+            self.config,
+            self.reasoning_chains,
+            send,
+            self.turn_semaphore,
+            self.small_talk
+        )
+        self.sessions[session_id] = session
+        Metrics.increment("sessions_started")
+        runner = asyncio.create_task(session.run())
+        
+        try:
+            while not runner.done():
+                line = await reader.readline()
+                if not line:
+                    break
+                
+                try:
+                    message = json.loads(line)
+                except ValueError:
+                    await send({"type": "error", "message": "invalid json"})
+                    continue
+                
+                if message.get("type") == "end":
+                    break
+                if message.get("type") == "utterance" and message.get("text", "").strip():
+                    if not session.submit(message["text"]):
+                        await send({"type": "busy"})
+        
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        
+        finally:
+            session.close()
+            try:
+                await runner
+            except (asyncio.CancelledError, ConnectionError):
+                pass
+            except Exception as e:
+                Logger.error(f"[{session_id}] Session error: {e}")
+            
+            # Hand the accumulated case back to the caller
+            try:
+                await send({"type": "case", "state": session.case_state.export()})
+            except ConnectionError:
+                pass
+            del self.sessions[session_id]
+            Metrics.increment("sessions_finished")
+            writer.close()
+
+
+async def main():
+    """Server entry point"""
+    parser = argparse.ArgumentParser(description="Pet Health triage server")
+    parser.add_argument("--host", help="Bind address")
+    parser.add_argument("--port", type=int, help="Bind port")
+    args = parser.parse_args()
+    
+    try:
+        config = Config.load()
+        Logger.configure(config.logging)
+        if args.host:
+            config.server.host = args.host
+        if args.port:
+            config.server.port = args.port
+        
+        server = TriageServer(config)
+        exporter = MetricsExporter(config.tracing)
+        exporter.start()
+        try:
+            await server.serve_forever()
+        finally:
+            await server.reasoning_chains.aclose()
+            exporter.stop()
+    
+    except ValueError as e:
+        # Configuration error (e.g., missing API key)
+        Logger.error(f"Configuration error: {e}")
+        Logger.info("Please set PERPLEXITY_API_KEY in your .env file")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        Logger.metrics(Metrics.summary())
+        Logger.info("Server stopped")
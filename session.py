@@ -0,0 +1,213 @@
+"""
+Triage Session
+Per-caller conversation state for the multi-session server
+"""
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+from config import Config, PromptTemplates
+from chains import ReasoningChains, SmallTalkClassifier
+from models import CaseState
+from utils import ConversationHistory, Logger, Metrics, Tracer
+
+
+# Sends one protocol event (a JSON-serializable dict) to the caller
+EventSender = Callable[[dict], Awaitable[None]]
+
+
+class TriageSession:
+    """Lightweight per-caller state sharing one ReasoningChains instance"""
+    
+    def __init__(
+        self,
+        session_id: str,
+        config: Config,
+        reasoning_chains: ReasoningChains,
+        send: EventSender,
+        turn_semaphore: asyncio.Semaphore,
+        small_talk: Optional[SmallTalkClassifier] = None
+    ):
+        """
+        Initialize a session
+        
+        Args:
+            session_id: Unique session identifier
+            config: Complete configuration object
+            reasoning_chains: Shared chains (and their LLM client)
+            send: Output adapter delivering events to the caller
+            turn_semaphore: Server-wide limit on concurrent turns
+            small_talk: Shared classifier answering small talk without
+                the LLM (None disables it)
+        """
+        self.session_id = session_id
+        self.config = config
+        self.reasoning_chains = reasoning_chains
+        self.send = send
+        self.turn_semaphore = turn_semaphore
+        self.small_talk = small_talk
+        
+        self.conversation_history = ConversationHistory(
+            max_exchanges=config.agent.conversation_history_limit,
+            max_tokens=config.agent.context_token_budget,
+            summarize=config.agent.summarize_history,
+            summary_max_tokens=config.agent.summary_token_budget
+        )
+        self.case_state = CaseState()
+        self.last_reply = PromptTemplates.get_greeting_prompt()
+        
+        # Bounded inbox: one turn runs at a time, a few may wait
+        self.pending_input_queue: asyncio.Queue = asyncio.Queue(
+            maxsize=config.server.session_queue_size
+        )
+        self.current_turn: Optional[asyncio.Task] = None
+        self.closed = False
+    
+    def submit(self, text: str) -> bool:
+        """
+        Queue a transcribed utterance for processing
+        
+        Args:
+            text: Caller's utterance
+            
+        Returns:
+            False if the session is closed or its inbox is full (backpressure)
+        """
+        if self.closed:
+            return False
+        try:
+            self.pending_input_queue.put_nowait((text, time.perf_counter()))
+            return True
+        except asyncio.QueueFull:
+            Metrics.increment("session_inputs_rejected")
+            return False
+    
+    async def run(self):
+        """Send the greeting, then process queued turns until closed"""
+        Logger.bind_session(self.session_id)  # Inherited by the turn tasks below
+        await self.send({"type": "greeting", "text": PromptTemplates.get_greeting_prompt()})
+        
+        while not self.closed:
+            item = await self.pending_input_queue.get()
+            if item is None or self.closed:
+                break
+            
+            user_input, received_at = item
+            self.current_turn = asyncio.create_task(self._process_turn(user_input, received_at))
+            try:
+                await self.current_turn
+            except asyncio.CancelledError:
+                if not self.closed:
+                    raise
+            except Exception as e:
+                Logger.error(f"[{self.session_id}] Error processing input: {e}")
+                await self.send({"type": "error", "message": "processing failed"})
+            finally:
+                self.current_turn = None
+    
+    async def _process_turn(self, user_input: str, received_at: float):
+        """
+        Run one turn and stream the reply to the caller
+        
+        Args:
+            user_input: Caller's utterance
+            received_at: perf_counter timestamp when it was received
+        """
+        intent = self._classify_small_talk(user_input)
+        if intent is not None:
+            await self._respond_small_talk(intent, received_at)
+            return
+        
+        self.conversation_history.add_user_message(user_input)
+        conversation_context = self._build_context()
+        trace = Tracer.begin_turn(f"[{self.session_id}] {user_input}")
+        try:
+            await self._run_turn(user_input, conversation_context, received_at)
+        finally:
+            Tracer.end_turn(trace)
+            Logger.turn_timings(trace)
+            if self.config.tracing.waterfall:
+                Logger.waterfall(trace)
+    
+    async def _run_turn(self, user_input: str, conversation_context: str, received_at: float):
+        """Analyze, stream the reply and record it in the history"""
+        async with self.turn_semaphore:
+            Metrics.record("session_queue_wait", time.perf_counter() - received_at)
+            
+            structured, sentences = await self.reasoning_chains.analyze_and_stream(
+                conversation_context,
+                user_input,
+                min_sentence_length=self.config.voice.min_sentence_length,
+                previous_risk=self.case_state.latest_risk
+            )
+            await self.send({"type": "analysis", "analysis": structured.model_dump()})
+            
+            spoken = []
+            async for sentence in sentences:
+                if not spoken:
+                    Metrics.record("session_first_sentence", time.perf_counter() - received_at)
+                spoken.append(sentence)
+                await self.send({"type": "sentence", "text": sentence})
+            
+            # Emergency fast path: the full analysis replaces the keyword one
+            if sentences.refined:
+                await self.send({
+                    "type": "analysis",
+                    "analysis": sentences.analysis.model_dump(),
+                    "refined": True
+                })
+        
+        # Merged only once the turn completes: a closed session cancels mid-stream.
+        # The final analysis is the refined one after an emergency fast path;
+        # placeholders (LLM fallback, unrefined keyword match) are not merged
+        if self.reasoning_chains.is_mergeable(sentences.analysis):
+            self.case_state.merge(sentences.analysis)
+        
+        response = " ".join(spoken)
+        self.last_reply = response
+        self.conversation_history.add_assistant_message(response)
+        Metrics.record("session_turn", time.perf_counter() - received_at)
+        await self.send({"type": "done", "text": response})
+    
+    def _classify_small_talk(self, user_input: str) -> Optional[str]:
+        """Small-talk intent of an utterance, or None if it needs the LLM"""
+        if self.small_talk is None:
+            return None
+        return self.small_talk.classify_turn(user_input, self.last_reply)
+    
+    async def _respond_small_talk(self, intent: str, received_at: float):
+        """
+        Reply to a small-talk turn without the LLM or the turn semaphore
+        "repeat" resends the previous reply; these turns stay out of the history
+        
+        Args:
+            intent: Intent from SmallTalkClassifier
+            received_at: perf_counter timestamp when the utterance was received
+        """
+        if intent == "repeat":
+            reply = self.last_reply
+        else:
+            reply = self.last_reply = PromptTemplates.get_small_talk_responses()[intent]
+        
+        await self.send({"type": "sentence", "text": reply})
+        Metrics.record("session_turn", time.perf_counter() - received_at)
+        await self.send({"type": "done", "text": reply, "intent": intent})
+    
+    def _build_context(self) -> str:
+        """Prompt context: case state plus recent exchanges (see ConversationHistory.get_case_context)"""
+        return self.conversation_history.get_case_context(
+            self.case_state.render() if self.config.agent.case_state_enabled else "",
+            self.config.agent.recent_exchanges
+        )
+    
+    def close(self):
+        """Cancel any in-flight turn and stop the session loop"""
+        if self.closed:
+            return
+        self.closed = True
+        if self.current_turn is not None:
+            self.current_turn.cancel()
+        try:
+            self.pending_input_queue.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
@@ -0,0 +1,78 @@
+"""Tests for the TTS audio cache's disk store"""
+import os
+import threading
+
+import pytest
+
+pydub = pytest.importorskip("pydub")
+
+from config.settings import VoiceConfig
+from Voice.audio_cache import AudioCache
+
+
+def make_cache(tmp_path, **overrides) -> AudioCache:
+    return AudioCache(VoiceConfig(audio_cache_dir=str(tmp_path), **overrides))
+
+
+def mp3_files(tmp_path):
+    return sorted(name for name in os.listdir(tmp_path) if name.endswith(".mp3"))
+
+
+def test_concurrent_puts_of_one_phrase(tmp_path):
+    cache = make_cache(tmp_path)
+    audio = pydub.AudioSegment.silent(duration=10)
+    phrases = [f"phrase {index}" for index in range(50)]
+    barrier = threading.Barrier(4, timeout=5)
+    errors = []
+    
+    def put():
+        try:
+            for phrase in phrases:
+                barrier.wait()
+                cache.put(phrase, b"mp3" * 10000, audio)
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=put) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert errors == []
+    assert len(mp3_files(tmp_path)) == len(phrases)
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_put_survives_disk_errors(tmp_path, monkeypatch):
+    cache = make_cache(tmp_path)
+    
+    def fail(*args, **kwargs):
+        raise OSError("disk full")
+    
+    monkeypatch.setattr("Voice.audio_cache.tempfile.mkstemp", fail)
+    cache.put("Hello there", b"mp3", pydub.AudioSegment.silent(duration=10))
+    assert cache.contains("Hello there")
+    assert mp3_files(tmp_path) == []
+
+
+def test_disk_store_evicts_least_recently_used(tmp_path):
+    cache = make_cache(tmp_path, audio_cache_max_files=3)
+    audio = pydub.AudioSegment.silent(duration=10)
+    for index in range(5):
+        cache.put(f"phrase {index}", b"mp3", audio)
+        path = os.path.join(tmp_path, f"{cache.key(f'phrase {index}')}.mp3")
+        os.utime(path, (index, index))
+    
+    kept = {f"{cache.key(f'phrase {index}')}.mp3" for index in (2, 3, 4)}
+    assert set(mp3_files(tmp_path)) == kept
+
+
+def test_existing_files_count_towards_the_bound(tmp_path):
+    audio = pydub.AudioSegment.silent(duration=10)
+    make_cache(tmp_path).put("old phrase", b"mp3", audio)
+    os.utime(os.path.join(tmp_path, mp3_files(tmp_path)[0]), (0, 0))
+    
+    cache = make_cache(tmp_path, audio_cache_max_files=1)
+    cache.put("new phrase", b"mp3", audio)
+    assert mp3_files(tmp_path) == [f"{cache.key('new phrase')}.mp3"]
@@ -0,0 +1,62 @@
+"""Tests that only real analyses reach the case state"""
+import asyncio
+
+import pytest
+
+from chains import EmergencyMatcher, ReasoningChains
+from config import Config
+from session import TriageSession
+
+
+@pytest.fixture
+def config(monkeypatch):
+    monkeypatch.setenv("PERPLEXITY_API_KEY", "offline")
+    config = Config()
+    config.llm.backend = "fake"
+    config.llm.fake_ttft_ms = 1
+    config.llm.fake_ttft_jitter_ms = 0
+    config.llm.fake_tokens_per_second = 100_000
+    return config
+
+
+def run_turn(config, text, fail=False):
+    chains = ReasoningChains(config.llm, emergency_matcher=EmergencyMatcher())
+    if fail:
+        async def broken(conversation, user_input):
+            raise RuntimeError("provider error")
+        chains._analyze = broken
+    
+    events = []
+    
+    async def send(event):
+        events.append(event)
+    
+    session = TriageSession("test", config, chains, send, asyncio.Semaphore(1))
+    asyncio.run(session._process_turn(text, 0.0))
+    return session, events
+
+
+def test_successful_turn_is_merged(config):
+    session, _ = run_turn(config, "my dog has been vomiting since this morning")
+    assert session.case_state.turns == 1
+
+
+def test_failed_turn_leaves_the_case_unchanged(config):
+    session, events = run_turn(config, "my dog has been vomiting since this morning", fail=True)
+    assert events[-1]["type"] == "done"
+    assert session.case_state.turns == 0
+    assert session.case_state.render() == ""
+    assert session.case_state.latest_risk is None
+
+
+def test_unrefined_emergency_leaves_the_case_unchanged(config):
+    session, events = run_turn(config, "he's choking on a bone", fail=True)
+    assert events[0]["analysis"]["risk_level"] == "EMERGENCY"
+    assert session.case_state.turns == 0
+
+
+def test_placeholders_are_not_mergeable():
+    fallback, _ = ReasoningChains.__new__(ReasoningChains)._get_fallback_response()
+    keyword = EmergencyMatcher.to_overview(EmergencyMatcher().match("he collapsed"))
+    assert not ReasoningChains.is_mergeable(fallback)
+    assert not ReasoningChains.is_mergeable(keyword)
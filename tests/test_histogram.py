@@ -0,0 +1,64 @@
+"""Tests for the log-linear latency histogram"""
+import random
+
+import pytest
+
+from utils.histogram import LatencyHistogram
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) == 0.0
+    assert histogram.mean == 0.0
+    assert histogram.count_at_or_below(1.0) == 0
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram()
+    for micros in range(1, 101):
+        histogram.record(micros / 1_000_000)
+    assert histogram.percentile(50) == pytest.approx(50e-6)
+    assert histogram.percentile(100) == pytest.approx(100e-6)
+
+
+def test_percentiles_within_relative_error():
+    random.seed(3)
+    values = sorted(random.lognormvariate(-1.5, 1.0) for _ in range(5000))
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    
+    for pct in (50, 90, 95, 99):
+        exact = values[int(round(pct / 100 * len(values))) - 1]
+        assert histogram.percentile(pct) == pytest.approx(exact, rel=2 / histogram.sub_buckets)
+
+
+def test_bucket_bounds_round_trip():
+    histogram = LatencyHistogram()
+    for micros in (0, 1, 255, 256, 257, 1000, 65_535, 1_000_000, histogram.highest):
+        index = histogram._index(micros)
+        assert histogram._upper(index) >= micros
+        assert histogram._index(histogram._upper(index)) == index
+
+
+def test_min_max_mean_and_clamping():
+    histogram = LatencyHistogram(highest_seconds=1.0)
+    for value in (-0.5, 0.2, 0.4, 5.0):
+        histogram.record(value)
+    
+    assert histogram.total == 4
+    assert histogram.min == 0.0
+    assert histogram.max == 5.0
+    assert histogram.mean == pytest.approx((0.0 + 0.2 + 0.4 + 5.0) / 4)
+    assert histogram.percentile(100) == pytest.approx(1.0, rel=0.01)  # Clamped to highest_seconds
+    assert histogram.count_at_or_below(0.3) == 2
+
+
+def test_copy_is_independent():
+    histogram = LatencyHistogram()
+    histogram.record(0.1)
+    snapshot = histogram.copy()
+    histogram.record(0.2)
+    assert snapshot.total == 1
+    assert sum(snapshot.counts) == 1
+    assert histogram.total == 2
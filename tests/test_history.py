@@ -0,0 +1,118 @@
+"""Tests for the conversation history"""
+from utils.history import ConversationHistory
+from utils.text import estimate_tokens
+
+
+def rendered(history: ConversationHistory) -> str:
+    return "\n".join(history.get_history())
+
+
+def test_messages_are_rendered_in_order():
+    history = ConversationHistory()
+    history.add_user_message("my dog is limping")
+    history.add_assistant_message("How long has it been?")
+    assert history.get_context() == "User: my dog is limping\nAssistant: How long has it been?"
+    assert len(history) == 2
+
+
+def test_exchange_limit_evicts_oldest():
+    history = ConversationHistory(max_exchanges=2)
+    for index in range(4):
+        history.add_user_message(f"question {index}")
+        history.add_assistant_message(f"answer {index}")
+    assert history.get_history() == [
+        "User: question 2", "Assistant: answer 2", "User: question 3", "Assistant: answer 3"
+    ]
+    assert history.get_context() == rendered(history)
+
+
+def test_token_budget_keeps_the_latest_message():
+    history = ConversationHistory(max_tokens=10)
+    history.add_user_message("short")
+    history.add_assistant_message("a much longer reply that alone exceeds the token budget")
+    assert history.get_history() == ["Assistant: a much longer reply that alone exceeds the token budget"]
+    assert history.get_context() == rendered(history)
+
+
+def test_token_count_matches_the_estimate():
+    history = ConversationHistory(max_tokens=1000)
+    history.add_user_message("my cat sneezes")
+    history.add_assistant_message("Is she eating normally?")
+    assert history.token_count == sum(estimate_tokens(line) + 1 for line in history.get_history())
+
+
+def test_evicted_user_statements_are_summarized():
+    history = ConversationHistory(max_exchanges=1, summarize=True, summary_max_tokens=50)
+    history.add_user_message("he is twelve years old")
+    history.add_assistant_message("Thanks.")
+    history.add_user_message("he vomited twice")
+    history.add_assistant_message("I see.")
+    
+    context = history.get_context()
+    assert context.startswith(ConversationHistory.SUMMARY_PREFIX + "he is twelve years old\n")
+    assert "Thanks." not in context
+    assert context.endswith("User: he vomited twice\nAssistant: I see.")
+
+
+def test_summary_stays_within_its_budget():
+    history = ConversationHistory(max_exchanges=1, summarize=True, summary_max_tokens=8)
+    for index in range(5):
+        history.add_user_message(f"statement number {index}")
+        history.add_assistant_message("ok")
+    summary = history.get_context().split("\n")[0]
+    assert "statement number 3" in summary
+    assert "statement number 0" not in summary
+
+
+def test_retract_last_user_message():
+    history = ConversationHistory()
+    history.add_user_message("my dog has been")
+    assert history.retract_last_user_message() == "my dog has been"
+    assert history.get_context() == ""
+    
+    history.add_user_message("hello")
+    history.add_assistant_message("Hi")
+    assert history.retract_last_user_message() is None
+    assert len(history) == 2
+
+
+def test_retract_keeps_the_rendered_context_consistent():
+    history = ConversationHistory()
+    history.add_user_message("first")
+    history.add_assistant_message("reply")
+    history.add_user_message("second")
+    history.retract_last_user_message()
+    assert history.get_context() == "User: first\nAssistant: reply"
+
+
+def test_recent_context():
+    history = ConversationHistory(summarize=True, max_exchanges=1)
+    history.add_user_message("old")
+    history.add_assistant_message("old reply")
+    history.add_user_message("new")
+    assert history.get_recent_context(2) == "Assistant: old reply\nUser: new"
+    assert history.get_recent_context(0) == ""
+    assert ConversationHistory.SUMMARY_PREFIX not in history.get_recent_context(10)
+
+
+def test_case_context():
+    history = ConversationHistory()
+    for index in range(3):
+        history.add_user_message(f"question {index}")
+        history.add_assistant_message(f"answer {index}")
+    history.add_user_message("latest")
+    
+    assert history.get_case_context("", 1) == history.get_context()
+    assert history.get_case_context("Case so far: dog", 1) == (
+        "Case so far: dog\nUser: question 2\nAssistant: answer 2\nUser: latest"
+    )
+
+
+def test_clear():
+    history = ConversationHistory(max_exchanges=1, summarize=True)
+    for index in range(3):
+        history.add_user_message(f"question {index}")
+    history.clear()
+    assert history.get_context() == ""
+    assert history.token_count == 0
+    assert len(history) == 0
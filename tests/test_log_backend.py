@@ -0,0 +1,45 @@
+"""Tests for the queue-based logging backend"""
+import io
+import json
+
+from config.settings import LoggingConfig
+from utils.log_backend import ConsoleSink, LogBackend
+from utils.metrics import Metrics
+
+
+def make_backend(**overrides) -> LogBackend:
+    backend = LogBackend(LoggingConfig(**overrides))
+    stream = io.StringIO()
+    backend.sinks = [ConsoleSink(stream) if isinstance(sink, ConsoleSink) else sink for sink in backend.sinks]
+    return backend
+
+
+def test_console_only_skips_structured_records_without_counting():
+    Metrics.reset()
+    backend = make_backend()
+    backend.emit("info", "turn", "", "turn 1", timings={})
+    backend.close()
+    assert Metrics.count("log_records_sampled_out") == 0
+
+
+def test_sampled_out_structured_records_are_counted(tmp_path):
+    Metrics.reset()
+    path = tmp_path / "log.jsonl"
+    backend = make_backend(console=False, json_path=str(path), sample_rates={"info": 0.0})
+    backend.emit("info", "turn", "", "turn 1")
+    backend.emit("warning", "warning", "⚠️  kept", "kept")
+    backend.close()
+    
+    assert Metrics.count("log_records_sampled_out") == 1
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record["event"] for record in records] == ["warning"]
+
+
+def test_console_lines_keep_their_order():
+    backend = make_backend()
+    stream = backend.sinks[0].stream
+    for index in range(50):
+        backend.emit("info", "info", f"line {index}")
+    backend.flush()
+    assert stream.getvalue().split() == [word for index in range(50) for word in ("line", str(index))]
+    backend.close()
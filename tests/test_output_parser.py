@@ -0,0 +1,85 @@
+"""Tests for the lenient analysis parser helpers"""
+import json
+
+import pytest
+
+from chains.output_parser import extract_json_block, repair_json
+from models.schemas import normalize_risk_level
+
+
+class TestExtractJsonBlock:
+    def test_plain_object(self):
+        assert extract_json_block('{"a": 1}') == '{"a": 1}'
+    
+    def test_strips_fences_and_prose(self):
+        text = 'Here is the analysis:\n```json\n{"a": {"b": [1, 2]}}\n```\nThanks'
+        assert extract_json_block(text) == '{"a": {"b": [1, 2]}}'
+    
+    def test_brackets_inside_strings_are_ignored(self):
+        text = '{"a": "}{ ]", "b": \'}\'} trailing'
+        assert extract_json_block(text) == '{"a": "}{ ]", "b": \'}\'}'
+    
+    def test_escaped_quote_inside_string(self):
+        text = '{"a": "say \\"}\\" now"} tail'
+        assert extract_json_block(text) == '{"a": "say \\"}\\" now"}'
+    
+    def test_truncated_object_drops_closing_fence(self):
+        assert extract_json_block('```json\n{"a": [1, 2\n```') == '{"a": [1, 2'
+    
+    def test_no_object(self):
+        assert extract_json_block("no json here") == ""
+
+
+class TestRepairJson:
+    @pytest.mark.parametrize("text, expected", [
+        ('{"a": 12, "b": [1.5, 20,],}', {"a": 12, "b": [1.5, 20]}),
+        ('{"a": 12 "b": [1.5 -2e3 20]}', {"a": 12, "b": [1.5, -2000.0, 20]}),
+        ('{"a": 1E+2, "b": -0.25}', {"a": 100.0, "b": -0.25}),
+    ])
+    def test_numbers_are_single_tokens(self, text, expected):
+        assert json.loads(repair_json(text)) == expected
+    
+    def test_single_quotes_and_python_literals(self):
+        repaired = repair_json("{'a': True, 'b': None, 'c': 'say \"hi\"'}")
+        assert json.loads(repaired) == {"a": True, "b": None, "c": 'say "hi"'}
+    
+    def test_raw_newline_in_string(self):
+        assert json.loads(repair_json('{"a": "line one\nline two"}')) == {"a": "line one\nline two"}
+    
+    def test_missing_commas_between_values(self):
+        repaired = repair_json('{"a": "x" "b": ["y" "z"] "c": {"d": false} "e": 1}')
+        assert json.loads(repaired) == {"a": "x", "b": ["y", "z"], "c": {"d": False}, "e": 1}
+    
+    @pytest.mark.parametrize("text, expected", [
+        ('{"a": "unterminated', {"a": "unterminated"}),
+        ('{"a": [1, 2', {"a": [1, 2]}),
+        ('{"a": 1, "b":', {"a": 1}),
+        ('{"a": 1, "b": tru', {"a": 1}),
+        ('{"a": 1, "b"', {"a": 1}),
+        ('{"a": {"b": "c', {"a": {"b": "c"}}),
+    ])
+    def test_truncation(self, text, expected):
+        assert json.loads(repair_json(text)) == expected
+    
+    def test_valid_json_is_unchanged(self):
+        text = '{"a": [1, 2.5, -3e2], "b": {"c": "d, e"}, "f": null}'
+        assert json.loads(repair_json(text)) == json.loads(text)
+
+
+class TestNormalizeRiskLevel:
+    @pytest.mark.parametrize("value, expected", [
+        ("MODERATE", "MODERATE"),
+        ("Moderate", "MODERATE"),
+        ("high risk", "HIGH"),
+        ("Risk level: low", "LOW"),
+        ("medium", "MODERATE"),
+        ("critical", "EMERGENCY"),
+        ("life-threatening", "EMERGENCY"),
+        ("**Emergency**", "EMERGENCY"),
+    ])
+    def test_known_wordings(self, value, expected):
+        assert normalize_risk_level(value) == expected
+    
+    @pytest.mark.parametrize("value", ["banana", "", None, 3])
+    def test_unrecognized_is_returned_unchanged(self, value):
+        assert normalize_risk_level(value) == value
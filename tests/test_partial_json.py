@@ -0,0 +1,79 @@
+"""Tests for the incremental JSON scanner"""
+import pytest
+
+from chains.partial_json import IncrementalJSONScanner
+
+
+def scan(*chunks):
+    scanner = IncrementalJSONScanner()
+    completed = []
+    for chunk in chunks:
+        completed.extend(scanner.feed(chunk))
+    return completed, scanner.done
+
+
+def test_values_split_across_chunks():
+    completed, done = scan('{"risk_le', 'vel": "HI', 'GH", "n": 1', '2, "ok": tr', 'ue}')
+    assert completed == [(("risk_level",), "HIGH"), (("n",), 12), (("ok",), True)]
+    assert done
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7])
+def test_chunk_size_does_not_change_the_result(size):
+    text = '{"s": {"list": ["x", "y"], "d": null}, "r": "LOW", "n": -1.5e2}'
+    chunks = [text[start:start + size] for start in range(0, len(text), size)]
+    assert scan(*chunks) == scan(text)
+
+
+def test_a_number_completes_only_when_it_ends():
+    completed, done = scan('{"a": 12')
+    assert completed == []
+    assert not done
+
+
+def test_escapes_inside_strings():
+    completed, done = scan(r'{"a": "say \"hi\" \\ é", "b": "}"}')
+    assert completed == [(("a",), 'say "hi" \\ é'), (("b",), "}")]
+    assert done
+
+
+def test_escapes_split_across_chunks():
+    completed, done = scan('{"a": "x\\', '"y\\u00', 'e9", "k\\"ey": 1}')
+    assert completed == [(("a",), 'x"yé'), (('k"ey',), 1)]
+    assert done
+
+
+def test_nested_values_report_their_path():
+    completed, done = scan('{"s": {"list": ["x", "y"], "d": null}, "r": "LOW"}')
+    assert completed == [
+        (("s", "list", "0"), "x"),
+        (("s", "list", "1"), "y"),
+        (("s", "list"), ["x", "y"]),
+        (("s", "d"), None),
+        (("s",), {"list": ["x", "y"], "d": None}),
+        (("r",), "LOW"),
+    ]
+    assert done
+
+
+def test_nested_arrays_and_empty_containers():
+    completed, _ = scan('{"a": [1, [2]], "b": []}')
+    assert completed == [
+        (("a", "0"), 1),
+        (("a", "1", "0"), 2),
+        (("a", "1"), [2]),
+        (("a",), [1, [2]]),
+        (("b",), []),
+    ]
+
+
+def test_truncated_nesting_reports_only_completed_values():
+    completed, done = scan('{"s": {"list": ["x", "y')
+    assert completed == [(("s", "list", "0"), "x")]
+    assert not done
+
+
+def test_text_around_the_object_is_ignored():
+    completed, done = scan('```json\n{"a": 1}', '```\n{"b": 2}')
+    assert completed == [(("a",), 1)]
+    assert done
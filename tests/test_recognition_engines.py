@@ -0,0 +1,58 @@
+"""Tests for the speech-to-text engine interface"""
+import pytest
+
+sr = pytest.importorskip("speech_recognition")
+
+from Voice.recognition_engines import RecognitionEngine
+
+
+class EchoEngine(RecognitionEngine):
+    """Non-streaming engine reporting what it was asked to transcribe"""
+    
+    def __init__(self, text: str = "my dog is limping"):
+        self.text = text
+        self.calls = []
+    
+    def transcribe(self, audio):
+        self.calls.append(audio)
+        if not self.text:
+            raise sr.UnknownValueError()
+        return self.text
+
+
+def test_transcribe_is_abstract():
+    class Incomplete(RecognitionEngine):
+        pass
+    
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_default_stream_transcribes_once_at_end_of_speech():
+    engine = EchoEngine()
+    stream = engine.open_stream(16000)
+    assert stream.accept(b"\x01\x00" * 160) is None
+    assert stream.accept(b"\x02\x00" * 160) is None
+    assert engine.calls == []
+    
+    assert stream.finish() == "my dog is limping"
+    (audio,) = engine.calls
+    assert audio.sample_rate == 16000
+    assert audio.sample_width == 2
+    assert audio.frame_data == b"\x01\x00" * 160 + b"\x02\x00" * 160
+
+
+def test_default_stream_returns_empty_for_unintelligible_speech():
+    stream = EchoEngine(text="").open_stream(16000)
+    stream.accept(b"\x00\x00" * 160)
+    assert stream.finish() == ""
+
+
+def test_request_errors_reach_the_listener():
+    class FailingEngine(RecognitionEngine):
+        def transcribe(self, audio):
+            raise sr.RequestError("offline")
+    
+    stream = FailingEngine().open_stream(16000)
+    with pytest.raises(sr.RequestError):
+        stream.finish()
@@ -0,0 +1,60 @@
+"""Tests for the small-talk classifier"""
+import pytest
+
+from chains.small_talk import MAX_CHARS, SmallTalkClassifier
+from utils.metrics import Metrics
+
+
+@pytest.fixture(scope="module")
+def classifier():
+    return SmallTalkClassifier()
+
+
+@pytest.mark.parametrize("text, intent", [
+    ("okay", "acknowledge"),
+    ("Okay, thanks!", "thanks"),
+    ("um, can you repeat that please", "repeat"),
+    ("hold on a second", "hold"),
+    ("bye bye", "goodbye"),
+    ("thank you so much for your help", "thanks"),
+    ("okay, wait, what?", "repeat"),
+    ("  Sure.  ", "acknowledge"),
+])
+def test_intents(classifier, text, intent):
+    assert classifier.classify(text) == intent
+
+
+@pytest.mark.parametrize("text", [
+    "okay, but he's limping",
+    "thanks, he also threw up",
+    "my dog is vomiting",
+    "",
+    "um",
+    "okay " * (MAX_CHARS // 5 + 1),
+])
+def test_content_reaches_the_llm(classifier, text):
+    assert classifier.classify(text) is None
+
+
+def test_answers_are_not_intercepted_while_a_question_is_pending(classifier):
+    assert classifier.classify("yes", question_pending=True) is None
+    assert classifier.classify("thanks", question_pending=True) == "thanks"
+
+
+@pytest.mark.parametrize("reply, asks", [
+    ("Is he still eating?", True),
+    ("I'm sorry to hear that. How old is she?", True),
+    ("Is he eating? Either way, please call your vet.", False),
+    ("Please call your vet if it gets worse.", False),
+    ("", False),
+])
+def test_asks_question_checks_the_last_sentence(reply, asks):
+    assert SmallTalkClassifier.asks_question(reply) is asks
+
+
+def test_classify_turn_records_metrics(classifier):
+    Metrics.reset()
+    assert classifier.classify_turn("yes", "Is he eating? Either way, call your vet.") == "acknowledge"
+    assert classifier.classify_turn("yes", "Is he eating?") is None
+    assert Metrics.count("small_talk_acknowledge") == 1
+    assert Metrics.summary()["timings"]["small_talk_classify"]["count"] == 2
@@ -0,0 +1,32 @@
+"""Tests for the text helpers"""
+import pytest
+
+from utils.text import looks_incomplete
+
+
+@pytest.mark.parametrize("text", [
+    "my dog has been",
+    "she won't eat and",
+    "my cat is limping on her",
+    "um, so the",
+    "he ate something with",
+    "And, um,",
+    "he ate the...",
+    "it started since —",
+    "THE",
+])
+def test_fragments_cut_off_mid_sentence(text):
+    assert looks_incomplete(text)
+
+
+@pytest.mark.parametrize("text", [
+    "my dog has been vomiting",
+    "he is limping.",
+    "is it the?",
+    "yes",
+    "he's twelve years old",
+    "",
+    "   ",
+])
+def test_finished_sentences(text):
+    assert not looks_incomplete(text)
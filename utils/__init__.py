@@ -1,5 +1,24 @@
 """Utils package - exports utility classes"""
-from .history import ConversationHistory
-from .logger import Logger
+from typing import TYPE_CHECKING
 
-__all__ = ['ConversationHistory', 'Logger']
+from .lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .history import ConversationHistory
+    from .logger import Logger
+    from .metrics import Metrics
+    from .text import SentenceSplitter
+    from .tracing import Tracer
+    from .exporters import MetricsExporter
+    from .coalescer import UtteranceCoalescer
+
+# Export name -> defining module, loaded on first use (utils/lazy.py)
+__getattr__, __dir__, __all__ = lazy_exports(__name__, {
+    'ConversationHistory': '.history',
+    'Logger': '.logger',
+    'Metrics': '.metrics',
+    'SentenceSplitter': '.text',
+    'Tracer': '.tracing',
+    'MetricsExporter': '.exporters',
+    'UtteranceCoalescer': '.coalescer',
+})
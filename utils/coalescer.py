@@ -0,0 +1,90 @@
+"""
+Utterance Coalescing
+Merges speech fragments that arrive in quick succession into one turn
+"""
+import asyncio
+import time
+from typing import Optional, Tuple
+
+from .metrics import Metrics
+from .text import looks_incomplete
+
+
+class UtteranceCoalescer:
+    """
+    Debounces a queue of (text, received_at) utterances
+    
+    Callers often pause mid-sentence, so the recognizer emits "my dog
+    has been" and "throwing up since this morning" as two utterances,
+    each of which would cost a full LLM pass. After taking a fragment the
+    coalescer waits for another one when the fragment looks unfinished
+    (and, if `window` is set, briefly after every fragment), then hands
+    the joined text on as a single turn. Fragments already queued are
+    always merged, so it is meant for one speaker's recognizer output,
+    not for separately submitted messages.
+    Counters: `utterance_fragments` (taken from the queue) and
+    `fragments_merged` (appended to an earlier fragment).
+    """
+    
+    def __init__(self, window: float = 0.0, incomplete_wait: float = 1.5, max_hold: float = 4.0):
+        """
+        Initialize the coalescer
+        
+        Args:
+            window: Seconds to wait for a follow-up after a complete-looking
+                fragment; every such turn is delayed by this much
+                (0 only merges fragments already queued)
+            incomplete_wait: Seconds to wait after a fragment that looks
+                cut off mid-sentence
+            max_hold: Upper bound on the total wait from the first fragment
+        """
+        self.window = window
+        self.incomplete_wait = incomplete_wait
+        self.max_hold = max_hold
+    
+    async def next(self, pending: asyncio.Queue) -> Optional[Tuple[str, float]]:
+        """
+        Take the next utterance, merged with any fragments that follow it
+        
+        Args:
+            pending: Queue of (text, received_at) items; None is the
+                shutdown sentinel
+                
+        Returns:
+            (merged text, received_at of the first fragment), or None on
+            shutdown. A sentinel seen while waiting is put back, so the
+            merged text is still returned and the next call returns None.
+        """
+        item = await pending.get()
+        if item is None:
+            return None
+        
+        text, received_at = item
+        parts = [text]
+        Metrics.increment("utterance_fragments")
+        hold_until = time.perf_counter() + self.max_hold
+        
+        while True:
+            wait = self.incomplete_wait if looks_incomplete(parts[-1]) else self.window
+            wait = min(wait, hold_until - time.perf_counter())
+            
+            if not pending.empty():
+                follow_up = pending.get_nowait()  # Already queued: always merge
+            elif wait > 0:
+                try:
+                    follow_up = await asyncio.wait_for(pending.get(), wait)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                break
+            
+            if follow_up is None:
+                pending.put_nowait(None)
+                break
+            parts.append(follow_up[0])
+            Metrics.increment("utterance_fragments")
+            Metrics.increment("fragments_merged")
+        
+        if len(parts) > 1:
+            Metrics.record("coalesce_wait", time.perf_counter() - received_at)
+        return " ".join(parts), received_at
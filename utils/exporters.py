@@ -0,0 +1,173 @@
+"""
+Metrics Exporters
+Prometheus text exposition and JSON snapshots of Metrics and Tracer
+"""
+import json
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from config.settings import TracingConfig
+from .logger import Logger
+from .metrics import Metrics
+from .tracing import Tracer
+
+# Prometheus histogram bucket bounds in seconds
+PROMETHEUS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+METRIC_PREFIX = "pet_agent_"
+
+
+def _metric_name(name: str) -> str:
+    """Sanitize a metric name for Prometheus"""
+    return METRIC_PREFIX + re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+
+def prometheus_text() -> str:
+    """
+    Render all timings and counters in the Prometheus text format
+    
+    Returns:
+        Exposition text (timings as histograms in seconds, counters as totals)
+    """
+    lines = []
+    for name, histogram in sorted(Metrics.histograms().items()):
+        metric = _metric_name(name) + "_seconds"
+        lines.append(f"# TYPE {metric} histogram")
+        for bound in PROMETHEUS_BUCKETS:
+            lines.append(f'{metric}_bucket{{le="{bound}"}} {histogram.count_at_or_below(bound)}')
+        lines.append(f'{metric}_bucket{{le="+Inf"}} {histogram.total}')
+        lines.append(f"{metric}_sum {histogram.sum:.6f}")
+        lines.append(f"{metric}_count {histogram.total}")
+    
+    for name, value in sorted(Metrics.counters().items()):
+        metric = _metric_name(name) + "_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"{metric} {value}")
+    
+    return "\n".join(lines) + "\n"
+
+
+def json_snapshot() -> dict:
+    """
+    Whole-run latency percentiles, counters and recent turn traces
+    
+    Returns:
+        JSON-serializable dict (durations in milliseconds)
+    """
+    timings = {}
+    for name, histogram in sorted(Metrics.histograms().items()):
+        timings[name] = {
+            "count": histogram.total,
+            "mean_ms": round(histogram.mean * 1000, 2),
+            "min_ms": round(histogram.min * 1000, 2),
+            "p50_ms": round(histogram.percentile(50) * 1000, 2),
+            "p90_ms": round(histogram.percentile(90) * 1000, 2),
+            "p99_ms": round(histogram.percentile(99) * 1000, 2),
+            "p999_ms": round(histogram.percentile(99.9) * 1000, 2),
+            "max_ms": round(histogram.max * 1000, 2),
+        }
+    return {
+        "timings": timings,
+        "counters": Metrics.counters(),
+        "recent_turns": Tracer.recent()
+    }
+
+
+def write_json(path: str):
+    """Write json_snapshot() atomically (readers never see a partial file)"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(json_snapshot(), f, indent=2)
+    os.replace(tmp_path, path)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves /metrics (Prometheus) and /metrics.json"""
+    
+    def do_GET(self):
+        if self.path == "/metrics":
+            body = prometheus_text().encode()
+            content_type = "text/plain; version=0.0.4"
+        elif self.path == "/metrics.json":
+            body = json.dumps(json_snapshot()).encode()
+            content_type = "application/json"
+        else:
+            self.send_error(404)
+            return
+        
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass  # Keep scrapes out of the console
+
+
+class MetricsExporter:
+    """Local metrics endpoint and/or periodic JSON file, per TracingConfig"""
+    
+    def __init__(self, config: TracingConfig):
+        """
+        Initialize the exporter (nothing runs until start())
+        
+        Args:
+            config: Tracing configuration
+        """
+        self.config = config
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._stop = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+    
+    def start(self):
+        """Start the HTTP endpoint and JSON writer that are configured"""
+        if self.config.prometheus_port is not None:
+            try:
+                self._server = ThreadingHTTPServer(
+                    (self.config.prometheus_host, self.config.prometheus_port),
+                    _MetricsHandler
+                )
+            except OSError as e:
+                Logger.warning(f"Could not start metrics endpoint: {e}")
+            else:
+                threading.Thread(
+                    target=self._server.serve_forever,
+                    daemon=True,
+                    name="MetricsHTTPThread"
+                ).start()
+                host, port = self._server.server_address[:2]
+                Logger.info(f"Metrics at http://{host}:{port}/metrics")
+        
+        if self.config.json_path:
+            self._writer = threading.Thread(
+                target=self._write_periodically,
+                daemon=True,
+                name="MetricsJSONThread"
+            )
+            self._writer.start()
+    
+    def _write_periodically(self):
+        """Rewrite the JSON snapshot every json_interval seconds"""
+        while not self._stop.wait(self.config.json_interval):
+            self._write_json()
+    
+    def _write_json(self):
+        """Write one snapshot, reporting (not raising) I/O errors"""
+        try:
+            write_json(self.config.json_path)
+        except OSError as e:
+            Logger.warning(f"Could not write metrics JSON: {e}")
+    
+    def stop(self):
+        """Stop exporting; writes a final JSON snapshot if configured"""
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self.config.json_path:
+            self._write_json()
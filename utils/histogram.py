@@ -0,0 +1,113 @@
+"""
+Latency Histogram
+Fixed-memory, log-linear (HDR-style) histogram of durations
+"""
+from typing import List
+
+
+class LatencyHistogram:
+    """
+    Records durations with bounded relative error in constant memory
+    
+    Values are stored as integer microseconds. The first `sub_buckets`
+    values get one bucket each; above that every power of two is split
+    into sub_buckets / 2 linear buckets, so each bucket is at most
+    2 / sub_buckets wide relative to its value (under 1% with 256).
+    Recording is O(1) and never allocates, unlike keeping raw samples.
+    """
+    
+    def __init__(self, highest_seconds: float = 3600.0, sub_bucket_bits: int = 8):
+        """
+        Initialize an empty histogram
+        
+        Args:
+            highest_seconds: Largest trackable value (larger values are clamped)
+            sub_bucket_bits: log2 of buckets per power of two (precision)
+        """
+        self.sub_bucket_bits = sub_bucket_bits
+        self.sub_buckets = 1 << sub_bucket_bits
+        self.half = self.sub_buckets // 2
+        self.highest = int(highest_seconds * 1_000_000)
+        
+        self.counts: List[int] = [0] * (self._index(self.highest) + 1)
+        self.total = 0
+        self.sum = 0.0
+        self.min = 0.0
+        self.max = 0.0
+    
+    def _index(self, micros: int) -> int:
+        """Bucket index for a value in microseconds"""
+        if micros < self.sub_buckets:
+            return micros
+        exponent = micros.bit_length() - self.sub_bucket_bits
+        mantissa = micros >> exponent
+        return self.sub_buckets + (exponent - 1) * self.half + (mantissa - self.half)
+    
+    def _upper(self, index: int) -> int:
+        """Largest value in microseconds that falls in a bucket"""
+        if index < self.sub_buckets:
+            return index
+        exponent = (index - self.sub_buckets) // self.half + 1
+        mantissa = (index - self.sub_buckets) % self.half + self.half
+        return ((mantissa + 1) << exponent) - 1
+    
+    def record(self, seconds: float):
+        """
+        Add one duration
+        
+        Args:
+            seconds: Duration in seconds (negative values count as 0)
+        """
+        seconds = max(0.0, seconds)
+        micros = min(int(seconds * 1_000_000), self.highest)
+        self.counts[self._index(micros)] += 1
+        
+        if self.total == 0 or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.total += 1
+        self.sum += seconds
+    
+    def percentile(self, pct: float) -> float:
+        """
+        Value at a percentile
+        
+        Args:
+            pct: Percentile between 0 and 100
+            
+        Returns:
+            Upper bound of the bucket holding the percentile, in seconds
+            (capped at the recorded maximum), or 0.0 if empty
+        """
+        if self.total == 0:
+            return 0.0
+        rank = max(1, int(round(pct / 100 * self.total)))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(self._upper(index) / 1_000_000, self.max)
+        return self.max
+    
+    def count_at_or_below(self, seconds: float) -> int:
+        """
+        Number of recorded values at or below a bound (cumulative bucket count)
+        
+        Args:
+            seconds: Upper bound in seconds
+        """
+        limit = self._index(min(int(seconds * 1_000_000), self.highest))
+        return sum(self.counts[:limit + 1])
+    
+    @property
+    def mean(self) -> float:
+        """Mean recorded value in seconds"""
+        return self.sum / self.total if self.total else 0.0
+    
+    def copy(self) -> 'LatencyHistogram':
+        """Independent snapshot of this histogram"""
+        clone = LatencyHistogram.__new__(LatencyHistogram)
+        clone.__dict__.update(self.__dict__)
+        clone.counts = list(self.counts)
+        return clone
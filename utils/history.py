@@ -2,21 +2,56 @@
 Conversation History Manager
 Handles chat history storage and formatting
 """
-from typing import List
+from collections import deque
+from itertools import islice
+from typing import Deque, List, Optional, Tuple
+
+from .text import estimate_tokens
 
 
 class ConversationHistory:
-    """Manages conversation history with size limits"""
+    """
+    Manages conversation history within a token budget
+    
+    Messages are kept in a deque with their token counts cached, and the
+    rendered context string is updated on append/evict instead of being
+    re-joined every turn. When the budget is exceeded the oldest messages
+    are evicted; with summarization on, evicted user statements are kept
+    in a bounded rolling summary so earlier symptoms are not lost.
+    """
+    
+    SUMMARY_PREFIX = "Earlier in this call the user said: "
     
-    def __init__(self, max_exchanges: int = 10):
+    def __init__(
+        self,
+        max_exchanges: int = 10,
+        max_tokens: Optional[int] = None,
+        summarize: bool = False,
+        summary_max_tokens: int = 200
+    ):
         """
         Initialize conversation history
         
         Args:
             max_exchanges: Maximum number of exchanges to keep
+            max_tokens: Token budget for the rendered context (None: unlimited)
+            summarize: Compact evicted user messages into a rolling summary
+            summary_max_tokens: Token budget for the rolling summary
         """
         self.max_exchanges = max_exchanges
-        self._history: List[str] = []
+        self.max_tokens = max_tokens
+        self.summarize = summarize
+        self.summary_max_tokens = summary_max_tokens
+        
+        # (line, tokens) per message, plus running totals
+        self._history: Deque[Tuple[str, int]] = deque()
+        self._tokens = 0
+        self._rendered = ""
+        
+        # Rolling summary of evicted user statements, oldest first
+        self._summary: Deque[Tuple[str, int]] = deque()
+        self._summary_tokens = 0
+        self._summary_rendered = ""
     
     def add_user_message(self, message: str):
         """
@@ -25,8 +60,7 @@ class ConversationHistory:
         Args:
             message: User's message text
         """
-        self._history.append(f"User: {message}")
-        self._trim_history()
+        self._append(f"User: {message}")
     
     def add_assistant_message(self, message: str):
         """
@@ -35,13 +69,76 @@ class ConversationHistory:
         Args:
             message: Assistant's message text
         """
-        self._history.append(f"Assistant: {message}")
+        self._append(f"Assistant: {message}")
+    
+    def _append(self, line: str):
+        """Add a rendered line and update the cached context"""
+        tokens = estimate_tokens(line) + 1  # +1 for the newline separator
+        self._history.append((line, tokens))
+        self._tokens += tokens
+        self._rendered = f"{self._rendered}\n{line}" if self._rendered else line
         self._trim_history()
     
+    def retract_last_user_message(self) -> Optional[str]:
+        """
+        Remove the latest message if it is an unanswered user message
+        (e.g. its turn was cancelled before any reply)
+        
+        Returns:
+            The removed message text, or None if the latest is not a user message
+        """
+        if not self._history or not self._history[-1][0].startswith("User: "):
+            return None
+        
+        line, tokens = self._history.pop()
+        self._tokens -= tokens
+        self._rendered = self._rendered[:-(len(line) + 1)] if self._history else ""
+        return line[len("User: "):]
+    
     def _trim_history(self):
-        """Keep only the last N exchanges"""
-        if len(self._history) > self.max_exchanges * 2:  # *2 for user+assistant pairs
-            self._history = self._history[-(self.max_exchanges * 2):]
+        """Evict the oldest messages beyond the exchange limit or token budget"""
+        while len(self._history) > self.max_exchanges * 2:  # *2 for user+assistant pairs
+            self._evict_oldest()
+        
+        if self.max_tokens is None:
+            return
+        
+        # The summary has its own reserved share of the budget
+        line_budget = self.max_tokens - (self.summary_max_tokens if self.summarize else 0)
+        
+        # Always keep the latest message, even if it alone exceeds the budget
+        while len(self._history) > 1 and self._tokens > line_budget:
+            self._evict_oldest()
+    
+    def _evict_oldest(self):
+        """Drop the oldest message, folding user statements into the summary"""
+        line, tokens = self._history.popleft()
+        self._tokens -= tokens
+        self._rendered = self._rendered[len(line) + 1:]
+        
+        if self.summarize and line.startswith("User: "):
+            self._add_to_summary(line[len("User: "):])
+    
+    def _add_to_summary(self, statement: str):
+        """Append an evicted statement to the rolling summary"""
+        tokens = estimate_tokens(statement) + 1
+        self._summary.append((statement, tokens))
+        self._summary_tokens += tokens
+        
+        # Drop the oldest statements until the summary fits its budget
+        while self._summary and self._summary_tokens > self.summary_max_tokens:
+            _, tokens = self._summary.popleft()
+            self._summary_tokens -= tokens
+        
+        self._summary_rendered = (
+            self.SUMMARY_PREFIX + " | ".join(statement for statement, _ in self._summary)
+            if self._summary else ""
+        )
+    
+    @property
+    def token_count(self) -> int:
+        """Estimated tokens in the rendered context (summary included)"""
+        return self._tokens + self._summary_tokens
     
     def get_context(self) -> str:
         """
@@ -50,9 +147,42 @@ class ConversationHistory:
         Returns:
             Formatted conversation history as string
         """
-        if not self._history:
+        if self._summary_rendered:
+            return f"{self._summary_rendered}\n{self._rendered}"
+        return self._rendered
+    
+    def get_recent_context(self, max_messages: int) -> str:
+        """
+        Get only the latest messages, without the rolling summary
+        
+        Args:
+            max_messages: Number of most recent messages to include
+            
+        Returns:
+            Formatted recent messages as string
+        """
+        if max_messages <= 0:
             return ""
-        return "\n".join(self._history)
+        recent = [line for line, _ in islice(reversed(self._history), max_messages)]
+        return "\n".join(reversed(recent))
+    
+    def get_case_context(self, case_summary: str, recent_exchanges: int) -> str:
+        """
+        Prompt context: the case summary plus only the most recent
+        exchanges, or the full history while there is no summary yet
+        
+        Args:
+            case_summary: Rendered case state ("" if empty or disabled)
+            recent_exchanges: Exchanges to keep next to the summary
+            
+        Returns:
+            Conversation context string
+        """
+        if not case_summary:
+            return self.get_context()
+        
+        # Recent exchanges plus the new user message
+        return f"{case_summary}\n{self.get_recent_context(recent_exchanges * 2 + 1)}"
     
     def get_history(self) -> List[str]:
         """
@@ -61,11 +191,16 @@ class ConversationHistory:
         Returns:
             List of conversation messages
         """
-        return self._history.copy()
+        return [line for line, _ in self._history]
     
     def clear(self):
         """Clear all history"""
         self._history.clear()
+        self._tokens = 0
+        self._rendered = ""
+        self._summary.clear()
+        self._summary_tokens = 0
+        self._summary_rendered = ""
     
     def __len__(self) -> int:
         """Get number of messages in history"""
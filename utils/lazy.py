@@ -0,0 +1,39 @@
+"""
+Lazy Package Exports
+Resolves a package's exports on first access (PEP 562), so importing one
+light class does not pull in the heavy dependencies of its siblings
+"""
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """
+    Module-level __getattr__, __dir__ and __all__ for a package
+    
+    Usage, in the package's __init__.py:
+        __getattr__, __dir__, __all__ = lazy_exports(__name__, {...})
+    
+    Args:
+        package: The package's __name__
+        exports: Export name -> defining module, relative to the package
+        
+    Returns:
+        Tuple of (__getattr__, __dir__, __all__)
+    """
+    names = list(exports)
+    
+    def __getattr__(name: str) -> Any:
+        """Import an export's module on first access"""
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        setattr(sys.modules[package], name, value)  # Later lookups skip __getattr__
+        return value
+    
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(names))
+    
+    return __getattr__, __dir__, names
@@ -0,0 +1,225 @@
+"""
+Logging Backend
+Queue-based, non-blocking delivery of log records to console and JSON sinks
+"""
+import atexit
+import json
+import queue
+import random
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, TextIO, Tuple
+
+from config.settings import LoggingConfig
+from .metrics import Metrics
+from .tracing import Tracer
+
+LEVELS = {"debug": 10, "info": 20, "warning": 30, "error": 40}
+
+# Session the current task is serving (set per server connection)
+_session_id: ContextVar[Optional[str]] = ContextVar("log_session_id", default=None)
+
+# (record, console text, structured?) as queued for the writer
+LogItem = Tuple[dict, str, bool]
+
+
+class ConsoleSink:
+    """Human-readable emoji output (the original Logger format)"""
+    
+    def __init__(self, stream: Optional[TextIO] = None):
+        self.stream = stream
+    
+    def write(self, items: List[LogItem]):
+        stream = self.stream or sys.stdout  # Resolved late so redirection still works
+        stream.write("".join(text + "\n" for _, text, _ in items if text))
+        stream.flush()
+    
+    def close(self):
+        pass
+
+
+class JSONSink:
+    """One JSON object per line, to a file or stdout ("-")"""
+    
+    def __init__(self, path: str):
+        self._owned = path != "-"
+        self.stream = open(path, "a", encoding="utf-8") if self._owned else sys.stdout
+    
+    def write(self, items: List[LogItem]):
+        lines = [
+            json.dumps(record, default=str) + "\n"
+            for record, _, structured in items if structured
+        ]
+        if lines:
+            self.stream.write("".join(lines))
+            self.stream.flush()
+    
+    def close(self):
+        if self._owned:
+            self.stream.close()
+
+
+class LogBackend:
+    """
+    Hands log records to a writer thread through a bounded queue
+    
+    Callers (event loop, listening thread, TTS thread) never wait on a
+    terminal or file: a record is built and queued, and when the queue is
+    full it is dropped and counted. The writer drains everything waiting
+    in one go and writes each batch to every sink with a single call.
+    Per-level sampling thins the structured records only; the console
+    always shows every line.
+    """
+    
+    def __init__(self, config: LoggingConfig):
+        """
+        Initialize the backend and start its writer thread
+        
+        Args:
+            config: Logging configuration
+        """
+        self.config = config
+        self.min_level = LEVELS.get(config.level, LEVELS["info"])
+        self.sample_rates: Dict[str, float] = dict(config.sample_rates)
+        
+        self.sinks = []
+        if config.console:
+            self.sinks.append(ConsoleSink())
+        if config.json_path:
+            self.sinks.append(JSONSink(config.json_path))
+        self._structured = bool(config.json_path)
+        self._console = config.console
+        
+        self._queue: queue.Queue = queue.Queue(maxsize=config.queue_size)
+        self._closed = False
+        self._writer = threading.Thread(target=self._run, daemon=True, name="LogWriterThread")
+        self._writer.start()
+    
+    def emit(self, level: str, event: str, text: str, message: str = "", **fields):
+        """
+        Queue one record without blocking
+        
+        Args:
+            level: "debug", "info", "warning" or "error"
+            event: Record type (e.g. "user_speech", "analysis")
+            text: Console rendering ("" for structured-only records)
+            message: Plain message for the structured record
+            **fields: Extra structured data (timings, analysis, ...)
+        """
+        if self._closed or LEVELS.get(level, LEVELS["info"]) < self.min_level:
+            return
+        
+        structured = self._structured and random.random() < self.sample_rates.get(level, 1.0)
+        if not structured and not (self._console and text):
+            # Structured-only records have nowhere to go without a JSON sink
+            if self._structured:
+                Metrics.increment("log_records_sampled_out")
+            return
+        
+        record = {
+            "ts": round(time.time(), 6),
+            "level": level,
+            "event": event,
+            "message": message or text.strip(),
+        }
+        session_id = _session_id.get()
+        if session_id is not None:
+            record["session_id"] = session_id
+        trace = Tracer.current()
+        if trace is not None:
+            record["turn_id"] = trace.turn_id
+            record["turn_elapsed_ms"] = round((time.perf_counter() - trace.started) * 1000, 1)
+        record.update(fields)
+        
+        try:
+            self._queue.put_nowait((record, text, structured))
+        except queue.Full:
+            Metrics.increment("log_records_dropped")
+    
+    def _run(self):
+        """Writer thread: block for one item, then take everything queued behind it"""
+        while True:
+            item = self._queue.get()
+            batch: List[LogItem] = []
+            flushes: List[threading.Event] = []
+            stopping = False
+            
+            while True:
+                if isinstance(item, threading.Event):
+                    flushes.append(item)
+                elif item is None:
+                    stopping = True
+                else:
+                    batch.append(item)
+                if len(batch) >= self.config.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            
+            if batch:
+                for sink in self.sinks:
+                    try:
+                        sink.write(batch)
+                    except Exception:
+                        Metrics.increment("log_sink_errors")
+            for done in flushes:
+                done.set()
+            if stopping:
+                return
+    
+    def flush(self, timeout: float = 2.0):
+        """Wait until everything queued so far has been written"""
+        if self._closed or not self._writer.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+    
+    def close(self, timeout: float = 2.0):
+        """Write what is queued, stop the writer and close the sinks"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._writer.join(timeout)
+        for sink in self.sinks:
+            sink.close()
+
+
+_backend: Optional[LogBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_backend() -> LogBackend:
+    """The process-wide backend (console-only with defaults until configured)"""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = LogBackend(LoggingConfig())
+    return _backend
+
+
+def configure(config: LoggingConfig) -> LogBackend:
+    """Replace the backend, draining the previous one first"""
+    global _backend
+    with _backend_lock:
+        previous, _backend = _backend, LogBackend(config)
+    if previous is not None:
+        previous.close()
+    return _backend
+
+
+def bind_session(session_id: Optional[str]):
+    """Tag records from the current task (and tasks it creates) with a session id"""
+    _session_id.set(session_id)
+
+
+@atexit.register
+def _drain_at_exit():
+    if _backend is not None:
+        _backend.close()
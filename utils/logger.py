@@ -1,74 +1,205 @@
 """
 Logging Utilities
 Provides consistent logging across the application
+
+Every method builds its console line and a structured record and hands
+both to the queue-based backend (utils/log_backend.py), so callers on the
+event loop or audio threads never block on output.
 """
-from typing import List
-from models.schemas import HealthOverview
+from typing import TYPE_CHECKING, List, Optional
+
+from config.settings import LoggingConfig
+from . import log_backend
+from .tracing import TurnTrace
+
+if TYPE_CHECKING:
+    from models.case_state import CaseState
+    from models.schemas import HealthOverview
 
 
 class Logger:
-    """Handles formatted console output"""
+    """Handles formatted console output and structured log records"""
+    
+    @staticmethod
+    def configure(config: LoggingConfig):
+        """
+        Install the logging backend described by config
+        
+        Args:
+            config: Sinks, level and sampling (defaults: console only)
+        """
+        log_backend.configure(config)
+    
+    @staticmethod
+    def bind_session(session_id: Optional[str]):
+        """Tag records from the current task with a session id"""
+        log_backend.bind_session(session_id)
+    
+    @staticmethod
+    def flush():
+        """Block until queued records have been written"""
+        log_backend.get_backend().flush()
+    
+    @staticmethod
+    def _emit(level: str, event: str, text: str, message: str = "", **fields):
+        """Queue a record on the backend"""
+        log_backend.get_backend().emit(level, event, text, message, **fields)
     
     @staticmethod
     def user_speech(text: str):
         """Log user speech"""
-        print(f"\n👤 You: {text}")
+        Logger._emit("info", "user_speech", f"\n👤 You: {text}", text)
     
     @staticmethod
     def agent_response(text: str):
         """Log agent response"""
-        print(f"\n🤖 Agent: {text}")
+        Logger._emit("info", "agent_response", f"\n🤖 Agent: {text}", text)
     
     @staticmethod
-    def structured_analysis(analysis: HealthOverview):
+    def structured_analysis(analysis: 'HealthOverview'):
         """Log structured analysis"""
-        print("\n📊 Structured Analysis:")
-        print(f"  Risk Level: {analysis.risk_level}")
-        
         symptoms = ', '.join(analysis.symptom_analysis.symptoms_identified)
-        print(f"  Symptoms: {symptoms}")
-        
-        print(f"  Requires Vet: {analysis.requires_vet}")
-        
+        lines = [
+            "\n📊 Structured Analysis:",
+            f"  Risk Level: {analysis.risk_level}",
+            f"  Symptoms: {symptoms}",
+            f"  Requires Vet: {analysis.requires_vet}",
+        ]
         if analysis.safety_flags:
             flags = ', '.join(analysis.safety_flags)
-            print(f"  Safety Flags: {flags}")
+            lines.append(f"  Safety Flags: {flags}")
+        
+        Logger._emit(
+            "info",
+            "analysis",
+            "\n".join(lines),
+            f"risk {analysis.risk_level}",
+            analysis=analysis.model_dump()
+        )
+    
+    @staticmethod
+    def case_state(state: 'CaseState'):
+        """Log the accumulated case at the end of a call"""
+        if state.turns == 0:
+            return
+        Logger._emit(
+            "info",
+            "case_state",
+            f"\n🗂️  Case Summary:\n  {state.render()}",
+            state.render(),
+            case=state.export()
+        )
     
     @staticmethod
     def info(message: str):
         """Log info message"""
-        print(f"ℹ️  {message}")
+        Logger._emit("info", "info", f"ℹ️  {message}", message)
     
     @staticmethod
     def success(message: str):
         """Log success message"""
-        print(f"✅ {message}")
+        Logger._emit("info", "success", f"✅ {message}", message)
     
     @staticmethod
     def warning(message: str):
         """Log warning message"""
-        print(f"⚠️  {message}")
+        Logger._emit("warning", "warning", f"⚠️  {message}", message)
     
     @staticmethod
     def error(message: str):
         """Log error message"""
-        print(f"❌ {message}")
+        Logger._emit("error", "error", f"❌ {message}", message)
+    
+    @staticmethod
+    def metrics(summary: dict):
+        """Log latency and counter summary"""
+        if not summary["timings"] and not summary["counters"]:
+            return
+        
+        lines = ["\n📈 Metrics:"]
+        for name, stats in summary["timings"].items():
+            lines.append(
+                f"  {name}: p50={stats['p50'] * 1000:.0f}ms "
+                f"p95={stats['p95'] * 1000:.0f}ms (n={stats['count']})"
+            )
+        for name, value in summary["counters"].items():
+            lines.append(f"  {name}: {value}")
+        fragments = summary["counters"].get("utterance_fragments", 0)
+        if fragments:
+            merged = summary["counters"].get("fragments_merged", 0)
+            lines.append(f"  fragment_merge_rate: {merged / fragments:.1%}")
+        parsed = sum(
+            summary["counters"].get(f"analysis_parse_{outcome}", 0)
+            for outcome in ("strict", "repaired", "completed")
+        )
+        parses = parsed + summary["counters"].get("analysis_parse_failed", 0)
+        if parses:
+            lines.append(f"  analysis_parse_success_rate: {parsed / parses:.1%}")
+        for name, value in summary["counters"].items():
+            if name.startswith("llm_cost_microusd_"):
+                model = name[len("llm_cost_microusd_"):]
+                lines.append(f"  llm_cost_{model}: ${value / 1_000_000:.4f}")
+        
+        Logger._emit("info", "metrics", "\n".join(lines), "metrics summary", metrics=summary)
+    
+    @staticmethod
+    def waterfall(trace: TurnTrace):
+        """Log a turn's span waterfall (debug)"""
+        Logger._emit(
+            "info",
+            "turn_trace",
+            f"\n⏱️  {trace.waterfall()}",
+            trace.label,
+            timings=trace.to_dict()["spans"]
+        )
+    
+    @staticmethod
+    def turn_timings(trace: TurnTrace):
+        """Record a finished turn's span timings (structured sinks only)"""
+        record = trace.to_dict()
+        Logger._emit(
+            "info",
+            "turn",
+            "",
+            trace.label,
+            turn_id=record["turn"],
+            turn_elapsed_ms=record["duration_ms"],
+            timings=record["spans"]
+        )
+    
+    @staticmethod
+    def report(title: str, lines: List[str], **fields):
+        """
+        Log a titled multi-line report
+        
+        Args:
+            title: Section title
+            lines: Report body lines
+            **fields: Structured form of the report
+        """
+        rule = "=" * 70
+        text = "\n".join([f"\n{rule}", title, rule, *lines])
+        Logger._emit("info", "report", text, title, **fields)
     
     @staticmethod
     def section_header(title: str):
         """Print section header"""
-        print("\n" + "="*70)
-        print(title)
-        print("="*70)
+        rule = "=" * 70
+        Logger._emit("info", "section", f"\n{rule}\n{title}\n{rule}", title)
     
     @staticmethod
     def banner():
         """Print application banner"""
-        Logger.section_header("🐾 Pet Health Voice Consultation Agent")
-        print("\nHow this works:")
-        print("  • Speak naturally about your pet's symptoms")
-        print("  • The AI will analyze and respond with guidance")
-        print("  • You can interrupt the AI at any time by speaking")
-        print("  • Press Ctrl+C to exit")
-        print("\n⚠️  IMPORTANT: This is NOT a replacement for veterinary care!")
-        print("="*70)
+        rule = "=" * 70
+        Logger._emit("info", "banner", "\n".join([
+            f"\n{rule}",
+            "🐾 Pet Health Voice Consultation Agent",
+            rule,
+            "\nHow this works:",
+            "  • Speak naturally about your pet's symptoms",
+            "  • The AI will analyze and respond with guidance",
+            "  • You can interrupt the AI at any time by speaking",
+            "  • Press Ctrl+C to exit",
+            "\n⚠️  IMPORTANT: This is NOT a replacement for veterinary care!",
+            rule,
+        ]), "agent started")
@@ -0,0 +1,129 @@
+"""
+Metrics Utilities
+Lightweight in-process latency and counter tracking
+"""
+import threading
+from collections import deque
+from typing import Deque, Dict
+
+from .histogram import LatencyHistogram
+
+
+class Metrics:
+    """
+    Process-wide registry of latency samples and counters
+    
+    Each timing keeps its most recent samples for summary() and a
+    histogram over the whole run for export (see utils/exporters.py).
+    """
+    
+    max_samples: int = 1000  # Samples kept per timing metric
+    
+    _lock = threading.Lock()
+    _timings: Dict[str, Deque[float]] = {}
+    _histograms: Dict[str, LatencyHistogram] = {}
+    _counters: Dict[str, int] = {}
+    
+    @classmethod
+    def record(cls, name: str, seconds: float):
+        """
+        Record a latency sample
+        
+        Args:
+            name: Metric name
+            seconds: Measured duration in seconds
+        """
+        with cls._lock:
+            samples = cls._timings.get(name)
+            if samples is None:
+                samples = deque(maxlen=cls.max_samples)
+                cls._timings[name] = samples
+            samples.append(seconds)
+            
+            histogram = cls._histograms.get(name)
+            if histogram is None:
+                histogram = LatencyHistogram()
+                cls._histograms[name] = histogram
+            histogram.record(seconds)
+    
+    @classmethod
+    def increment(cls, name: str, amount: int = 1):
+        """
+        Increment a counter
+        
+        Args:
+            name: Counter name
+            amount: Value to add
+        """
+        with cls._lock:
+            cls._counters[name] = cls._counters.get(name, 0) + amount
+    
+    @classmethod
+    def count(cls, name: str) -> int:
+        """Get current value of a counter"""
+        with cls._lock:
+            return cls._counters.get(name, 0)
+    
+    @classmethod
+    def percentile(cls, name: str, pct: float) -> float:
+        """
+        Get a percentile of recorded samples
+        
+        Args:
+            name: Metric name
+            pct: Percentile between 0 and 100
+            
+        Returns:
+            Sample value at the percentile, or 0.0 if no samples
+        """
+        with cls._lock:
+            samples = sorted(cls._timings.get(name, ()))
+        if not samples:
+            return 0.0
+        index = min(len(samples) - 1, int(round(pct / 100 * (len(samples) - 1))))
+        return samples[index]
+    
+    @classmethod
+    def histograms(cls) -> Dict[str, LatencyHistogram]:
+        """Snapshot of every timing's whole-run histogram"""
+        with cls._lock:
+            return {name: histogram.copy() for name, histogram in cls._histograms.items()}
+    
+    @classmethod
+    def counters(cls) -> Dict[str, int]:
+        """Snapshot of all counters"""
+        with cls._lock:
+            return dict(cls._counters)
+    
+    @classmethod
+    def summary(cls) -> dict:
+        """
+        Get a snapshot of all metrics
+        
+        Returns:
+            Dict with per-timing count/p50/p95/max and all counters
+        """
+        with cls._lock:
+            timings = {name: sorted(samples) for name, samples in cls._timings.items()}
+            counters = dict(cls._counters)
+        
+        result = {"timings": {}, "counters": counters}
+        for name, samples in timings.items():
+            if not samples:
+                continue
+            last = len(samples) - 1
+            result["timings"][name] = {
+                "count": len(samples),
+                "p50": samples[int(round(0.50 * last))],
+                "p95": samples[int(round(0.95 * last))],
+                "max": samples[-1],
+            }
+        return result
+    
+    @classmethod
+    def reset(cls):
+        """Clear all recorded metrics"""
+        with cls._lock:
+            cls._timings.clear()
+            cls._histograms.clear()
+            cls._counters.clear()
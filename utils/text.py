@@ -0,0 +1,119 @@
+"""
+Text Utilities
+Helpers for turning streamed LLM tokens into speakable text
+"""
+import re
+from typing import List
+
+
+class SentenceSplitter:
+    """Incrementally splits a token stream into complete sentences"""
+    
+    # Sentence end: terminal punctuation, optional closing quotes/brackets, then whitespace
+    _BOUNDARY = re.compile(r'[.!?]+["\')\]]*\s+')
+    
+    # Abbreviations that end with a period but do not end a sentence
+    _ABBREVIATIONS = ("dr.", "mr.", "mrs.", "ms.", "vs.", "e.g.", "i.e.", "etc.", "approx.")
+    
+    def __init__(self, min_length: int = 20):
+        """
+        Initialize sentence splitter
+        
+        Args:
+            min_length: Minimum characters per emitted sentence; shorter
+                sentences are merged with the next one
+        """
+        self.min_length = min_length
+        self._buffer = ""
+    
+    def feed(self, token: str) -> List[str]:
+        """
+        Add streamed text and return any sentences completed by it
+        
+        Args:
+            token: Next chunk of streamed text
+            
+        Returns:
+            List of complete sentences (may be empty)
+        """
+        self._buffer += token
+        sentences = []
+        start = 0
+        
+        for match in self._BOUNDARY.finditer(self._buffer):
+            end = match.end()
+            candidate = self._buffer[start:end].strip()
+            
+            if self._ends_with_abbreviation(candidate):
+                continue
+            if len(candidate) < self.min_length:
+                continue
+            
+            sentences.append(candidate)
+            start = end
+        
+        self._buffer = self._buffer[start:]
+        return sentences
+    
+    def flush(self) -> List[str]:
+        """
+        Return any remaining buffered text as a final sentence
+        
+        Returns:
+            List with the trailing sentence, or empty list
+        """
+        remainder = self._buffer.strip()
+        self._buffer = ""
+        return [remainder] if remainder else []
+    
+    def _ends_with_abbreviation(self, text: str) -> bool:
+        """Check if text ends with a known abbreviation"""
+        lowered = text.lower()
+        return any(lowered.endswith(abbr) for abbr in self._ABBREVIATIONS)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap LLM token estimate (no tokenizer dependency)
+    
+    Args:
+        text: Text to measure
+        
+    Returns:
+        Approximate token count: about 4 characters per token for English
+    """
+    return (len(text) + 3) // 4
+
+
+# Words that rarely end a finished spoken sentence (conjunctions,
+# prepositions, articles, possessives, auxiliaries and fillers)
+_DANGLING_WORDS = frozenset("""
+    and but or so because since although though while when if then also plus
+    with without of to for from in on at by about into after before like than
+    the a an my his her their our your its
+    is are was were has have had been being
+    he she they we i um uh er erm
+""".split())
+
+# Speech engines rarely punctuate, so only a trailing comma/dash/ellipsis counts
+_DANGLING_PUNCTUATION = (",", "-", "—", "...", "…", ":", ";")
+
+
+def looks_incomplete(text: str) -> bool:
+    """
+    Guess whether a recognized fragment stops mid-sentence
+    
+    Args:
+        text: Recognized utterance
+        
+    Returns:
+        True if it ends with a conjunction, preposition, article, filler
+        word or continuation punctuation ("my dog has been", "and, um,")
+    """
+    stripped = text.rstrip()
+    if not stripped:
+        return False
+    if stripped.endswith(_DANGLING_PUNCTUATION):
+        return True
+    last_word = stripped.rsplit(None, 1)[-1].strip(".,!?\"'").lower()
+    return last_word in _DANGLING_WORDS and not stripped.endswith(("?", "!", "."))
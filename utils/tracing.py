@@ -0,0 +1,235 @@
+"""
+Turn Tracing
+Named spans grouped per conversational turn, for latency breakdowns
+"""
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, Iterator, List, Optional, TypeVar
+
+from .metrics import Metrics
+
+T = TypeVar("T")
+
+
+@dataclass
+class Span:
+    """One timed stage (perf_counter timestamps)"""
+    name: str
+    start: float
+    end: float
+    
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class TurnTrace:
+    """Spans recorded during one turn, relative to when it began"""
+    
+    def __init__(self, turn_id: int, label: str = ""):
+        self.turn_id = turn_id
+        self.label = label
+        self.started = time.perf_counter()
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+    
+    def add(self, span: Span):
+        """Attach a span (thread-safe)"""
+        with self._lock:
+            self.spans.append(span)
+    
+    def to_dict(self) -> dict:
+        """JSON-serializable form with offsets in milliseconds from turn start"""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        end = max((s.end for s in spans), default=self.started)
+        return {
+            "turn": self.turn_id,
+            "label": self.label,
+            "duration_ms": round((end - self.started) * 1000, 1),
+            "spans": [
+                {
+                    "name": s.name,
+                    "start_ms": round((s.start - self.started) * 1000, 1),
+                    "duration_ms": round(s.duration * 1000, 1)
+                }
+                for s in spans
+            ]
+        }
+    
+    def waterfall(self, width: int = 40) -> str:
+        """
+        Text waterfall of the turn's spans
+        
+        Args:
+            width: Characters for the full time axis
+            
+        Returns:
+            One line per span, with bars placed on a shared time axis
+        """
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start)
+        if not spans:
+            return f"turn {self.turn_id}: no spans"
+        
+        origin = min(self.started, spans[0].start)
+        total = max(s.end for s in spans) - origin or 1e-9
+        name_width = max(len(s.name) for s in spans)
+        
+        lines = [f"turn {self.turn_id} ({total * 1000:.0f}ms): {self.label[:60]}"]
+        for s in spans:
+            offset = int((s.start - origin) / total * width)
+            length = max(1, int(s.duration / total * width))
+            bar = " " * offset + "█" * min(length, width - offset)
+            lines.append(
+                f"  {s.name:<{name_width}} {(s.start - self.started) * 1000:+7.0f}ms "
+                f"|{bar:<{width}}| {s.duration * 1000:6.0f}ms"
+            )
+        return "\n".join(lines)
+
+
+class Tracer:
+    """
+    Process-wide span recorder
+    
+    Every span is recorded into Metrics (and so into its histogram) and,
+    when a turn is active, attached to that turn's trace. The active turn
+    is tracked per asyncio task (so concurrent server sessions stay apart)
+    with a process-wide fallback for worker threads such as TTS synthesis.
+    Spans recorded before a turn starts (recognition of the utterance that
+    starts it) are held briefly and adopted by the next turn.
+    """
+    
+    recent_limit: int = 20  # Finished turns kept for export
+    pending_window: float = 10.0  # Seconds an early span waits for its turn
+    
+    _lock = threading.Lock()
+    _current: ContextVar[Optional[TurnTrace]] = ContextVar("current_turn", default=None)
+    _active: Optional[TurnTrace] = None
+    _pending: Deque[Span] = deque(maxlen=16)
+    _recent: Deque[TurnTrace] = deque(maxlen=recent_limit)
+    _ids = itertools.count(1)
+    
+    @classmethod
+    def begin_turn(cls, label: str = "") -> TurnTrace:
+        """
+        Start tracing a turn in the current task
+        
+        Args:
+            label: Short description (e.g. the user's utterance)
+            
+        Returns:
+            The new trace
+        """
+        trace = TurnTrace(next(cls._ids), label)
+        cutoff = trace.started - cls.pending_window
+        with cls._lock:
+            for span in cls._pending:
+                if span.end >= cutoff:
+                    trace.add(span)
+            cls._pending.clear()
+            cls._active = trace
+        cls._current.set(trace)
+        return trace
+    
+    @classmethod
+    def end_turn(cls, trace: TurnTrace):
+        """
+        Finish the turn in the current task
+        
+        Worker threads keep attaching to it (e.g. audio still playing)
+        until the next turn begins.
+        """
+        cls._current.set(None)
+        with cls._lock:
+            cls._recent.append(trace)
+    
+    @classmethod
+    def record(cls, name: str, start: float, end: float, next_turn: bool = False):
+        """
+        Record a finished span
+        
+        Args:
+            name: Stage name (also the Metrics timing name)
+            start: perf_counter when the stage started
+            end: perf_counter when it finished
+            next_turn: Hold for the turn that begins next instead of the current one
+        """
+        Metrics.record(name, end - start)
+        span = Span(name, start, end)
+        
+        if next_turn:
+            with cls._lock:
+                cls._pending.append(span)
+            return
+        
+        trace = cls.current()
+        if trace is not None:
+            trace.add(span)
+    
+    @classmethod
+    @contextmanager
+    def span(cls, name: str, next_turn: bool = False) -> Iterator[None]:
+        """
+        Time a block as a span (also around awaits)
+        
+        Args:
+            name: Stage name
+            next_turn: See record()
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            cls.record(name, start, time.perf_counter(), next_turn)
+    
+    @classmethod
+    async def stream(cls, name: str, items: AsyncIterator[T]) -> AsyncIterator[T]:
+        """
+        Pass a stream through, timing it as a span from first pull to the
+        end, plus a `<name>_first_item` span up to the first item
+        
+        Args:
+            name: Stage name
+            items: Stream to wrap
+        """
+        start = time.perf_counter()
+        first = True
+        try:
+            async for item in items:
+                if first:
+                    first = False
+                    cls.record(f"{name}_first_item", start, time.perf_counter())
+                yield item
+        finally:
+            cls.record(name, start, time.perf_counter())
+            # Stopping early must still close the wrapped stream (and its LLM call)
+            aclose = getattr(items, "aclose", None)
+            if aclose is not None:
+                await aclose()
+    
+    @classmethod
+    def current(cls) -> Optional[TurnTrace]:
+        """The turn spans would attach to right now, if any"""
+        return cls._current.get() or cls._active
+    
+    @classmethod
+    def recent(cls) -> List[dict]:
+        """Finished turns, oldest first, as dicts"""
+        with cls._lock:
+            turns = list(cls._recent)
+        return [trace.to_dict() for trace in turns]
+    
+    @classmethod
+    def reset(cls):
+        """Drop all turn state (histograms live in Metrics)"""
+        with cls._lock:
+            cls._active = None
+            cls._pending.clear()
+            cls._recent.clear()
+        cls._current.set(None)